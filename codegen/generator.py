@@ -40,31 +40,27 @@ class CodeGenerator:
         )
         self.env.filters["c_type"] = c_type_filter
 
-    def _resolve_port_interfaces(self, swc: SoftwareComponent, project: Project):
-        """Attach interface objects to ports for template access."""
-        for port in swc.ports:
-            if port.interface_uid:
-                port.interface = project.get_interface_by_uid(port.interface_uid)
-            else:
-                port.interface = None
+    def _resolve_port_interfaces(self, swc: SoftwareComponent, project: Project) -> list[tuple]:
+        """(port, interface or None) pairs for template access."""
+        return [
+            (port, project.get_interface_by_uid(port.interface_uid) if port.interface_uid else None)
+            for port in swc.ports
+        ]
 
     def generate_swc_header(self, swc: SoftwareComponent, project: Project) -> str:
         """Generate SWC header file content."""
-        self._resolve_port_interfaces(swc, project)
         template = self.env.get_template("swc_header.h.j2")
         return template.render(swc=swc)
 
     def generate_swc_source(self, swc: SoftwareComponent, project: Project) -> str:
         """Generate SWC source file content."""
-        self._resolve_port_interfaces(swc, project)
         template = self.env.get_template("swc_source.c.j2")
-        return template.render(swc=swc)
+        return template.render(swc=swc, ports=self._resolve_port_interfaces(swc, project))
 
     def generate_rte_header(self, swc: SoftwareComponent, project: Project) -> str:
         """Generate RTE header for an SWC."""
-        self._resolve_port_interfaces(swc, project)
         template = self.env.get_template("rte_header.h.j2")
-        return template.render(swc=swc)
+        return template.render(swc=swc, ports=self._resolve_port_interfaces(swc, project))
 
     def generate_std_types(self) -> str:
         """Generate Std_Types.h."""
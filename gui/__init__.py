@@ -1,35 +1,44 @@
-from .main_window import MainWindow, main
-from .editors import (
-    WelcomePanel, SwcEditor, InterfaceEditor, PortEditor,
-    RunnableEditor, DataElementEditor, OperationEditor,
-    AppDataTypeEditor, ImplDataTypeEditor, CompuMethodEditor,
-    ConnectionEditor
-)
-from .dialogs import ConnectionDialog
-from .composition_view import (
-    CompositionWidget, CompositionView, CompositionScene,
-    SwcGraphicsItem, PortGraphicsItem, ConnectionGraphicsItem
-)
+import importlib
 
-__all__ = [
-    "MainWindow",
-    "main",
-    "WelcomePanel",
-    "SwcEditor",
-    "InterfaceEditor",
-    "PortEditor",
-    "RunnableEditor",
-    "DataElementEditor",
-    "OperationEditor",
-    "AppDataTypeEditor",
-    "ImplDataTypeEditor",
-    "CompuMethodEditor",
-    "ConnectionEditor",
-    "ConnectionDialog",
-    "CompositionWidget",
-    "CompositionView",
-    "CompositionScene",
-    "SwcGraphicsItem",
-    "PortGraphicsItem",
-    "ConnectionGraphicsItem",
-]
+# Public names -> defining submodule; imported on first access so that
+# "from gui import main" loads no more of the GUI than main() needs
+_EXPORTS = {
+    "MainWindow": "main_window",
+    "main": "main_window",
+    "WelcomePanel": "editors",
+    "SwcEditor": "editors",
+    "InterfaceEditor": "editors",
+    "PortEditor": "editors",
+    "RunnableEditor": "editors",
+    "DataElementEditor": "editors",
+    "OperationEditor": "editors",
+    "AppDataTypeEditor": "editors",
+    "ImplDataTypeEditor": "editors",
+    "CompuMethodEditor": "editors",
+    "ConnectionEditor": "editors",
+    "ConnectionDialog": "dialogs",
+    "ProjectIOWorker": "workers",
+    "CodeGenWorker": "workers",
+    "CompositionWidget": "composition_view",
+    "CompositionView": "composition_view",
+    "CompositionScene": "composition_view",
+    "SwcGraphicsItem": "composition_view",
+    "PortGraphicsItem": "composition_view",
+    "ConnectionGraphicsItem": "composition_view",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -260,12 +260,14 @@ class ConnectionGraphicsItem(QGraphicsPathItem):
         self.default_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
         self.setPen(self.default_pen)
         
-        # Tooltip
-        iface_name = interface.name if interface else "Unknown"
-        self.setToolTip(f"{connection.name}\nInterface: {iface_name}")
-        
+        self.update_tooltip()
         self.update_path()
 
+    def update_tooltip(self):
+        """Update the tooltip from the connection's name."""
+        iface_name = self.interface.name if self.interface else "Unknown"
+        self.setToolTip(f"{self.connection.name}\nInterface: {iface_name}")
+
     def update_path(self):
         """Update the connection path based on port positions."""
         start = self.provider_port_item.get_connection_point()
@@ -378,6 +380,55 @@ class CompositionScene(QGraphicsScene):
         self.addItem(conn_item)
         self.connection_items.append(conn_item)
 
+    def update_item(self, obj) -> bool:
+        """Update the scene items showing obj in place.
+
+        Returns False when the change needs a full load_project, e.g. an
+        interface edit, which recolors connections across the diagram.
+        """
+        if self.project is None:
+            return False
+        if isinstance(obj, SoftwareComponent):
+            return self._rebuild_swc(obj.uid)
+        if isinstance(obj, Port):
+            for swc_uid, swc_item in self.swc_items.items():
+                if obj.uid in swc_item.port_items:
+                    return self._rebuild_swc(swc_uid)
+            return False
+        if isinstance(obj, PortConnection):
+            for conn_item in self.connection_items:
+                if conn_item.connection is obj:
+                    conn_item.update_tooltip()
+                    return True
+            return False
+        # Data types, runnables, data elements and operations are not drawn
+        return not isinstance(obj, Interface)
+
+    def _rebuild_swc(self, swc_uid: str) -> bool:
+        """Recreate one SWC item at its current position, with its connections."""
+        old_item = self.swc_items.get(swc_uid)
+        if old_item is None:
+            return False
+        swc_item = SwcGraphicsItem(old_item.swc, self.project, old_item.module_name)
+        swc_item.setPos(old_item.pos())
+        self.removeItem(old_item)
+        self.addItem(swc_item)
+        self.swc_items[swc_uid] = swc_item
+        
+        # Attached connections point at the old port items; recreate them
+        kept, attached = [], []
+        for conn_item in self.connection_items:
+            conn = conn_item.connection
+            if swc_uid in (conn.provider_swc_uid, conn.requester_swc_uid):
+                attached.append(conn_item)
+            else:
+                kept.append(conn_item)
+        self.connection_items = kept
+        for conn_item in attached:
+            self.removeItem(conn_item)
+            self._create_connection(conn_item.connection)
+        return True
+
     def update_connections(self):
         """Update all connection paths (called when SWCs move)."""
         for conn_item in self.connection_items:
@@ -457,6 +508,10 @@ class CompositionView(QGraphicsView):
         self.composition_scene.load_project(project, module_info)
         self.fit_in_view()
 
+    def update_item(self, obj) -> bool:
+        """Update the items showing obj; False if a full reload is needed."""
+        return self.composition_scene.update_item(obj)
+
     def fit_in_view(self):
         """Fit the entire diagram in the view."""
         self.fitInView(self.composition_scene.sceneRect(), 
@@ -581,6 +636,10 @@ class CompositionWidget(QWidget):
         """Load a project into the composition view."""
         self.view.load_project(project, module_info)
 
+    def update_item(self, obj) -> bool:
+        """Update the items showing obj; False if a full reload is needed."""
+        return self.view.update_item(obj)
+
     def _fit_view(self):
         self.view.fit_in_view()
 
@@ -5,7 +5,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel,
     QLineEdit, QComboBox, QPushButton, QGroupBox, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker
 
 from model import (
     Project, SoftwareComponent, Port, PortDirection, PortConnection
@@ -189,29 +189,35 @@ class ConnectionDialog(QDialog):
 
     def _populate_provider_swcs(self):
         """Populate provider SWC combo with components that have provided ports."""
-        self.provider_swc_combo.clear()
-        self.provider_swc_combo.addItem("(Select component)", None)
+        # Rebuild silently, then cascade to the dependent combos once
+        with QSignalBlocker(self.provider_swc_combo):
+            self.provider_swc_combo.clear()
+            self.provider_swc_combo.addItem("(Select component)", None)
+            
+            provided = PortDirection.PROVIDED
+            for swc in self.project.components:
+                # Only show SWCs that have provided ports
+                if any(p.direction is provided for p in swc.ports):
+                    self.provider_swc_combo.addItem(swc.name, swc)
         
-        for swc in self.project.components:
-            # Only show SWCs that have provided ports
-            provided_ports = [p for p in swc.ports if p.direction == PortDirection.PROVIDED]
-            if provided_ports:
-                self.provider_swc_combo.addItem(swc.name, swc)
+        self._on_provider_swc_changed(self.provider_swc_combo.currentIndex())
 
     def _on_provider_swc_changed(self, index):
         """Update provider port combo when SWC changes."""
-        self.provider_port_combo.clear()
-        self.provider_port_combo.addItem("(Select port)", None)
+        with QSignalBlocker(self.provider_port_combo):
+            self.provider_port_combo.clear()
+            self.provider_port_combo.addItem("(Select port)", None)
+            
+            swc = self.provider_swc_combo.currentData()
+            if swc:
+                provided = PortDirection.PROVIDED
+                for port in swc.ports:
+                    if port.direction is provided and port.interface_uid:
+                        iface = self.project.get_interface_by_uid(port.interface_uid)
+                        iface_name = iface.name if iface else "?"
+                        self.provider_port_combo.addItem(f"{port.name} [{iface_name}]", port)
         
-        swc = self.provider_swc_combo.currentData()
-        if swc:
-            for port in swc.ports:
-                if port.direction == PortDirection.PROVIDED and port.interface_uid:
-                    iface = self.project.get_interface_by_uid(port.interface_uid)
-                    iface_name = iface.name if iface else "?"
-                    self.provider_port_combo.addItem(f"{port.name} [{iface_name}]", port)
-        
-        self._update_requester_options()
+        self._on_provider_port_changed(self.provider_port_combo.currentIndex())
 
     def _on_provider_port_changed(self, index):
         """Update requester options when provider port changes."""
@@ -221,22 +227,20 @@ class ConnectionDialog(QDialog):
 
     def _update_requester_options(self):
         """Update requester combos based on selected provider port."""
-        self.requester_swc_combo.clear()
-        self.requester_swc_combo.addItem("(Select component)", None)
-        
-        provider_port = self.provider_port_combo.currentData()
-        if not provider_port or not provider_port.interface_uid:
-            return
+        with QSignalBlocker(self.requester_swc_combo):
+            self.requester_swc_combo.clear()
+            self.requester_swc_combo.addItem("(Select component)", None)
+            
+            provider_port = self.provider_port_combo.currentData()
+            if provider_port and provider_port.interface_uid:
+                # Find all SWCs with required ports matching the interface
+                listed = set()
+                for swc, _port in self.project.iter_compatible_ports(provider_port):
+                    if swc.uid not in listed:
+                        listed.add(swc.uid)
+                        self.requester_swc_combo.addItem(swc.name, swc)
         
-        # Find all SWCs with required ports matching the interface
-        for swc in self.project.components:
-            matching_ports = [
-                p for p in swc.ports 
-                if p.direction == PortDirection.REQUIRED and 
-                   p.interface_uid == provider_port.interface_uid
-            ]
-            if matching_ports:
-                self.requester_swc_combo.addItem(swc.name, swc)
+        self._on_requester_swc_changed(self.requester_swc_combo.currentIndex())
 
     def _on_requester_swc_changed(self, index):
         """Update requester port combo when SWC changes."""
@@ -247,9 +251,10 @@ class ConnectionDialog(QDialog):
         provider_port = self.provider_port_combo.currentData()
         
         if swc and provider_port:
+            required = PortDirection.REQUIRED
+            iface_uid = provider_port.interface_uid
             for port in swc.ports:
-                if (port.direction == PortDirection.REQUIRED and 
-                    port.interface_uid == provider_port.interface_uid):
+                if port.direction is required and port.interface_uid == iface_uid:
                     self.requester_port_combo.addItem(port.name, port)
         
         self._validate()
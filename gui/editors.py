@@ -1,13 +1,20 @@
 """
 Property editors for project elements.
 """
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Optional
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel,
     QLineEdit, QTextEdit, QSpinBox, QComboBox, QPushButton,
     QGroupBox, QFrame, QScrollArea, QSizePolicy, QDoubleSpinBox,
-    QListWidget
+    QListView, QStackedWidget
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractListModel, QModelIndex, QTimer, QSignalBlocker
 )
-from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from model import (
@@ -19,77 +26,173 @@ from model import (
 )
 
 
+_EDITOR_STYLE_PATH = Path(__file__).with_name("editor.qss")
+
+# Typing and spin-box edits emit `changed` once after this much idle time
+CHANGE_DEBOUNCE_MS = 150
+
+# Argument direction -> arrow shown in the operation's argument list
+_DIR_ARROW = {
+    ArgumentDirection.IN: "→",
+    ArgumentDirection.OUT: "←",
+    ArgumentDirection.INOUT: "↔",
+}
+
+# (member, label) pairs for enum combos, computed once per process
+_BASE_TYPE_LABELS = [(dt, dt.value) for dt in BaseDataType]
+_APP_CAT_LABELS = [(cat, cat.value.title()) for cat in AppDataCategory]
+_BASE_TYPE_TEXT = dict(_BASE_TYPE_LABELS)
+
+# Enum member -> combo row, for combos populated in enum order
+_BASE_TYPE_INDEX = {dt: i for i, dt in enumerate(BaseDataType)}
+_APP_CATEGORY_INDEX = {cat: i for i, cat in enumerate(AppDataCategory)}
+_ARG_DIR_INDEX = {d: i for i, d in enumerate(ArgumentDirection)}
+
+
+@lru_cache(maxsize=None)
+def load_editor_style() -> str:
+    """Return the shared editor stylesheet, read from disk once per process."""
+    return _EDITOR_STYLE_PATH.read_text(encoding="utf-8")
+
+
+@contextmanager
+def _signals_blocked(*widgets):
+    """Block the widgets' signals while the editor fills them programmatically."""
+    blockers = [QSignalBlocker(w) for w in widgets]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+# Setters that skip the Qt call when the widget already shows the value,
+# so re-populating an editor does not re-layout or repaint unchanged fields
+
+def _set_text(widget, text: str):
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def _set_style_flag(widget: QWidget, name: str, value: bool):
+    """Set a property that editor.qss selects on, repolishing only on change."""
+    if widget.property(name) != value:
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+
+def _set_plain_text(widget: QTextEdit, text: str):
+    if widget.toPlainText() != text:
+        widget.setPlainText(text)
+
+
+def _set_index(combo: QComboBox, index: int):
+    if combo.currentIndex() != index:
+        combo.setCurrentIndex(index)
+
+
+def _set_value(spin, value):
+    if spin.value() != value:
+        spin.setValue(value)
+
+
+# Widget readers used by EditorStyleMixin.bind
+
+def _text(widget) -> str:
+    return widget.text()
+
+
+def _plain_text(widget: QTextEdit) -> str:
+    return widget.toPlainText()
+
+
+def _value(spin):
+    return spin.value()
+
+
+def _make_change_timer(editor: QWidget) -> QTimer:
+    """Single-shot timer that coalesces a burst of edits into one changed signal."""
+    timer = QTimer(editor)
+    timer.setSingleShot(True)
+    timer.setInterval(CHANGE_DEBOUNCE_MS)
+    timer.timeout.connect(editor._emit_change)
+    return timer
+
+
 class EditorStyleMixin:
-    """Common styling for editors."""
+    """Common styling and change signalling for editors.
 
-    EDITOR_STYLE = """
-        QWidget {
-            background-color: #1e1e1e;
-            color: #d4d4d4;
-        }
-        QLabel {
-            color: #9cdcfe;
-            font-weight: bold;
-        }
-        QLineEdit, QTextEdit, QSpinBox, QComboBox {
-            background-color: #3c3c3c;
-            color: #d4d4d4;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            padding: 5px;
-        }
-        QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, QComboBox:focus {
-            border: 1px solid #007acc;
-        }
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #454545;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-            color: #569cd6;
-        }
-        QPushButton {
-            background-color: #0e639c;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 4px;
-        }
-        QPushButton:hover {
-            background-color: #1177bb;
-        }
-        QPushButton:pressed {
-            background-color: #094771;
-        }
+    The main window applies editor.qss once to its editor stack, so
+    editors hosted there inherit it; widgets that need their own look get
+    an objectName (or a dynamic property) that a rule there selects on.
     """
 
-    def apply_editor_style(self):
-        self.setStyleSheet(self.EDITOR_STYLE)
+    __slots__ = ()
+
+    # Signals are declared with pyqtSignal and connected new-style
+    # (signal.connect(slot)); do not use SIGNAL()/SLOT() string connects,
+    # which resolve the overload by name on every connect.
+
+    # Name of the attribute holding the edited model object; bindings read
+    # from and write to it
+    _bound_attr = ""
+
+    def bind(self, widget, field: str, getter, setter, signal):
+        """Two-way bind a widget to a field of the edited object.
+
+        push_bindings() fills the widget from the field; a user edit reads
+        the widget with getter, writes the field and starts the debounce timer.
+        """
+        binding = (widget, field, getter, setter)
+        self._bindings.append(binding)
+        signal.connect(partial(self._on_bound_edit, binding))
+
+    def push_bindings(self, obj):
+        """Fill every bound widget from obj with the widgets' signals blocked."""
+        bindings = self._bindings
+        with _signals_blocked(*[b[0] for b in bindings]):
+            for widget, field, _getter, setter in bindings:
+                setter(widget, getattr(obj, field))
+
+    def _on_bound_edit(self, binding, *_args):
+        obj = getattr(self, self._bound_attr)
+        if obj:
+            widget, field, getter, _setter = binding
+            setattr(obj, field, getter(widget))
+            self._change_timer.start()
+
+    def flush_pending_change(self):
+        """Emit a debounced change right away, if one is pending."""
+        timer = getattr(self, "_change_timer", None)
+        if timer is not None and timer.isActive():
+            timer.stop()
+            self._emit_change()
+
+    def _emit_change(self):
+        """Signal an edit of the current object (target of the debounce timer)."""
+        self.changed.emit()
 
 
 class WelcomePanel(QWidget, EditorStyleMixin):
     """Welcome panel shown when no item is selected."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
-        self.apply_editor_style()
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         title = QLabel("AUTOSAR Designer")
-        title.setStyleSheet("font-size: 24px; color: #569cd6; font-weight: bold;")
+        title.setObjectName("welcomeTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         subtitle = QLabel("Select an item from the tree to edit its properties")
-        subtitle.setStyleSheet("font-size: 14px; color: #808080;")
+        subtitle.setObjectName("welcomeSubtitle")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
 
@@ -101,7 +204,7 @@ class WelcomePanel(QWidget, EditorStyleMixin):
             "• Press F5 to generate code\n"
             "• Load the example project to see a complete setup"
         )
-        tips.setStyleSheet("font-size: 12px; color: #6a9955;")
+        tips.setObjectName("welcomeTips")
         tips.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(tips)
 
@@ -110,12 +213,17 @@ class SwcEditor(QWidget, EditorStyleMixin):
     """Editor for Software Components."""
     
     changed = pyqtSignal()
+    _bound_attr = "swc"
+    __slots__ = (
+        'swc', '_change_timer', '_bindings', 'name_edit', 'desc_edit', 'uid_label',
+        'ports_count', 'runnables_count',
+    )
 
     def __init__(self):
         super().__init__()
         self.swc: SoftwareComponent = None
-        self._updating = False
-        self.apply_editor_style()
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -124,7 +232,7 @@ class SwcEditor(QWidget, EditorStyleMixin):
 
         # Header
         header = QLabel("Software Component")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         # Form
@@ -132,16 +240,16 @@ class SwcEditor(QWidget, EditorStyleMixin):
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(100)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         self.uid_label = QLabel()
-        self.uid_label.setStyleSheet("color: #808080;")
+        self.uid_label.setObjectName("uidLabel")
         form.addRow("UID:", self.uid_label)
 
         layout.addLayout(form)
@@ -157,37 +265,31 @@ class SwcEditor(QWidget, EditorStyleMixin):
 
         layout.addStretch()
 
-    def set_swc(self, swc: SoftwareComponent):
-        self._updating = True
+    def set_swc(self, swc: SoftwareComponent, force: bool = False):
+        if self.swc is swc and not force:
+            return
         self.swc = swc
-        self.name_edit.setText(swc.name)
-        self.desc_edit.setPlainText(swc.description)
-        self.uid_label.setText(swc.uid)
-        self.ports_count.setText(str(len(swc.ports)))
-        self.runnables_count.setText(str(len(swc.runnables)))
-        self._updating = False
-
-    def _on_name_changed(self, text):
-        if not self._updating and self.swc:
-            self.swc.name = text
-            self.changed.emit()
-
-    def _on_desc_changed(self):
-        if not self._updating and self.swc:
-            self.swc.description = self.desc_edit.toPlainText()
-            self.changed.emit()
+        self.push_bindings(swc)
+        _set_text(self.uid_label, swc.uid)
+        _set_text(self.ports_count, str(len(swc.ports)))
+        _set_text(self.runnables_count, str(len(swc.runnables)))
 
 
 class InterfaceEditor(QWidget, EditorStyleMixin):
     """Editor for Interfaces."""
     
     changed = pyqtSignal()
+    _bound_attr = "interface"
+    __slots__ = (
+        'interface', '_change_timer', '_bindings', 'name_edit', 'type_combo',
+        'desc_edit', 'uid_label',
+    )
 
     def __init__(self):
         super().__init__()
         self.interface: Interface = None
-        self._updating = False
-        self.apply_editor_style()
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -195,14 +297,14 @@ class InterfaceEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("Interface")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.type_combo = QComboBox()
@@ -213,39 +315,29 @@ class InterfaceEditor(QWidget, EditorStyleMixin):
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(100)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         self.uid_label = QLabel()
-        self.uid_label.setStyleSheet("color: #808080;")
+        self.uid_label.setObjectName("uidLabel")
         form.addRow("UID:", self.uid_label)
 
         layout.addLayout(form)
         layout.addStretch()
 
-    def set_interface(self, interface: Interface):
-        self._updating = True
-        self.interface = interface
-        self.name_edit.setText(interface.name)
-        self.desc_edit.setPlainText(interface.description)
-        self.uid_label.setText(interface.uid)
-        
-        idx = 0 if interface.interface_type == InterfaceType.SENDER_RECEIVER else 1
-        self.type_combo.setCurrentIndex(idx)
-        self._updating = False
-
-    def _on_name_changed(self, text):
-        if not self._updating and self.interface:
-            self.interface.name = text
-            self.changed.emit()
+    def set_interface(self, interface: Interface, force: bool = False):
+        if self.interface is interface and not force:
+            return
+        with _signals_blocked(self.type_combo):
+            self.interface = interface
+            self.push_bindings(interface)
+            _set_text(self.uid_label, interface.uid)
 
-    def _on_desc_changed(self):
-        if not self._updating and self.interface:
-            self.interface.description = self.desc_edit.toPlainText()
-            self.changed.emit()
+            idx = 0 if interface.interface_type == InterfaceType.SENDER_RECEIVER else 1
+            _set_index(self.type_combo, idx)
 
     def _on_type_changed(self, index):
-        if not self._updating and self.interface:
+        if self.interface:
             self.interface.interface_type = self.type_combo.currentData()
             self.changed.emit()
 
@@ -254,13 +346,18 @@ class PortEditor(QWidget, EditorStyleMixin):
     """Editor for Ports."""
     
     changed = pyqtSignal()
+    _bound_attr = "port"
+    __slots__ = (
+        'port', '_change_timer', '_bindings', '_interfaces', 'name_edit', 'dir_combo',
+        'iface_combo', 'desc_edit', 'conn_label',
+    )
 
     def __init__(self):
         super().__init__()
         self.port: Port = None
-        self._updating = False
         self._interfaces = []
-        self.apply_editor_style()
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -268,14 +365,14 @@ class PortEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("Port")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.dir_combo = QComboBox()
@@ -290,7 +387,7 @@ class PortEditor(QWidget, EditorStyleMixin):
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(100)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         layout.addLayout(form)
@@ -299,77 +396,68 @@ class PortEditor(QWidget, EditorStyleMixin):
         conn_group = QGroupBox("Connections")
         conn_layout = QVBoxLayout(conn_group)
         self.conn_label = QLabel("No connections")
-        self.conn_label.setStyleSheet("color: #808080;")
+        # Colored by QLabel#connLabel[connected="true"] in editor.qss
+        self.conn_label.setObjectName("connLabel")
+        self.conn_label.setProperty("connected", False)
         conn_layout.addWidget(self.conn_label)
         layout.addWidget(conn_group)
 
         layout.addStretch()
 
-    def set_port(self, port: Port, interfaces: list, project: Project = None):
-        self._updating = True
-        self.port = port
-        self._interfaces = interfaces
-        
-        self.name_edit.setText(port.name)
-        self.desc_edit.setPlainText(port.description)
-        
-        idx = 0 if port.direction == PortDirection.REQUIRED else 1
-        self.dir_combo.setCurrentIndex(idx)
-        
-        # Populate interface combo
-        self.iface_combo.clear()
-        self.iface_combo.addItem("(None)", None)
-        selected_idx = 0
-        for i, iface in enumerate(interfaces):
-            self.iface_combo.addItem(iface.name, iface.uid)
-            if iface.uid == port.interface_uid:
-                selected_idx = i + 1
-        self.iface_combo.setCurrentIndex(selected_idx)
-        
-        # Show connections
-        if project:
-            connections = project.get_connections_for_port(port.uid)
-            if connections:
-                conn_texts = []
-                for conn in connections:
-                    # Find the other end
-                    if conn.provider_port_uid == port.uid:
-                        other_swc = project.get_component_by_uid(conn.requester_swc_uid)
-                        other_port = other_swc.get_port_by_uid(conn.requester_port_uid) if other_swc else None
-                        direction = "→"
-                    else:
-                        other_swc = project.get_component_by_uid(conn.provider_swc_uid)
-                        other_port = other_swc.get_port_by_uid(conn.provider_port_uid) if other_swc else None
-                        direction = "←"
-                    
-                    if other_swc and other_port:
-                        conn_texts.append(f"🔌 {direction} {other_swc.name}.{other_port.name}")
-                
-                self.conn_label.setText("\n".join(conn_texts))
-                self.conn_label.setStyleSheet("color: #4ec9b0;")
-            else:
-                self.conn_label.setText("No connections")
-                self.conn_label.setStyleSheet("color: #808080;")
-        
-        self._updating = False
-
-    def _on_name_changed(self, text):
-        if not self._updating and self.port:
-            self.port.name = text
-            self.changed.emit()
-
-    def _on_desc_changed(self):
-        if not self._updating and self.port:
-            self.port.description = self.desc_edit.toPlainText()
-            self.changed.emit()
+    def set_port(self, port: Port, interfaces: list, project: Project = None, force: bool = False):
+        if self.port is port and not force:
+            return
+        with _signals_blocked(self.dir_combo, self.iface_combo):
+            self.port = port
+            self._interfaces = interfaces
+
+            self.push_bindings(port)
+
+            idx = 0 if port.direction == PortDirection.REQUIRED else 1
+            _set_index(self.dir_combo, idx)
+
+            # Populate interface combo
+            self.iface_combo.clear()
+            self.iface_combo.addItem("(None)", None)
+            selected_idx = 0
+            for i, iface in enumerate(interfaces):
+                self.iface_combo.addItem(iface.name, iface.uid)
+                if iface.uid == port.interface_uid:
+                    selected_idx = i + 1
+            _set_index(self.iface_combo, selected_idx)
+
+            # Show connections
+            if project:
+                connections = project.get_connections_for_port(port.uid)
+                if connections:
+                    conn_texts = []
+                    for conn in connections:
+                        # Find the other end
+                        if conn.provider_port_uid == port.uid:
+                            other_swc = project.get_component_by_uid(conn.requester_swc_uid)
+                            other_port = other_swc.get_port_by_uid(conn.requester_port_uid) if other_swc else None
+                            direction = "→"
+                        else:
+                            other_swc = project.get_component_by_uid(conn.provider_swc_uid)
+                            other_port = other_swc.get_port_by_uid(conn.provider_port_uid) if other_swc else None
+                            direction = "←"
+
+                        if other_swc and other_port:
+                            conn_texts.append(f"🔌 {direction} {other_swc.name}.{other_port.name}")
+
+                    _set_text(self.conn_label, "\n".join(conn_texts))
+                    _set_style_flag(self.conn_label, "connected", True)
+                else:
+                    _set_text(self.conn_label, "No connections")
+                    _set_style_flag(self.conn_label, "connected", False)
 
     def _on_dir_changed(self, index):
-        if not self._updating and self.port:
+        if self.port:
             self.port.direction = self.dir_combo.currentData()
             self.changed.emit()
 
     def _on_iface_changed(self, index):
-        if not self._updating and self.port:
+        if self.port:
             self.port.interface_uid = self.iface_combo.currentData()
             self.changed.emit()
 
@@ -378,14 +466,23 @@ class RunnableEditor(QWidget, EditorStyleMixin):
     """Editor for Runnables."""
     
     changed = pyqtSignal()
+    _bound_attr = "runnable"
+    # trigger value -> trigger_combo row, which is also its trigger_stack page
+    _TRIGGER_INDEX = {"timing": 0, "operation_invoked": 1, "data_received": 2}
+    __slots__ = (
+        'runnable', 'swc', 'project', '_change_timer', '_bindings', 'name_edit',
+        'trigger_combo', 'trigger_stack', 'period_label', 'period_spin',
+        'operation_label', 'operation_combo', 'data_element_label',
+        'data_element_combo', 'desc_edit', 'tip_label',
+    )
 
     def __init__(self):
         super().__init__()
         self.runnable: Runnable = None
         self.swc: SoftwareComponent = None
         self.project: Project = None
-        self._updating = False
-        self.apply_editor_style()
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -393,14 +490,14 @@ class RunnableEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("Runnable")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         # Trigger type
@@ -411,37 +508,42 @@ class RunnableEditor(QWidget, EditorStyleMixin):
         self.trigger_combo.currentIndexChanged.connect(self._on_trigger_changed)
         form.addRow("Trigger:", self.trigger_combo)
 
+        # Trigger-specific fields, one stack page per trigger type
+        self.trigger_stack = QStackedWidget()
+
         # Period (for timing trigger)
         self.period_label = QLabel("Period:")
         self.period_spin = QSpinBox()
         self.period_spin.setRange(0, 10000)
         self.period_spin.setSuffix(" ms")
         self.period_spin.setSpecialValueText("Init/Background")
-        self.period_spin.valueChanged.connect(self._on_period_changed)
-        form.addRow(self.period_label, self.period_spin)
+        self.bind(self.period_spin, "period_ms", _value, _set_value, self.period_spin.valueChanged)
+        self._add_trigger_page(self.period_label, self.period_spin)
 
         # Operation trigger (for operation_invoked)
         self.operation_label = QLabel("Server Operation:")
         self.operation_combo = QComboBox()
         self.operation_combo.currentIndexChanged.connect(self._on_operation_trigger_changed)
-        form.addRow(self.operation_label, self.operation_combo)
+        self._add_trigger_page(self.operation_label, self.operation_combo)
 
         # Data element trigger (for data_received)
         self.data_element_label = QLabel("Data Element:")
         self.data_element_combo = QComboBox()
         self.data_element_combo.currentIndexChanged.connect(self._on_data_trigger_changed)
-        form.addRow(self.data_element_label, self.data_element_combo)
+        self._add_trigger_page(self.data_element_label, self.data_element_combo)
+
+        form.addRow(self.trigger_stack)
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(80)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         layout.addLayout(form)
 
         # Tips
         self.tip_label = QLabel()
-        self.tip_label.setStyleSheet("color: #6a9955; padding-top: 10px;")
+        self.tip_label.setObjectName("tipLabel")
         self.tip_label.setWordWrap(True)
         layout.addWidget(self.tip_label)
 
@@ -449,24 +551,17 @@ class RunnableEditor(QWidget, EditorStyleMixin):
         
         self._update_visibility()
 
+    def _add_trigger_page(self, label: QLabel, widget: QWidget):
+        page = QWidget()
+        page_form = QFormLayout(page)
+        page_form.setContentsMargins(0, 0, 0, 0)
+        page_form.addRow(label, widget)
+        self.trigger_stack.addWidget(page)
+
     def _update_visibility(self):
-        """Show/hide fields based on trigger type."""
+        """Show the stack page matching the trigger type."""
         trigger = self.trigger_combo.currentData()
-        
-        # Period only for timing
-        is_timing = trigger == "timing"
-        self.period_spin.setVisible(is_timing)
-        self.period_label.setVisible(is_timing)
-        
-        # Operation combo only for operation_invoked
-        is_operation = trigger == "operation_invoked"
-        self.operation_combo.setVisible(is_operation)
-        self.operation_label.setVisible(is_operation)
-        
-        # Data element combo only for data_received
-        is_data = trigger == "data_received"
-        self.data_element_combo.setVisible(is_data)
-        self.data_element_label.setVisible(is_data)
+        self.trigger_stack.setCurrentIndex(self._TRIGGER_INDEX.get(trigger, 0))
         
         # Update tip
         tips = {
@@ -476,30 +571,26 @@ class RunnableEditor(QWidget, EditorStyleMixin):
         }
         self.tip_label.setText(tips.get(trigger, ""))
 
-    def set_runnable(self, runnable: Runnable, swc: SoftwareComponent = None, project: Project = None):
-        self._updating = True
-        self.runnable = runnable
-        self.swc = swc
-        self.project = project
-        
-        self.name_edit.setText(runnable.name)
-        self.period_spin.setValue(runnable.period_ms)
-        self.desc_edit.setPlainText(runnable.description)
-        
-        # Set trigger type
-        for i in range(self.trigger_combo.count()):
-            if self.trigger_combo.itemData(i) == runnable.trigger.value:
-                self.trigger_combo.setCurrentIndex(i)
-                break
-        
-        # Populate operation combo (server operations from provided C/S ports)
-        self._populate_operations()
-        
-        # Populate data element combo (from required S/R ports)
-        self._populate_data_elements()
-        
-        self._update_visibility()
-        self._updating = False
+    def set_runnable(self, runnable: Runnable, swc: SoftwareComponent = None, project: Project = None, force: bool = False):
+        if self.runnable is runnable and not force:
+            return
+        with _signals_blocked(self.trigger_combo, self.operation_combo, self.data_element_combo):
+            self.runnable = runnable
+            self.swc = swc
+            self.project = project
+
+            self.push_bindings(runnable)
+
+            # Set trigger type
+            _set_index(self.trigger_combo, self._TRIGGER_INDEX[runnable.trigger.value])
+
+            # Populate operation combo (server operations from provided C/S ports)
+            self._populate_operations()
+
+            # Populate data element combo (from required S/R ports)
+            self._populate_data_elements()
+
+            self._update_visibility()
 
     def _populate_operations(self):
         """Populate server operations from provided C/S ports."""
@@ -547,26 +638,16 @@ class RunnableEditor(QWidget, EditorStyleMixin):
                             self.runnable.trigger_data_element_uid == de.uid):
                             self.data_element_combo.setCurrentIndex(self.data_element_combo.count() - 1)
 
-    def _on_name_changed(self, text):
-        if not self._updating and self.runnable:
-            self.runnable.name = text
-            self.changed.emit()
-
     def _on_trigger_changed(self, index):
-        if not self._updating and self.runnable:
+        if self.runnable:
             from model import RunnableTrigger
             trigger_str = self.trigger_combo.currentData()
             self.runnable.trigger = RunnableTrigger(trigger_str)
             self._update_visibility()
             self.changed.emit()
 
-    def _on_period_changed(self, value):
-        if not self._updating and self.runnable:
-            self.runnable.period_ms = value
-            self.changed.emit()
-
     def _on_operation_trigger_changed(self, index):
-        if not self._updating and self.runnable:
+        if self.runnable:
             data = self.operation_combo.currentData()
             if data:
                 self.runnable.trigger_port_uid = data[0]
@@ -577,7 +658,7 @@ class RunnableEditor(QWidget, EditorStyleMixin):
             self.changed.emit()
 
     def _on_data_trigger_changed(self, index):
-        if not self._updating and self.runnable:
+        if self.runnable:
             data = self.data_element_combo.currentData()
             if data:
                 self.runnable.trigger_port_uid = data[0]
@@ -587,23 +668,23 @@ class RunnableEditor(QWidget, EditorStyleMixin):
                 self.runnable.trigger_data_element_uid = None
             self.changed.emit()
 
-    def _on_desc_changed(self):
-        if not self._updating and self.runnable:
-            self.runnable.description = self.desc_edit.toPlainText()
-            self.changed.emit()
-
 
 class DataElementEditor(QWidget, EditorStyleMixin):
     """Editor for Data Elements."""
     
     changed = pyqtSignal()
+    _bound_attr = "data_element"
+    __slots__ = (
+        'data_element', '_app_types', '_change_timer', '_bindings', 'name_edit',
+        'app_type_combo', 'type_combo', 'init_edit', 'desc_edit',
+    )
 
     def __init__(self):
         super().__init__()
         self.data_element: DataElement = None
         self._app_types = []
-        self._updating = False
-        self.apply_editor_style()
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -611,14 +692,14 @@ class DataElementEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("Data Element")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.app_type_combo = QComboBox()
@@ -626,88 +707,137 @@ class DataElementEditor(QWidget, EditorStyleMixin):
         form.addRow("Application Type:", self.app_type_combo)
 
         self.type_combo = QComboBox()
-        for dt in BaseDataType:
-            self.type_combo.addItem(dt.value, dt)
+        for dt, label in _BASE_TYPE_LABELS:
+            self.type_combo.addItem(label, dt)
         self.type_combo.currentIndexChanged.connect(self._on_type_changed)
         form.addRow("Base Type (fallback):", self.type_combo)
 
         self.init_edit = QLineEdit()
-        self.init_edit.textChanged.connect(self._on_init_changed)
+        self.bind(self.init_edit, "init_value", _text, _set_text, self.init_edit.textChanged)
         form.addRow("Init Value:", self.init_edit)
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(100)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         layout.addLayout(form)
         layout.addStretch()
 
-    def set_data_element(self, de: DataElement, app_types: list = None):
-        self._updating = True
-        self.data_element = de
-        self._app_types = app_types or []
-        
-        self.name_edit.setText(de.name)
-        self.init_edit.setText(de.init_value)
-        self.desc_edit.setPlainText(de.description)
-        
-        # Populate app type combo
-        self.app_type_combo.clear()
-        self.app_type_combo.addItem("(None - use base type)", None)
-        selected_idx = 0
-        for i, adt in enumerate(self._app_types):
-            self.app_type_combo.addItem(adt.name, adt.uid)
-            if adt.uid == de.app_type_uid:
-                selected_idx = i + 1
-        self.app_type_combo.setCurrentIndex(selected_idx)
-        
-        # Base type
-        for i in range(self.type_combo.count()):
-            if self.type_combo.itemData(i) == de.base_type:
-                self.type_combo.setCurrentIndex(i)
-                break
-        
-        self._updating = False
+    def set_data_element(self, de: DataElement, app_types: list = None, force: bool = False):
+        if self.data_element is de and not force:
+            return
+        with _signals_blocked(self.app_type_combo, self.type_combo):
+            self.data_element = de
+            self._app_types = app_types or []
 
-    def _on_name_changed(self, text):
-        if not self._updating and self.data_element:
-            self.data_element.name = text
-            self.changed.emit()
+            self.push_bindings(de)
+
+            # Populate app type combo
+            self.app_type_combo.clear()
+            self.app_type_combo.addItem("(None - use base type)", None)
+            selected_idx = 0
+            for i, adt in enumerate(self._app_types):
+                self.app_type_combo.addItem(adt.name, adt.uid)
+                if adt.uid == de.app_type_uid:
+                    selected_idx = i + 1
+            _set_index(self.app_type_combo, selected_idx)
+
+            # Base type
+            _set_index(self.type_combo, _BASE_TYPE_INDEX[de.base_type])
 
     def _on_app_type_changed(self, index):
-        if not self._updating and self.data_element:
+        if self.data_element:
             self.data_element.app_type_uid = self.app_type_combo.currentData()
             self.changed.emit()
 
     def _on_type_changed(self, index):
-        if not self._updating and self.data_element:
+        if self.data_element:
             self.data_element.base_type = self.type_combo.currentData()
             self.changed.emit()
 
-    def _on_init_changed(self, text):
-        if not self._updating and self.data_element:
-            self.data_element.init_value = text
-            self.changed.emit()
 
-    def _on_desc_changed(self):
-        if not self._updating and self.data_element:
-            self.data_element.description = self.desc_edit.toPlainText()
-            self.changed.emit()
+def _format_arg_label(arg: OperationArgument) -> str:
+    """Display text for an argument row, e.g. '→ dataId: uint16'."""
+    # Enum-keyed tables avoid the .value descriptor lookups on every repaint
+    return f"{_DIR_ARROW[arg.direction]} {arg.name}: {_BASE_TYPE_TEXT[arg.base_type]}"
+
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+
+class ArgumentListModel(QAbstractListModel):
+    """List model exposing an operation's arguments without per-row items."""
+
+    __slots__ = ('_arguments',)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._arguments: list = []
+
+    def set_arguments(self, arguments: list):
+        """Point the model at an argument list (shared, not copied)."""
+        self.beginResetModel()
+        self._arguments = arguments
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._arguments)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        # Views query every role per row on each paint; reject the others
+        # before touching the index
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        return _format_arg_label(self._arguments[index.row()])
+
+    def insert_argument(self, row: int, arg: OperationArgument):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._arguments.insert(row, arg)
+        self.endInsertRows()
+
+    def remove_argument(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._arguments[row]
+        self.endRemoveRows()
+
+    def move_argument(self, row: int, new_row: int):
+        """Move one argument to new_row, keeping view selection attached to it."""
+        # Qt expects the destination as the row *before which* to insert
+        dest = new_row + 1 if new_row > row else new_row
+        if not self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), dest):
+            return
+        self._arguments.insert(new_row, self._arguments.pop(row))
+        self.endMoveRows()
+
+    def refresh_row(self, row: int):
+        """Notify views that the argument at row was edited."""
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
 
 
 class OperationEditor(QWidget, EditorStyleMixin):
     """Editor for Operations with argument management."""
     
     changed = pyqtSignal()
+    # Argument edits: mark the project modified without touching the tree
+    modified_no_tree = pyqtSignal()
+    _bound_attr = "operation"
+    __slots__ = (
+        'operation', '_app_types', '_change_timer', '_bindings', 'name_edit',
+        'return_combo', 'desc_edit', 'args_model', 'args_list', 'add_arg_btn',
+        'remove_arg_btn', 'move_up_btn', 'move_down_btn', '_args_layout',
+        'arg_editor_widget', 'arg_name_edit', 'arg_type_combo', 'arg_dir_combo',
+    )
 
     def __init__(self):
         super().__init__()
         self.operation: Operation = None
         self._app_types = []
-        self._updating = False
-        self._skip_tree_refresh = False  # Flag to skip tree refresh for arg changes
-        self.apply_editor_style()
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -715,64 +845,41 @@ class OperationEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("Operation")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.return_combo = QComboBox()
-        for dt in BaseDataType:
-            self.return_combo.addItem(dt.value, dt)
+        for dt, label in _BASE_TYPE_LABELS:
+            self.return_combo.addItem(label, dt)
         self.return_combo.currentIndexChanged.connect(self._on_return_changed)
         form.addRow("Return Type:", self.return_combo)
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(80)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         layout.addLayout(form)
 
         # Arguments section
         args_group = QGroupBox("Arguments")
-        args_group.setStyleSheet("""
-            QGroupBox {
-                color: #d4d4d4;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        args_group.setObjectName("argsGroup")
         args_layout = QVBoxLayout(args_group)
         
         # Arguments list
-        self.args_list = QListWidget()
+        self.args_model = ArgumentListModel(self)
+        self.args_list = QListView()
+        self.args_list.setModel(self.args_model)
         self.args_list.setMaximumHeight(150)
-        self.args_list.setStyleSheet("""
-            QListWidget {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: 1px solid #3e3e42;
-            }
-            QListWidget::item {
-                padding: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #094771;
-            }
-        """)
-        self.args_list.currentRowChanged.connect(self._on_arg_selected)
+        self.args_list.setObjectName("argsList")
+        self.args_list.selectionModel().currentRowChanged.connect(self._on_arg_selected)
         args_layout.addWidget(self.args_list)
         
         # Argument buttons
@@ -786,23 +893,9 @@ class OperationEditor(QWidget, EditorStyleMixin):
         self.move_down_btn = QPushButton("↓ Down")
         self.move_down_btn.clicked.connect(self._move_arg_down)
         
+        # Styled by the QPushButton#argToolBtn rule in editor.qss
         for btn in [self.add_arg_btn, self.remove_arg_btn, self.move_up_btn, self.move_down_btn]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3e3e42;
-                    color: #d4d4d4;
-                    border: none;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #4a4a4a;
-                }
-                QPushButton:disabled {
-                    background-color: #2d2d30;
-                    color: #6d6d6d;
-                }
-            """)
+            btn.setObjectName("argToolBtn")
         
         btn_layout.addWidget(self.add_arg_btn)
         btn_layout.addWidget(self.remove_arg_btn)
@@ -811,7 +904,22 @@ class OperationEditor(QWidget, EditorStyleMixin):
         btn_layout.addStretch()
         args_layout.addLayout(btn_layout)
         
-        # Argument editor (shown when an argument is selected)
+        # Argument editor (shown when an argument is selected), built on first use
+        self._args_layout = args_layout
+        self.arg_editor_widget = None
+        self.arg_name_edit = None
+        self.arg_type_combo = None
+        self.arg_dir_combo = None
+        
+        layout.addWidget(args_group)
+        layout.addStretch()
+        
+        self._update_button_states()
+
+    def _ensure_arg_editor(self):
+        """Build the per-argument editor the first time an argument is selected."""
+        if self.arg_editor_widget is not None:
+            return
         self.arg_editor_widget = QWidget()
         arg_form = QFormLayout(self.arg_editor_widget)
         arg_form.setContentsMargins(0, 10, 0, 0)
@@ -821,98 +929,96 @@ class OperationEditor(QWidget, EditorStyleMixin):
         arg_form.addRow("Arg Name:", self.arg_name_edit)
         
         self.arg_type_combo = QComboBox()
-        for dt in BaseDataType:
-            self.arg_type_combo.addItem(dt.value, dt)
+        for dt, label in _BASE_TYPE_LABELS:
+            self.arg_type_combo.addItem(label, dt)
         self.arg_type_combo.currentIndexChanged.connect(self._on_arg_type_changed)
         arg_form.addRow("Arg Type:", self.arg_type_combo)
         
         self.arg_dir_combo = QComboBox()
-        self.arg_dir_combo.addItem("IN", ArgumentDirection.IN)
-        self.arg_dir_combo.addItem("OUT", ArgumentDirection.OUT)
-        self.arg_dir_combo.addItem("INOUT", ArgumentDirection.INOUT)
+        for direction in _ARG_DIR_INDEX:
+            self.arg_dir_combo.addItem(direction.name, direction)
         self.arg_dir_combo.currentIndexChanged.connect(self._on_arg_dir_changed)
         arg_form.addRow("Direction:", self.arg_dir_combo)
         
-        self.arg_editor_widget.setVisible(False)
-        args_layout.addWidget(self.arg_editor_widget)
-        
-        layout.addWidget(args_group)
-        layout.addStretch()
-        
-        self._update_button_states()
+        self._args_layout.addWidget(self.arg_editor_widget)
 
-    def set_operation(self, op: Operation, app_types: list = None):
-        self._updating = True
-        self.operation = op
-        self._app_types = app_types or []
-        
-        self.name_edit.setText(op.name)
-        self.desc_edit.setPlainText(op.description)
-        
-        for i in range(self.return_combo.count()):
-            if self.return_combo.itemData(i) == op.return_base_type:
-                self.return_combo.setCurrentIndex(i)
-                break
-        
-        # Update arguments list
-        self._refresh_args_list()
-        
-        self._updating = False
+    def _hide_arg_editor(self):
+        if self.arg_editor_widget is not None:
+            self.arg_editor_widget.setVisible(False)
+
+    def set_operation(self, op: Operation, app_types: list = None, force: bool = False):
+        if self.operation is op and not force:
+            return
+        with _signals_blocked(self.return_combo):
+            self.operation = op
+            self._app_types = app_types or []
+
+            self.push_bindings(op)
+
+            _set_index(self.return_combo, _BASE_TYPE_INDEX[op.return_base_type])
+
+        # Point the model at the new argument list; one repaint for the reset
+        current_row = self._current_arg_row()
+        view = self.args_list
+        view.setUpdatesEnabled(False)
+        view.blockSignals(True)
+        try:
+            self.args_model.set_arguments(op.arguments)
+        finally:
+            view.blockSignals(False)
+            view.setUpdatesEnabled(True)
+        count = len(op.arguments)
 
-    def _refresh_args_list(self):
-        """Refresh the arguments list widget."""
-        self._updating = True
-        current_row = self.args_list.currentRow()
-        self.args_list.clear()
-        
-        if self.operation:
-            for arg in self.operation.arguments:
-                dir_str = {"in": "→", "out": "←", "inout": "↔"}[arg.direction.value]
-                self.args_list.addItem(f"{dir_str} {arg.name}: {arg.base_type.value}")
-        
         # Restore selection
-        if current_row >= 0 and current_row < self.args_list.count():
-            self.args_list.setCurrentRow(current_row)
-        elif self.args_list.count() > 0:
-            self.args_list.setCurrentRow(0)
+        if 0 <= current_row < count:
+            self._set_current_arg_row(current_row)
+        elif count > 0:
+            self._set_current_arg_row(0)
         else:
-            self.arg_editor_widget.setVisible(False)
-        
+            self._hide_arg_editor()
+
         self._update_button_states()
-        self._updating = False
+
+    def _current_arg_row(self) -> int:
+        return self.args_list.currentIndex().row()
+
+    def _current_arg(self) -> tuple[int, Optional[OperationArgument]]:
+        """Return (row, argument) for the selected argument, or (-1, None)."""
+        op = self.operation
+        row = self._current_arg_row()
+        if op is None or not 0 <= row < len(op.arguments):
+            return -1, None
+        return row, op.arguments[row]
+
+    def _set_current_arg_row(self, row: int):
+        self.args_list.setCurrentIndex(self.args_model.index(row))
 
     def _update_button_states(self):
         """Update button enabled states based on selection."""
-        has_selection = self.args_list.currentRow() >= 0
-        count = self.args_list.count()
-        current = self.args_list.currentRow()
+        current = self._current_arg_row()
+        has_selection = current >= 0
+        count = self.args_model.rowCount()
         
         self.remove_arg_btn.setEnabled(has_selection)
         self.move_up_btn.setEnabled(has_selection and current > 0)
         self.move_down_btn.setEnabled(has_selection and current < count - 1)
 
-    def _on_arg_selected(self, row):
+    def _on_arg_selected(self, current, previous=None):
         """Handle argument selection change."""
+        row = current.row()
         if row >= 0 and self.operation and row < len(self.operation.arguments):
             arg = self.operation.arguments[row]
-            self._updating = True
-            
-            self.arg_name_edit.setText(arg.name)
-            
-            for i in range(self.arg_type_combo.count()):
-                if self.arg_type_combo.itemData(i) == arg.base_type:
-                    self.arg_type_combo.setCurrentIndex(i)
-                    break
-            
-            for i in range(self.arg_dir_combo.count()):
-                if self.arg_dir_combo.itemData(i) == arg.direction:
-                    self.arg_dir_combo.setCurrentIndex(i)
-                    break
-            
-            self.arg_editor_widget.setVisible(True)
-            self._updating = False
+            self._ensure_arg_editor()
+            with _signals_blocked(self.arg_name_edit, self.arg_type_combo, self.arg_dir_combo):
+                _set_text(self.arg_name_edit, arg.name)
+
+                _set_index(self.arg_type_combo, _BASE_TYPE_INDEX[arg.base_type])
+
+                _set_index(self.arg_dir_combo, _ARG_DIR_INDEX[arg.direction])
+
+                self.arg_editor_widget.setVisible(True)
         else:
-            self.arg_editor_widget.setVisible(False)
+            self._hide_arg_editor()
         
         self._update_button_states()
 
@@ -926,106 +1032,77 @@ class OperationEditor(QWidget, EditorStyleMixin):
         name = f"arg{idx}"
         
         arg = OperationArgument(name=name)
-        self.operation.arguments.append(arg)
-        
-        self._refresh_args_list()
-        self.args_list.setCurrentRow(len(self.operation.arguments) - 1)
+        row = len(self.operation.arguments)
+        self.args_model.insert_argument(row, arg)
+        self._set_current_arg_row(row)
+        self._update_button_states()
         # Mark as modified but don't refresh tree (args aren't shown in tree)
         self._emit_change_no_tree_refresh()
 
     def _remove_argument(self):
         """Remove the selected argument."""
-        row = self.args_list.currentRow()
+        row = self._current_arg_row()
         if row >= 0 and self.operation and row < len(self.operation.arguments):
-            del self.operation.arguments[row]
-            self._refresh_args_list()
+            self.args_model.remove_argument(row)
+            count = self.args_model.rowCount()
+            if count:
+                self._set_current_arg_row(min(row, count - 1))
+            else:
+                self._hide_arg_editor()
+            self._update_button_states()
             self._emit_change_no_tree_refresh()
 
     def _move_arg_up(self):
         """Move selected argument up."""
-        row = self.args_list.currentRow()
+        row = self._current_arg_row()
         if row > 0 and self.operation:
-            self.operation.arguments[row], self.operation.arguments[row-1] = \
-                self.operation.arguments[row-1], self.operation.arguments[row]
-            self._refresh_args_list()
-            self.args_list.setCurrentRow(row - 1)
+            self.args_model.move_argument(row, row - 1)
+            self._set_current_arg_row(row - 1)
+            self._update_button_states()
             self._emit_change_no_tree_refresh()
 
     def _move_arg_down(self):
         """Move selected argument down."""
-        row = self.args_list.currentRow()
+        row = self._current_arg_row()
         if row >= 0 and self.operation and row < len(self.operation.arguments) - 1:
-            self.operation.arguments[row], self.operation.arguments[row+1] = \
-                self.operation.arguments[row+1], self.operation.arguments[row]
-            self._refresh_args_list()
-            self.args_list.setCurrentRow(row + 1)
+            self.args_model.move_argument(row, row + 1)
+            self._set_current_arg_row(row + 1)
+            self._update_button_states()
             self._emit_change_no_tree_refresh()
 
     def _emit_change_no_tree_refresh(self):
-        """Emit change signal in a way that marks modified but doesn't refresh tree."""
-        # We'll emit a special signal that main window can handle differently
-        # For now, we just need to mark the project as modified
-        # The changed signal will be caught but we set a flag
-        self._skip_tree_refresh = True
-        self.changed.emit()
-        self._skip_tree_refresh = False
+        """Mark the project modified; arguments are not shown in the tree."""
+        self.modified_no_tree.emit()
 
     def _on_arg_name_changed(self, text):
-        if self._updating:
-            return
-        row = self.args_list.currentRow()
-        if row >= 0 and self.operation and row < len(self.operation.arguments):
-            self.operation.arguments[row].name = text
+        row, arg = self._current_arg()
+        if arg is not None:
+            arg.name = text
             # Update list display without losing selection
-            self._updating = True
-            dir_str = {"in": "→", "out": "←", "inout": "↔"}[self.operation.arguments[row].direction.value]
-            self.args_list.item(row).setText(f"{dir_str} {text}: {self.operation.arguments[row].base_type.value}")
-            self._updating = False
+            self.args_model.refresh_row(row)
             self._emit_change_no_tree_refresh()
 
     def _on_arg_type_changed(self, index):
-        if self._updating:
-            return
-        row = self.args_list.currentRow()
-        if row >= 0 and self.operation and row < len(self.operation.arguments):
-            self.operation.arguments[row].base_type = self.arg_type_combo.currentData()
+        row, arg = self._current_arg()
+        if arg is not None:
+            arg.base_type = self.arg_type_combo.currentData()
             # Update list display without losing selection
-            self._updating = True
-            arg = self.operation.arguments[row]
-            dir_str = {"in": "→", "out": "←", "inout": "↔"}[arg.direction.value]
-            self.args_list.item(row).setText(f"{dir_str} {arg.name}: {arg.base_type.value}")
-            self._updating = False
+            self.args_model.refresh_row(row)
             self._emit_change_no_tree_refresh()
 
     def _on_arg_dir_changed(self, index):
-        if self._updating:
-            return
-        row = self.args_list.currentRow()
-        if row >= 0 and self.operation and row < len(self.operation.arguments):
-            self.operation.arguments[row].direction = self.arg_dir_combo.currentData()
+        row, arg = self._current_arg()
+        if arg is not None:
+            arg.direction = self.arg_dir_combo.currentData()
             # Update list display without losing selection
-            self._updating = True
-            arg = self.operation.arguments[row]
-            dir_str = {"in": "→", "out": "←", "inout": "↔"}[arg.direction.value]
-            self.args_list.item(row).setText(f"{dir_str} {arg.name}: {arg.base_type.value}")
-            self._updating = False
+            self.args_model.refresh_row(row)
             self._emit_change_no_tree_refresh()
 
-    def _on_name_changed(self, text):
-        if not self._updating and self.operation:
-            self.operation.name = text
-            self.changed.emit()
-
     def _on_return_changed(self, index):
-        if not self._updating and self.operation:
+        if self.operation:
             self.operation.return_base_type = self.return_combo.currentData()
             self.changed.emit()
 
-    def _on_desc_changed(self):
-        if not self._updating and self.operation:
-            self.operation.description = self.desc_edit.toPlainText()
-            self.changed.emit()
-
 
 # =============================================================================
 # NEW EDITORS FOR DATA TYPES AND CONNECTIONS
@@ -1035,13 +1112,22 @@ class AppDataTypeEditor(QWidget, EditorStyleMixin):
     """Editor for Application Data Types."""
     
     changed = pyqtSignal()
+    _bound_attr = "app_type"
+    __slots__ = (
+        'app_type', '_compu_methods', '_compu_index', '_change_timer', '_bindings',
+        'name_edit', 'category_combo', 'compu_combo', 'min_spin', 'max_spin',
+        '_min_shown', '_max_shown', 'init_edit', 'desc_edit', 'uid_label',
+    )
 
     def __init__(self):
         super().__init__()
         self.app_type: ApplicationDataType = None
         self._compu_methods = []
-        self._updating = False
-        self.apply_editor_style()
+        self._compu_index = {}
+        self._min_shown = None
+        self._max_shown = None
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1049,19 +1135,19 @@ class AppDataTypeEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("Application Data Type")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.category_combo = QComboBox()
-        for cat in AppDataCategory:
-            self.category_combo.addItem(cat.value.title(), cat)
+        for cat, label in _APP_CAT_LABELS:
+            self.category_combo.addItem(label, cat)
         self.category_combo.currentIndexChanged.connect(self._on_category_changed)
         form.addRow("Category:", self.category_combo)
 
@@ -1072,110 +1158,107 @@ class AppDataTypeEditor(QWidget, EditorStyleMixin):
         self.min_spin = QDoubleSpinBox()
         self.min_spin.setRange(-1e9, 1e9)
         self.min_spin.setDecimals(2)
-        self.min_spin.valueChanged.connect(self._on_min_changed)
+        self.min_spin.editingFinished.connect(self._on_min_edited)
         form.addRow("Min Value:", self.min_spin)
 
         self.max_spin = QDoubleSpinBox()
         self.max_spin.setRange(-1e9, 1e9)
         self.max_spin.setDecimals(2)
-        self.max_spin.valueChanged.connect(self._on_max_changed)
+        self.max_spin.editingFinished.connect(self._on_max_edited)
         form.addRow("Max Value:", self.max_spin)
 
         self.init_edit = QLineEdit()
-        self.init_edit.textChanged.connect(self._on_init_changed)
+        self.bind(self.init_edit, "init_value", _text, _set_text, self.init_edit.textChanged)
         form.addRow("Init Value:", self.init_edit)
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(80)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         self.uid_label = QLabel()
-        self.uid_label.setStyleSheet("color: #808080;")
+        self.uid_label.setObjectName("uidLabel")
         form.addRow("UID:", self.uid_label)
 
         layout.addLayout(form)
         layout.addStretch()
 
-    def set_app_type(self, adt: ApplicationDataType, compu_methods: list = None):
-        self._updating = True
-        self.app_type = adt
-        self._compu_methods = compu_methods or []
-        
-        self.name_edit.setText(adt.name)
-        self.init_edit.setText(adt.init_value)
-        self.desc_edit.setPlainText(adt.description)
-        self.uid_label.setText(adt.uid)
-        
-        if adt.min_value is not None:
-            self.min_spin.setValue(adt.min_value)
-        if adt.max_value is not None:
-            self.max_spin.setValue(adt.max_value)
-        
-        # Category
-        for i in range(self.category_combo.count()):
-            if self.category_combo.itemData(i) == adt.category:
-                self.category_combo.setCurrentIndex(i)
-                break
-        
-        # CompuMethod combo
-        self.compu_combo.clear()
-        self.compu_combo.addItem("(None)", None)
-        selected_idx = 0
-        for i, cm in enumerate(self._compu_methods):
-            self.compu_combo.addItem(f"{cm.name} ({cm.unit})", cm.uid)
-            if cm.uid == adt.compu_method_uid:
-                selected_idx = i + 1
-        self.compu_combo.setCurrentIndex(selected_idx)
-        
-        self._updating = False
-
-    def _on_name_changed(self, text):
-        if not self._updating and self.app_type:
-            self.app_type.name = text
-            self.changed.emit()
+    def set_app_type(self, adt: ApplicationDataType, compu_methods: list = None, force: bool = False):
+        if self.app_type is adt and not force:
+            return
+        with _signals_blocked(self.min_spin, self.max_spin, self.category_combo, self.compu_combo):
+            self.app_type = adt
+            self._compu_methods = compu_methods or []
+
+            self.push_bindings(adt)
+            _set_text(self.uid_label, adt.uid)
+
+            if adt.min_value is not None:
+                _set_value(self.min_spin, adt.min_value)
+            if adt.max_value is not None:
+                _set_value(self.max_spin, adt.max_value)
+            self._min_shown = self.min_spin.value()
+            self._max_shown = self.max_spin.value()
+
+            # Category
+            _set_index(self.category_combo, _APP_CATEGORY_INDEX[adt.category])
+
+            # CompuMethod combo
+            self.compu_combo.clear()
+            self.compu_combo.addItem("(None)", None)
+            for cm in self._compu_methods:
+                self.compu_combo.addItem(f"{cm.name} ({cm.unit})", cm.uid)
+            self._compu_index = {cm.uid: i for i, cm in enumerate(self._compu_methods, 1)}
+            _set_index(self.compu_combo, self._compu_index.get(adt.compu_method_uid, 0))
 
     def _on_category_changed(self, index):
-        if not self._updating and self.app_type:
+        if self.app_type:
             self.app_type.category = self.category_combo.currentData()
             self.changed.emit()
 
     def _on_compu_changed(self, index):
-        if not self._updating and self.app_type:
+        if self.app_type:
             self.app_type.compu_method_uid = self.compu_combo.currentData()
             self.changed.emit()
 
-    def _on_min_changed(self, value):
-        if not self._updating and self.app_type:
+    def _on_min_edited(self):
+        value = self.min_spin.value()
+        # Compare with what was shown, so an untouched spin box never turns
+        # a None min_value into 0.0 when it loses focus
+        if self.app_type and value != self._min_shown:
+            self._min_shown = value
             self.app_type.min_value = value
             self.changed.emit()
 
-    def _on_max_changed(self, value):
-        if not self._updating and self.app_type:
+    def _on_max_edited(self):
+        value = self.max_spin.value()
+        if self.app_type and value != self._max_shown:
+            self._max_shown = value
             self.app_type.max_value = value
             self.changed.emit()
 
-    def _on_init_changed(self, text):
-        if not self._updating and self.app_type:
-            self.app_type.init_value = text
-            self.changed.emit()
-
-    def _on_desc_changed(self):
-        if not self._updating and self.app_type:
-            self.app_type.description = self.desc_edit.toPlainText()
-            self.changed.emit()
+    def flush_pending_change(self):
+        # Spin boxes commit on editingFinished; pick up a value still being typed
+        self._on_min_edited()
+        self._on_max_edited()
+        super().flush_pending_change()
 
 
 class ImplDataTypeEditor(QWidget, EditorStyleMixin):
     """Editor for Implementation Data Types."""
     
     changed = pyqtSignal()
+    _bound_attr = "impl_type"
+    __slots__ = (
+        'impl_type', '_change_timer', '_bindings', 'name_edit', 'base_type_combo',
+        'desc_edit', 'uid_label',
+    )
 
     def __init__(self):
         super().__init__()
         self.impl_type: ImplementationDataType = None
-        self._updating = False
-        self.apply_editor_style()
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1183,75 +1266,69 @@ class ImplDataTypeEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("Implementation Data Type")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.base_type_combo = QComboBox()
-        for dt in BaseDataType:
-            self.base_type_combo.addItem(dt.value, dt)
+        for dt, label in _BASE_TYPE_LABELS:
+            self.base_type_combo.addItem(label, dt)
         self.base_type_combo.currentIndexChanged.connect(self._on_base_type_changed)
         form.addRow("Base Type:", self.base_type_combo)
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(80)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         self.uid_label = QLabel()
-        self.uid_label.setStyleSheet("color: #808080;")
+        self.uid_label.setObjectName("uidLabel")
         form.addRow("UID:", self.uid_label)
 
         layout.addLayout(form)
         layout.addStretch()
 
-    def set_impl_type(self, idt: ImplementationDataType):
-        self._updating = True
-        self.impl_type = idt
-        
-        self.name_edit.setText(idt.name)
-        self.desc_edit.setPlainText(idt.description)
-        self.uid_label.setText(idt.uid)
-        
-        for i in range(self.base_type_combo.count()):
-            if self.base_type_combo.itemData(i) == idt.base_type:
-                self.base_type_combo.setCurrentIndex(i)
-                break
-        
-        self._updating = False
+    def set_impl_type(self, idt: ImplementationDataType, force: bool = False):
+        if self.impl_type is idt and not force:
+            return
+        with _signals_blocked(self.base_type_combo):
+            self.impl_type = idt
 
-    def _on_name_changed(self, text):
-        if not self._updating and self.impl_type:
-            self.impl_type.name = text
-            self.changed.emit()
+            self.push_bindings(idt)
+            _set_text(self.uid_label, idt.uid)
+
+            _set_index(self.base_type_combo, _BASE_TYPE_INDEX[idt.base_type])
 
     def _on_base_type_changed(self, index):
-        if not self._updating and self.impl_type:
+        if self.impl_type:
             self.impl_type.base_type = self.base_type_combo.currentData()
             self.changed.emit()
 
-    def _on_desc_changed(self):
-        if not self._updating and self.impl_type:
-            self.impl_type.description = self.desc_edit.toPlainText()
-            self.changed.emit()
-
 
 class CompuMethodEditor(QWidget, EditorStyleMixin):
     """Editor for Computation Methods (scaling)."""
     
     changed = pyqtSignal()
+    _bound_attr = "compu_method"
+    __slots__ = (
+        'compu_method', '_change_timer', '_bindings', 'name_edit', 'factor_spin',
+        'offset_spin', '_factor_shown', '_offset_shown', 'unit_edit', 'desc_edit',
+        'formula_label',
+    )
 
     def __init__(self):
         super().__init__()
         self.compu_method: CompuMethod = None
-        self._updating = False
-        self.apply_editor_style()
+        self._factor_shown = None
+        self._offset_shown = None
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1259,26 +1336,26 @@ class CompuMethodEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("CompuMethod (Scaling)")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.factor_spin = QDoubleSpinBox()
         self.factor_spin.setRange(-1e9, 1e9)
         self.factor_spin.setDecimals(6)
-        self.factor_spin.valueChanged.connect(self._on_factor_changed)
+        self.factor_spin.editingFinished.connect(self._on_factor_edited)
         form.addRow("Factor:", self.factor_spin)
 
         self.offset_spin = QDoubleSpinBox()
         self.offset_spin.setRange(-1e9, 1e9)
         self.offset_spin.setDecimals(6)
-        self.offset_spin.valueChanged.connect(self._on_offset_changed)
+        self.offset_spin.editingFinished.connect(self._on_offset_edited)
         form.addRow("Offset:", self.offset_spin)
 
         self.unit_edit = QLineEdit()
@@ -1287,7 +1364,7 @@ class CompuMethodEditor(QWidget, EditorStyleMixin):
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(80)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         layout.addLayout(form)
@@ -1296,24 +1373,27 @@ class CompuMethodEditor(QWidget, EditorStyleMixin):
         formula_group = QGroupBox("Formula")
         formula_layout = QVBoxLayout(formula_group)
         self.formula_label = QLabel("physical = (internal × factor) + offset")
-        self.formula_label.setStyleSheet("color: #6a9955; font-family: monospace;")
+        self.formula_label.setObjectName("formulaLabel")
         formula_layout.addWidget(self.formula_label)
         layout.addWidget(formula_group)
 
         layout.addStretch()
 
-    def set_compu_method(self, cm: CompuMethod):
-        self._updating = True
-        self.compu_method = cm
-        
-        self.name_edit.setText(cm.name)
-        self.factor_spin.setValue(cm.factor)
-        self.offset_spin.setValue(cm.offset)
-        self.unit_edit.setText(cm.unit)
-        self.desc_edit.setPlainText(cm.description)
-        
-        self._update_formula()
-        self._updating = False
+    def set_compu_method(self, cm: CompuMethod, force: bool = False):
+        if self.compu_method is cm and not force:
+            return
+        with _signals_blocked(self.factor_spin, self.offset_spin, self.unit_edit):
+            self.compu_method = cm
+
+            self.push_bindings(cm)
+            _set_value(self.factor_spin, cm.factor)
+            _set_value(self.offset_spin, cm.offset)
+            # Spin boxes round to their decimals; remember what they showed
+            self._factor_shown = self.factor_spin.value()
+            self._offset_shown = self.offset_spin.value()
+            _set_text(self.unit_edit, cm.unit)
+
+            self._update_formula()
 
     def _update_formula(self):
         if self.compu_method:
@@ -1322,46 +1402,56 @@ class CompuMethodEditor(QWidget, EditorStyleMixin):
             u = self.compu_method.unit or "?"
             self.formula_label.setText(f"physical [{u}] = (internal × {f}) + {o}")
 
-    def _on_name_changed(self, text):
-        if not self._updating and self.compu_method:
-            self.compu_method.name = text
-            self.changed.emit()
-
-    def _on_factor_changed(self, value):
-        if not self._updating and self.compu_method:
+    def _on_factor_edited(self):
+        value = self.factor_spin.value()
+        if self.compu_method and value != self._factor_shown:
+            self._factor_shown = value
             self.compu_method.factor = value
             self._update_formula()
             self.changed.emit()
 
-    def _on_offset_changed(self, value):
-        if not self._updating and self.compu_method:
+    def _on_offset_edited(self):
+        value = self.offset_spin.value()
+        if self.compu_method and value != self._offset_shown:
+            self._offset_shown = value
             self.compu_method.offset = value
             self._update_formula()
             self.changed.emit()
 
+    def flush_pending_change(self):
+        # Spin boxes commit on editingFinished; pick up a value still being typed
+        self._on_factor_edited()
+        self._on_offset_edited()
+        super().flush_pending_change()
+
     def _on_unit_changed(self, text):
-        if not self._updating and self.compu_method:
+        if self.compu_method:
             self.compu_method.unit = text
             self._update_formula()
-            self.changed.emit()
-
-    def _on_desc_changed(self):
-        if not self._updating and self.compu_method:
-            self.compu_method.description = self.desc_edit.toPlainText()
-            self.changed.emit()
+            self._change_timer.start()
 
 
 class ConnectionEditor(QWidget, EditorStyleMixin):
     """Editor for Port Connections."""
     
     changed = pyqtSignal()
+    # Name/description edits only touch this connection's row; carries conn.uid
+    modified = pyqtSignal(str)
+    _bound_attr = "connection"
+    __slots__ = (
+        'connection', '_project', '_resolve_cache', '_change_timer', '_bindings',
+        'name_edit', 'desc_edit', 'provider_swc_label', 'provider_port_label',
+        'requester_swc_label', 'requester_port_label', 'interface_label',
+    )
 
     def __init__(self):
         super().__init__()
         self.connection: PortConnection = None
         self._project: Project = None
-        self._updating = False
-        self.apply_editor_style()
+        # (conn.uid, project.version_counter) -> resolved label texts
+        self._resolve_cache: dict[tuple[str, int], tuple[str, str, str, str, str]] = {}
+        self._change_timer = _make_change_timer(self)
+        self._bindings = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1369,19 +1459,19 @@ class ConnectionEditor(QWidget, EditorStyleMixin):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header = QLabel("Port Connection")
-        header.setStyleSheet("font-size: 18px; color: #569cd6; font-weight: bold; padding-bottom: 10px;")
+        header.setObjectName("editorHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
         form.setSpacing(10)
 
         self.name_edit = QLineEdit()
-        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.bind(self.name_edit, "name", _text, _set_text, self.name_edit.textChanged)
         form.addRow("Name:", self.name_edit)
 
         self.desc_edit = QTextEdit()
         self.desc_edit.setMaximumHeight(80)
-        self.desc_edit.textChanged.connect(self._on_desc_changed)
+        self.bind(self.desc_edit, "description", _plain_text, _set_plain_text, self.desc_edit.textChanged)
         form.addRow("Description:", self.desc_edit)
 
         layout.addLayout(form)
@@ -1413,41 +1503,55 @@ class ConnectionEditor(QWidget, EditorStyleMixin):
 
         layout.addStretch()
 
-    def set_connection(self, conn: PortConnection, project: Project):
-        self._updating = True
+    def set_connection(self, conn: PortConnection, project: Project, force: bool = False):
+        if self.connection is conn and not force:
+            return
+        if project is not self._project or len(self._resolve_cache) > 256:
+            self._resolve_cache.clear()
         self.connection = conn
         self._project = project
-        
-        self.name_edit.setText(conn.name)
-        self.desc_edit.setPlainText(conn.description)
-        
-        # Resolve references
+
+        self.push_bindings(conn)
+
+        # Resolve references (cached until the project is edited)
+        key = (conn.uid, project.version_counter)
+        labels = self._resolve_cache.get(key)
+        if labels is None:
+            labels = self._resolve_cache[key] = self._resolve_labels(conn, project)
+        (provider_swc_name, provider_port_name, iface_name,
+         requester_swc_name, requester_port_name) = labels
+        _set_text(self.provider_swc_label, provider_swc_name)
+        _set_text(self.provider_port_label, provider_port_name)
+        _set_text(self.interface_label, iface_name)
+        _set_text(self.requester_swc_label, requester_swc_name)
+        _set_text(self.requester_port_label, requester_port_name)
+
+    @staticmethod
+    def _resolve_labels(conn: PortConnection, project: Project) -> tuple[str, str, str, str, str]:
+        """Names of the provider SWC/port, interface and requester SWC/port ("" if unresolved)."""
+        provider_swc_name = provider_port_name = iface_name = ""
+        requester_swc_name = requester_port_name = ""
+
         provider_swc = project.get_component_by_uid(conn.provider_swc_uid)
-        requester_swc = project.get_component_by_uid(conn.requester_swc_uid)
-        
         if provider_swc:
-            self.provider_swc_label.setText(provider_swc.name)
+            provider_swc_name = provider_swc.name
             provider_port = provider_swc.get_port_by_uid(conn.provider_port_uid)
             if provider_port:
-                self.provider_port_label.setText(provider_port.name)
+                provider_port_name = provider_port.name
                 iface = project.get_interface_by_uid(provider_port.interface_uid)
                 if iface:
-                    self.interface_label.setText(iface.name)
-        
+                    iface_name = iface.name
+
+        requester_swc = project.get_component_by_uid(conn.requester_swc_uid)
         if requester_swc:
-            self.requester_swc_label.setText(requester_swc.name)
+            requester_swc_name = requester_swc.name
             requester_port = requester_swc.get_port_by_uid(conn.requester_port_uid)
             if requester_port:
-                self.requester_port_label.setText(requester_port.name)
-        
-        self._updating = False
+                requester_port_name = requester_port.name
 
-    def _on_name_changed(self, text):
-        if not self._updating and self.connection:
-            self.connection.name = text
-            self.changed.emit()
+        return (provider_swc_name, provider_port_name, iface_name,
+                requester_swc_name, requester_port_name)
 
-    def _on_desc_changed(self):
-        if not self._updating and self.connection:
-            self.connection.description = self.desc_edit.toPlainText()
-            self.changed.emit()
+    def _emit_change(self):
+        if self.connection:
+            self.modified.emit(self.connection.uid)
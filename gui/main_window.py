@@ -2,6 +2,7 @@
 Main application window for AUTOSAR Designer.
 """
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -9,8 +10,8 @@ from PyQt6.QtWidgets import (
     QToolBar, QStatusBar, QFileDialog, QMessageBox, QMenu,
     QLabel, QPushButton, QStyle, QTabWidget
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QAction, QIcon, QFont
+from PyQt6.QtCore import Qt, QSize, QTimer, QThread, QSignalBlocker, pyqtSignal
+from PyQt6.QtGui import QAction, QIcon, QFont, QFontMetrics, QPixmap, QPainter, QColor
 
 from model import (
     Project, SoftwareComponent, Interface, Port, Runnable,
@@ -18,17 +19,167 @@ from model import (
     BaseDataType, ApplicationDataType, ImplementationDataType, CompuMethod,
     DataTypeMapping, AppDataCategory, ArgumentDirection, PortConnection,
     RunnableTrigger,
-    save_project, load_project, create_example_project,
+    create_example_project,
     MultiFileProject
 )
-from codegen import generate_project_code
 from gui.editors import (
     WelcomePanel, SwcEditor, InterfaceEditor, PortEditor,
     RunnableEditor, DataElementEditor, OperationEditor,
     AppDataTypeEditor, ImplDataTypeEditor, CompuMethodEditor,
-    ConnectionEditor
+    ConnectionEditor, load_editor_style
 )
 from gui.composition_view import CompositionWidget
+from gui.dialogs import ConnectionDialog
+from gui.workers import ProjectIOWorker, CodeGenWorker
+
+# Idle time after the last edit before the composition view is redrawn
+REFRESH_DEBOUNCE_MS = 150
+
+# Stylesheets, defined once and shared by every instance
+_TREE_QSS = """
+QTreeWidget {
+    background-color: #1e1e1e;
+    color: #d4d4d4;
+    border: none;
+    font-size: 13px;
+}
+QTreeWidget::item {
+    padding: 4px;
+}
+QTreeWidget::item:selected {
+    background-color: #094771;
+}
+QTreeWidget::item:hover {
+    background-color: #2a2d2e;
+}
+"""
+
+_MAIN_QSS = """
+QMainWindow {
+    background-color: #252526;
+}
+QMenuBar {
+    background-color: #3c3c3c;
+    color: #d4d4d4;
+}
+QMenuBar::item:selected {
+    background-color: #094771;
+}
+QMenu {
+    background-color: #252526;
+    color: #d4d4d4;
+    border: 1px solid #454545;
+}
+QMenu::item:selected {
+    background-color: #094771;
+}
+QToolBar {
+    background-color: #3c3c3c;
+    border: none;
+    spacing: 5px;
+    padding: 5px;
+}
+QToolButton {
+    background-color: transparent;
+    color: #d4d4d4;
+    border: none;
+    padding: 5px 10px;
+    border-radius: 4px;
+}
+QToolButton:hover {
+    background-color: #4a4a4a;
+}
+QStatusBar {
+    background-color: #007acc;
+    color: white;
+}
+QSplitter::handle {
+    background-color: #3c3c3c;
+}
+"""
+
+_TABS_QSS = """
+QTabWidget::pane {
+    border: none;
+    background-color: #1e1e1e;
+}
+QTabBar::tab {
+    background-color: #2d2d30;
+    color: #808080;
+    padding: 8px 20px;
+    border: none;
+    border-bottom: 2px solid transparent;
+}
+QTabBar::tab:selected {
+    background-color: #1e1e1e;
+    color: #d4d4d4;
+    border-bottom: 2px solid #007acc;
+}
+QTabBar::tab:hover {
+    background-color: #3e3e42;
+}
+"""
+
+# Tree item icons, drawn from these glyphs by _tree_icon
+ICON_PROJECT = "📁"
+ICON_FOLDER = "📂"
+ICON_SWC = "📦"
+ICON_SR_INTERFACE = "🔗"
+ICON_CS_INTERFACE = "⚡"
+ICON_DATA_ELEMENT = "📊"
+ICON_OPERATION = "⚙️"
+ICON_APP_TYPE = "🔷"
+ICON_IMPL_TYPE = "🔶"
+ICON_COMPU_METHOD = "📐"
+ICON_CONNECTION = "🔌"
+# AUTOSAR-style port icons:
+# ▶■ = Provided (sender/server) - arrow out from filled square
+# □◀ = Required (receiver/client) - arrow in to empty square
+ICON_PROVIDED_PORT = "▶■"
+ICON_REQUIRED_PORT = "□◀"
+CONN_INDICATOR = " 🔗"
+# Runnable trigger -> icon
+TRIGGER_ICONS = {
+    RunnableTrigger.TIMING: "⏱️",
+    RunnableTrigger.OPERATION_INVOKED: "⚡",
+    RunnableTrigger.DATA_RECEIVED: "📨",
+}
+ICON_RUNNABLE = "▷"
+# Side of the square pixmap each glyph is drawn into
+_ICON_PX = 20
+
+
+def _stop_thread(thread: QThread) -> None:
+    """Stop thread's event loop and wait for the job it is running to finish."""
+    if thread.isRunning():
+        thread.quit()
+        thread.wait()
+
+
+@lru_cache(maxsize=None)
+def _tree_icon(glyph: str) -> QIcon:
+    """Icon showing glyph, drawn once and shared by every tree row."""
+    pixmap = QPixmap(_ICON_PX, _ICON_PX)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    font = QFont()
+    font.setPixelSize(_ICON_PX - 4)
+    # Two-glyph port symbols are shrunk to fit the square
+    width = QFontMetrics(font).horizontalAdvance(glyph)
+    if width > _ICON_PX:
+        font.setPixelSize(max(6, (_ICON_PX - 4) * _ICON_PX // width))
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.setPen(QColor("#d4d4d4"))
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    return QIcon(pixmap)
+
+
+def _tree_item(glyph: str, text: str) -> QTreeWidgetItem:
+    """Tree item labelled text, with glyph as its icon."""
+    item = QTreeWidgetItem([text])
+    item.setIcon(0, _tree_icon(glyph))
+    return item
 
 
 class ProjectTreeWidget(QTreeWidget):
@@ -41,25 +192,12 @@ class ProjectTreeWidget(QTreeWidget):
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
         self.setMinimumWidth(250)
+        # Every row has the same font and padding; lets the view skip
+        # measuring each item's height
+        self.setUniformRowHeights(True)
         
         # Style
-        self.setStyleSheet("""
-            QTreeWidget {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: none;
-                font-size: 13px;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #094771;
-            }
-            QTreeWidget::item:hover {
-                background-color: #2a2d2e;
-            }
-        """)
+        self.setStyleSheet(_TREE_QSS)
 
     def _show_context_menu(self, position):
         """Show context menu for tree items."""
@@ -86,7 +224,7 @@ class ProjectTreeWidget(QTreeWidget):
                 delete.triggered.connect(lambda checked, i=item: mw._delete_item(i))
             
             elif item_type == "interface":
-                iface = item.data(0, Qt.ItemDataRole.UserRole)
+                iface = mw._item_obj(item)
                 if iface.interface_type == InterfaceType.SENDER_RECEIVER:
                     add_de = menu.addAction("Add Data Element")
                     add_de.triggered.connect(lambda checked, i=item: mw._add_data_element(i))
@@ -101,8 +239,8 @@ class ProjectTreeWidget(QTreeWidget):
                                "app_data_type", "impl_data_type", "compu_method", "connection"):
                 # For ports, also offer connection creation
                 if item_type == "port":
-                    port = item.data(0, Qt.ItemDataRole.UserRole)
-                    swc = item.data(0, Qt.ItemDataRole.UserRole + 2)
+                    port = mw._item_obj(item)
+                    swc = mw._item_obj(item.parent())
                     if port.direction == PortDirection.PROVIDED:
                         connect_action = menu.addAction("Connect to Required Port...")
                         connect_action.triggered.connect(
@@ -141,16 +279,51 @@ class ProjectTreeWidget(QTreeWidget):
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Queued to the project I/O worker thread
+    _load_requested = pyqtSignal(str)
+    _save_requested = pyqtSignal(object, str)
+    _generate_requested = pyqtSignal(object, str)
+
     def __init__(self):
         super().__init__()
         self.project: Project = Project(name="New Project")
         self.project_path: Path = None
         self._modified = False
+        self._editors_stale = True
+        # Object shown in the property editor; its tree row is found by uid
+        self._current_obj = None
+        self._item_by_uid: dict[str, QTreeWidgetItem] = {}
+        # Tree items store only the uid; this resolves it to the model object
+        self._obj_by_uid: dict[str, object] = {}
+        # uid -> (build, obj) for collapsed SWC/interface items whose children
+        # are built on first expand; keyed by uid since tree items aren't hashable
+        self._pending_children: dict[str, tuple] = {}
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        # Zero-delay: every _refresh_tree() in one event-loop turn shares a rebuild
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(0)
+        self._rebuild_timer.timeout.connect(self._refresh_tree_now)
+        # Edited objects whose diagram items the next _do_refresh updates
+        self._composition_pending: list = []
+        # Set when a redraw was skipped because the diagram tab was hidden
+        self._composition_dirty = False
+        # (project, version_counter) being written by the I/O worker
+        self._saving = None
+        # Save / Save As actions, disabled while a save is in flight
+        self._save_actions: list[QAction] = []
+        # (project name, modified) the window title was last built from
+        self._title_state = None
         
         self._setup_ui()
         self._setup_toolbar()
         self._setup_menubar()
-        self._refresh_tree()
+        self._setup_io_thread()
+        self._refresh_tree_now()
 
     def _setup_ui(self):
         """Setup the main UI layout."""
@@ -158,49 +331,7 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1200, 800)
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #252526;
-            }
-            QMenuBar {
-                background-color: #3c3c3c;
-                color: #d4d4d4;
-            }
-            QMenuBar::item:selected {
-                background-color: #094771;
-            }
-            QMenu {
-                background-color: #252526;
-                color: #d4d4d4;
-                border: 1px solid #454545;
-            }
-            QMenu::item:selected {
-                background-color: #094771;
-            }
-            QToolBar {
-                background-color: #3c3c3c;
-                border: none;
-                spacing: 5px;
-                padding: 5px;
-            }
-            QToolButton {
-                background-color: transparent;
-                color: #d4d4d4;
-                border: none;
-                padding: 5px 10px;
-                border-radius: 4px;
-            }
-            QToolButton:hover {
-                background-color: #4a4a4a;
-            }
-            QStatusBar {
-                background-color: #007acc;
-                color: white;
-            }
-            QSplitter::handle {
-                background-color: #3c3c3c;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
 
         # Central widget with splitter
         central = QWidget()
@@ -214,93 +345,74 @@ class MainWindow(QMainWindow):
         # Left panel: Project tree
         self.tree = ProjectTreeWidget(self)
         self.tree.itemSelectionChanged.connect(self._on_selection_changed)
+        self.tree.itemExpanded.connect(self._on_item_expanded)
         splitter.addWidget(self.tree)
 
         # Right panel: Tabs for Editor and Composition View
         self.right_tabs = QTabWidget()
-        self.right_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background-color: #1e1e1e;
-            }
-            QTabBar::tab {
-                background-color: #2d2d30;
-                color: #808080;
-                padding: 8px 20px;
-                border: none;
-                border-bottom: 2px solid transparent;
-            }
-            QTabBar::tab:selected {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border-bottom: 2px solid #007acc;
-            }
-            QTabBar::tab:hover {
-                background-color: #3e3e42;
-            }
-        """)
+        self.right_tabs.setStyleSheet(_TABS_QSS)
         splitter.addWidget(self.right_tabs)
 
         # Tab 1: Property Editor
         self.editor_stack = QStackedWidget()
-        self.editor_stack.setStyleSheet("""
-            QStackedWidget {
-                background-color: #1e1e1e;
-            }
-        """)
+        # Single stylesheet pass for every editor hosted in the stack
+        self.editor_stack.setStyleSheet(load_editor_style())
         self.right_tabs.addTab(self.editor_stack, "📝 Properties")
 
         # Tab 2: Composition View (Graphical)
         self.composition_view = CompositionWidget()
         self.right_tabs.addTab(self.composition_view, "📊 Composition Diagram")
+        self.right_tabs.currentChanged.connect(self._on_right_tab_changed)
 
-        # Add editors
+        # The welcome panel is shown at startup; the property editors are
+        # created by _get_editor the first time an item of their kind is selected
         self.welcome_panel = WelcomePanel()
-        self.swc_editor = SwcEditor()
-        self.interface_editor = InterfaceEditor()
-        self.port_editor = PortEditor()
-        self.runnable_editor = RunnableEditor()
-        self.data_element_editor = DataElementEditor()
-        self.operation_editor = OperationEditor()
-        self.app_type_editor = AppDataTypeEditor()
-        self.impl_type_editor = ImplDataTypeEditor()
-        self.compu_method_editor = CompuMethodEditor()
-        self.connection_editor = ConnectionEditor()
-
-        self.editor_stack.addWidget(self.welcome_panel)       # 0
-        self.editor_stack.addWidget(self.swc_editor)          # 1
-        self.editor_stack.addWidget(self.interface_editor)    # 2
-        self.editor_stack.addWidget(self.port_editor)         # 3
-        self.editor_stack.addWidget(self.runnable_editor)     # 4
-        self.editor_stack.addWidget(self.data_element_editor) # 5
-        self.editor_stack.addWidget(self.operation_editor)    # 6
-        self.editor_stack.addWidget(self.app_type_editor)     # 7
-        self.editor_stack.addWidget(self.impl_type_editor)    # 8
-        self.editor_stack.addWidget(self.compu_method_editor) # 9
-        self.editor_stack.addWidget(self.connection_editor)   # 10
-
-        # Connect editor signals
-        self.swc_editor.changed.connect(self._on_editor_changed)
-        self.interface_editor.changed.connect(self._on_editor_changed)
-        self.port_editor.changed.connect(self._on_editor_changed)
-        self.runnable_editor.changed.connect(self._on_editor_changed)
-        self.data_element_editor.changed.connect(self._on_editor_changed)
-        self.operation_editor.changed.connect(self._on_editor_changed)
-        self.app_type_editor.changed.connect(self._on_editor_changed)
-        self.impl_type_editor.changed.connect(self._on_editor_changed)
-        self.compu_method_editor.changed.connect(self._on_editor_changed)
-        self.connection_editor.changed.connect(self._on_editor_changed)
+        self.editor_stack.addWidget(self.welcome_panel)
+        self._editors: dict[str, QWidget] = {}
+        self._editor_factories = {
+            "swc": SwcEditor,
+            "interface": InterfaceEditor,
+            "port": PortEditor,
+            "runnable": RunnableEditor,
+            "data_element": DataElementEditor,
+            "operation": OperationEditor,
+            "app_data_type": AppDataTypeEditor,
+            "impl_data_type": ImplDataTypeEditor,
+            "compu_method": CompuMethodEditor,
+            "connection": ConnectionEditor,
+        }
+        # How each editor is loaded with the selected object:
+        # (editor, obj, tree item, force) -> None
+        self._editor_dispatch = {
+            "swc": lambda ed, obj, item, force: ed.set_swc(obj, force=force),
+            "interface": lambda ed, obj, item, force: ed.set_interface(obj, force=force),
+            "port": lambda ed, obj, item, force: ed.set_port(
+                obj, self.project.interfaces, self.project, force=force),
+            "runnable": lambda ed, obj, item, force: ed.set_runnable(
+                obj, self._item_obj(item.parent()), self.project, force=force),
+            "data_element": lambda ed, obj, item, force: ed.set_data_element(
+                obj, self.project.application_data_types, force=force),
+            "operation": lambda ed, obj, item, force: ed.set_operation(
+                obj, self.project.application_data_types, force=force),
+            "app_data_type": lambda ed, obj, item, force: ed.set_app_type(
+                obj, self.project.compu_methods, force=force),
+            "impl_data_type": lambda ed, obj, item, force: ed.set_impl_type(obj, force=force),
+            "compu_method": lambda ed, obj, item, force: ed.set_compu_method(obj, force=force),
+            "connection": lambda ed, obj, item, force: ed.set_connection(
+                obj, self.project, force=force),
+        }
 
         splitter.setSizes([300, 900])
 
         # Status bar
-        self.statusBar().showMessage("Ready")
+        self._show_status("Ready")
 
     def _setup_toolbar(self):
         """Setup the main toolbar."""
         toolbar = QToolBar("Main Toolbar")
         toolbar.setIconSize(QSize(20, 20))
         self.addToolBar(toolbar)
+        self._toolbar = toolbar
 
         # New Project
         new_action = QAction("New", self)
@@ -319,6 +431,7 @@ class MainWindow(QMainWindow):
         save_action.setShortcut("Ctrl+S")
         save_action.triggered.connect(self._save_project)
         toolbar.addAction(save_action)
+        self._save_actions.append(save_action)
 
         toolbar.addSeparator()
 
@@ -374,6 +487,7 @@ class MainWindow(QMainWindow):
         save_as_action = file_menu.addAction("Save As...")
         save_as_action.setShortcut("Ctrl+Shift+S")
         save_as_action.triggered.connect(self._save_project_as)
+        self._save_actions += [save_action, save_as_action]
         
         file_menu.addSeparator()
         
@@ -403,354 +517,544 @@ class MainWindow(QMainWindow):
         about = help_menu.addAction("About")
         about.triggered.connect(self._show_about)
 
-    def _refresh_tree(self, preserve_selection=True):
-        """Refresh the project tree."""
+    def _setup_io_thread(self):
+        """Start the thread that loads and saves project files and generates code."""
+        self._io_thread = QThread(self)
+        self._io_worker = ProjectIOWorker()
+        self._io_worker.moveToThread(self._io_thread)
+        self._load_requested.connect(self._io_worker.load)
+        self._save_requested.connect(self._io_worker.save)
+        self._io_worker.loaded.connect(self._on_project_loaded)
+        self._io_worker.saved.connect(self._on_project_saved)
+        self._codegen_worker = CodeGenWorker()
+        self._codegen_worker.moveToThread(self._io_thread)
+        self._generate_requested.connect(self._codegen_worker.generate)
+        self._codegen_worker.generated.connect(self._on_code_generated)
+        # closeEvent is not the only way out: also stop the thread on
+        # application quit and when the window is deleted without closing.
+        # The partial holds only the thread, as self is gone by `destroyed`.
+        stop = partial(_stop_thread, self._io_thread)
+        QApplication.instance().aboutToQuit.connect(stop)
+        self.destroyed.connect(stop)
+        self._io_thread.start()
+
+    def _set_io_busy(self, busy: bool, message: str = None):
+        """Lock the project actions while a file is read or written."""
+        self._toolbar.setEnabled(not busy)
+        self.menuBar().setEnabled(not busy)
+        # Shortcuts still fire from a disabled toolbar or menu bar
+        for action in self._save_actions:
+            action.setEnabled(not busy)
+        if message:
+            self._show_status(message)
+
+    def closeEvent(self, event):
+        # Let a save that is still being written finish
+        _stop_thread(self._io_thread)
+        super().closeEvent(event)
+
+    def _refresh_tree(self):
+        """Schedule a tree rebuild for when control returns to the event loop."""
+        self._rebuild_timer.start()
+
+    def _refresh_tree_now(self, preserve_selection=True):
+        """Rebuild the project tree."""
+        self._rebuild_timer.stop()
+        self._editors_stale = True
+        self.project.touch()
         # Save current selection
         selected_uid = None
         selected_type = None
         if preserve_selection:
             items = self.tree.selectedItems()
             if items:
-                obj = items[0].data(0, Qt.ItemDataRole.UserRole)
+                selected_uid = items[0].data(0, Qt.ItemDataRole.UserRole)
                 selected_type = items[0].data(0, Qt.ItemDataRole.UserRole + 1)
-                if obj and hasattr(obj, 'uid'):
-                    selected_uid = obj.uid
         
-        self.tree.clear()
-
-        # Project root
-        root = QTreeWidgetItem([f"📁 {self.project.name}"])
-        root.setData(0, Qt.ItemDataRole.UserRole, self.project)
-        root.setData(0, Qt.ItemDataRole.UserRole + 1, "project")
-        self.tree.addTopLevelItem(root)
-
-        # ==========================================================================
-        # DATA TYPES FOLDER
-        # ==========================================================================
-        types_folder = QTreeWidgetItem(["📂 Data Types"])
-        types_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "types_folder")
-        root.addChild(types_folder)
-
-        # Compu Methods
-        compu_folder = QTreeWidgetItem(["📂 CompuMethods"])
-        compu_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "compu_methods_folder")
-        types_folder.addChild(compu_folder)
-        for cm in self.project.compu_methods:
-            cm_item = QTreeWidgetItem([f"📐 {cm.name}"])
-            cm_item.setData(0, Qt.ItemDataRole.UserRole, cm)
-            cm_item.setData(0, Qt.ItemDataRole.UserRole + 1, "compu_method")
-            compu_folder.addChild(cm_item)
-
-        # Application Data Types
-        app_types_folder = QTreeWidgetItem(["📂 Application Types"])
-        app_types_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "app_types_folder")
-        types_folder.addChild(app_types_folder)
-        for adt in self.project.application_data_types:
-            adt_item = QTreeWidgetItem([f"🔷 {adt.name}"])
-            adt_item.setData(0, Qt.ItemDataRole.UserRole, adt)
-            adt_item.setData(0, Qt.ItemDataRole.UserRole + 1, "app_data_type")
-            app_types_folder.addChild(adt_item)
-
-        # Implementation Data Types
-        impl_types_folder = QTreeWidgetItem(["📂 Implementation Types"])
-        impl_types_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "impl_types_folder")
-        types_folder.addChild(impl_types_folder)
-        for idt in self.project.implementation_data_types:
-            idt_item = QTreeWidgetItem([f"🔶 {idt.name}"])
-            idt_item.setData(0, Qt.ItemDataRole.UserRole, idt)
-            idt_item.setData(0, Qt.ItemDataRole.UserRole + 1, "impl_data_type")
-            impl_types_folder.addChild(idt_item)
-
-        # ==========================================================================
-        # INTERFACES FOLDER
-        # ==========================================================================
-        ifaces_folder = QTreeWidgetItem(["📂 Interfaces"])
-        ifaces_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "interfaces_folder")
-        root.addChild(ifaces_folder)
-
-        for iface in self.project.interfaces:
-            icon = "🔗" if iface.interface_type == InterfaceType.SENDER_RECEIVER else "⚡"
-            iface_item = QTreeWidgetItem([f"{icon} {iface.name}"])
-            iface_item.setData(0, Qt.ItemDataRole.UserRole, iface)
-            iface_item.setData(0, Qt.ItemDataRole.UserRole + 1, "interface")
-            ifaces_folder.addChild(iface_item)
-
-            if iface.interface_type == InterfaceType.SENDER_RECEIVER:
-                for de in iface.data_elements:
-                    de_item = QTreeWidgetItem([f"  📊 {de.name}"])
-                    de_item.setData(0, Qt.ItemDataRole.UserRole, de)
-                    de_item.setData(0, Qt.ItemDataRole.UserRole + 1, "data_element")
-                    de_item.setData(0, Qt.ItemDataRole.UserRole + 2, iface)
-                    iface_item.addChild(de_item)
-            else:
-                for op in iface.operations:
-                    op_item = QTreeWidgetItem([f"  ⚙️ {op.name}"])
-                    op_item.setData(0, Qt.ItemDataRole.UserRole, op)
-                    op_item.setData(0, Qt.ItemDataRole.UserRole + 1, "operation")
-                    op_item.setData(0, Qt.ItemDataRole.UserRole + 2, iface)
-                    iface_item.addChild(op_item)
-
-        # ==========================================================================
-        # COMPONENTS FOLDER
-        # ==========================================================================
-        comps_folder = QTreeWidgetItem(["📂 Software Components"])
-        comps_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "components_folder")
-        root.addChild(comps_folder)
-
-        for swc in self.project.components:
-            swc_item = QTreeWidgetItem([f"📦 {swc.name}"])
-            swc_item.setData(0, Qt.ItemDataRole.UserRole, swc)
-            swc_item.setData(0, Qt.ItemDataRole.UserRole + 1, "swc")
-            comps_folder.addChild(swc_item)
-
-            # Ports - using AUTOSAR-style icons
-            # ■▶ = Provided (sender/server) - filled square with arrow out
-            # □◀ = Required (receiver/client) - empty square with arrow in
-            for port in swc.ports:
-                if port.direction == PortDirection.PROVIDED:
-                    icon = "▶■"  # Provided: arrow out from filled square
-                else:
-                    icon = "□◀"  # Required: arrow in to empty square
-                # Show connection status
-                connections = self.project.get_connections_for_port(port.uid)
-                conn_indicator = " 🔗" if connections else ""
-                port_item = QTreeWidgetItem([f"  {icon} {port.name}{conn_indicator}"])
-                port_item.setData(0, Qt.ItemDataRole.UserRole, port)
-                port_item.setData(0, Qt.ItemDataRole.UserRole + 1, "port")
-                port_item.setData(0, Qt.ItemDataRole.UserRole + 2, swc)
-                swc_item.addChild(port_item)
-
-            # Runnables
-            for run in swc.runnables:
-                # Show trigger type icon
-                trigger_icons = {
-                    RunnableTrigger.TIMING: "⏱️",
-                    RunnableTrigger.OPERATION_INVOKED: "⚡",
-                    RunnableTrigger.DATA_RECEIVED: "📨",
+        # One pass over the connections instead of one per port
+        self.project.rebuild_indexes()
+        
+        # One layout/paint pass and no selection signals for the whole rebuild
+        tree = self.tree
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            # Remember which rows the user has open; None on the first build
+            expanded_keys = None
+            if tree.topLevelItemCount():
+                expanded_keys = {
+                    self._item_key(item) for item in self._iter_items()
+                    if item.isExpanded()
                 }
-                trigger_icon = trigger_icons.get(run.trigger, "▷")
-                run_item = QTreeWidgetItem([f"  {trigger_icon} {run.name}"])
-                run_item.setData(0, Qt.ItemDataRole.UserRole, run)
-                run_item.setData(0, Qt.ItemDataRole.UserRole + 1, "runnable")
-                run_item.setData(0, Qt.ItemDataRole.UserRole + 2, swc)
-                swc_item.addChild(run_item)
-
-        # ==========================================================================
-        # CONNECTIONS FOLDER
-        # ==========================================================================
-        conns_folder = QTreeWidgetItem(["📂 Connections"])
-        conns_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "connections_folder")
-        root.addChild(conns_folder)
-
-        for conn in self.project.connections:
-            conn_item = QTreeWidgetItem([f"🔌 {conn.name}"])
-            conn_item.setData(0, Qt.ItemDataRole.UserRole, conn)
-            conn_item.setData(0, Qt.ItemDataRole.UserRole + 1, "connection")
-            conns_folder.addChild(conn_item)
-
-        # Expand main folders
-        root.setExpanded(True)
-        types_folder.setExpanded(True)
-        ifaces_folder.setExpanded(True)
-        comps_folder.setExpanded(True)
-        conns_folder.setExpanded(True)
+
+            # Items are about to be deleted; the index is refilled below
+            self._item_by_uid.clear()
+            self._obj_by_uid.clear()
+            self._pending_children.clear()
+            self.tree.clear()
+
+            # Project root
+            root = _tree_item(ICON_PROJECT, self.project.name)
+            root.setData(0, Qt.ItemDataRole.UserRole + 1, "project")
+            self.tree.addTopLevelItem(root)
+
+            # ==========================================================================
+            # DATA TYPES FOLDER
+            # ==========================================================================
+            types_folder = _tree_item(ICON_FOLDER, "Data Types")
+            types_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "types_folder")
+            root.addChild(types_folder)
+
+            # Compu Methods
+            compu_folder = _tree_item(ICON_FOLDER, "CompuMethods")
+            compu_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "compu_methods_folder")
+            types_folder.addChild(compu_folder)
+            cm_items: list[QTreeWidgetItem] = []
+            for cm in self.project.compu_methods:
+                cm_item = self._register_item(_tree_item(ICON_COMPU_METHOD, cm.name), cm, "compu_method")
+                cm_items.append(cm_item)
+            compu_folder.addChildren(cm_items)
+
+            # Application Data Types
+            app_types_folder = _tree_item(ICON_FOLDER, "Application Types")
+            app_types_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "app_types_folder")
+            types_folder.addChild(app_types_folder)
+            adt_items: list[QTreeWidgetItem] = []
+            for adt in self.project.application_data_types:
+                adt_item = self._register_item(_tree_item(ICON_APP_TYPE, adt.name), adt, "app_data_type")
+                adt_items.append(adt_item)
+            app_types_folder.addChildren(adt_items)
+
+            # Implementation Data Types
+            impl_types_folder = _tree_item(ICON_FOLDER, "Implementation Types")
+            impl_types_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "impl_types_folder")
+            types_folder.addChild(impl_types_folder)
+            idt_items: list[QTreeWidgetItem] = []
+            for idt in self.project.implementation_data_types:
+                idt_item = self._register_item(_tree_item(ICON_IMPL_TYPE, idt.name), idt, "impl_data_type")
+                idt_items.append(idt_item)
+            impl_types_folder.addChildren(idt_items)
+
+            # ==========================================================================
+            # INTERFACES FOLDER
+            # ==========================================================================
+            ifaces_folder = _tree_item(ICON_FOLDER, "Interfaces")
+            ifaces_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "interfaces_folder")
+            root.addChild(ifaces_folder)
+
+            iface_items = [self._make_interface_item(iface) for iface in self.project.interfaces]
+            ifaces_folder.addChildren(iface_items)
+
+            # ==========================================================================
+            # COMPONENTS FOLDER
+            # ==========================================================================
+            comps_folder = _tree_item(ICON_FOLDER, "Software Components")
+            comps_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "components_folder")
+            root.addChild(comps_folder)
+
+            swc_items = [self._make_swc_item(swc) for swc in self.project.components]
+            comps_folder.addChildren(swc_items)
+
+            # ==========================================================================
+            # CONNECTIONS FOLDER
+            # ==========================================================================
+            conns_folder = _tree_item(ICON_FOLDER, "Connections")
+            conns_folder.setData(0, Qt.ItemDataRole.UserRole + 1, "connections_folder")
+            root.addChild(conns_folder)
+
+            conn_items = [self._make_connection_item(conn) for conn in self.project.connections]
+            conns_folder.addChildren(conn_items)
+
+            # Parents of the rows that the add handlers insert without a rebuild
+            self._node_compu = compu_folder
+            self._node_app_types = app_types_folder
+            self._node_impl_types = impl_types_folder
+            self._node_interfaces = ifaces_folder
+            self._node_components = comps_folder
+            self._node_connections = conns_folder
+
+            if expanded_keys is None:
+                # Expand main folders
+                root.setExpanded(True)
+                types_folder.setExpanded(True)
+                ifaces_folder.setExpanded(True)
+                comps_folder.setExpanded(True)
+                conns_folder.setExpanded(True)
+            else:
+                for item in self._iter_items():
+                    if self._item_key(item) in expanded_keys:
+                        # itemExpanded is blocked here, so build deferred rows now
+                        if self._has_pending_children(item):
+                            self._fetch_children(item)
+                        item.setExpanded(True)
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
         
-        # Restore selection if we had one
+        # Restore selection if we had one; no selection signal was emitted, so
+        # the editor keeps showing the same object without being reloaded
         if selected_uid and preserve_selection:
             self._select_item_by_uid(selected_uid, selected_type)
+        # ...unless that object is gone (e.g. deleted)
+        current_uid = getattr(self._current_obj, "uid", None)
+        if current_uid is not None and self._find_item(current_uid) is None:
+            self._on_selection_changed()
         
         # Also refresh composition view
         self._refresh_composition_view()
 
+    def _iter_items(self):
+        """Yield every tree item built so far, parents before children."""
+        tree = self.tree
+        stack = [tree.topLevelItem(i) for i in range(tree.topLevelItemCount())]
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(item.child(i) for i in range(item.childCount()))
+
+    @staticmethod
+    def _item_key(item: QTreeWidgetItem):
+        """Key identifying an item across rebuilds: its uid, or its kind for folders."""
+        return item.data(0, Qt.ItemDataRole.UserRole) or item.data(0, Qt.ItemDataRole.UserRole + 1)
+
+    def _defer_children(self, item: QTreeWidgetItem, build, obj):
+        """Show an expand arrow on item and build its children on first expand."""
+        item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+        self._pending_children[obj.uid] = (build, obj)
+
+    def _has_pending_children(self, item: QTreeWidgetItem) -> bool:
+        return item.data(0, Qt.ItemDataRole.UserRole) in self._pending_children
+
+    def _fetch_children(self, item: QTreeWidgetItem):
+        build, obj = self._pending_children.pop(item.data(0, Qt.ItemDataRole.UserRole))
+        build(item, obj)
+        item.setChildIndicatorPolicy(
+            QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless)
+
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        if self._has_pending_children(item):
+            self._fetch_children(item)
+
+    def _find_item(self, uid: str):
+        """Tree item for uid, building the deferred children that contain it."""
+        if self._rebuild_timer.isActive():
+            # The rows still show the previous project state
+            self._refresh_tree_now()
+        item = self._item_by_uid.get(uid)
+        if item is None:
+            for parent_uid, (build, obj) in self._pending_children.items():
+                if isinstance(obj, SoftwareComponent):
+                    children = obj.ports + obj.runnables
+                else:
+                    children = obj.data_elements + obj.operations
+                if any(child.uid == uid for child in children):
+                    self._fetch_children(self._item_by_uid[parent_uid])
+                    return self._item_by_uid.get(uid)
+        return item
+
+    def _item_obj(self, item: QTreeWidgetItem):
+        """Model object shown by a tree item, or None for folders."""
+        if item is None:
+            return None
+        if item.data(0, Qt.ItemDataRole.UserRole + 1) == "project":
+            return self.project
+        return self._obj_by_uid.get(item.data(0, Qt.ItemDataRole.UserRole))
+
+    def _build_interface_children(self, iface_item: QTreeWidgetItem, iface: Interface):
+        """Add data element / operation items under an interface item."""
+        if iface.interface_type == InterfaceType.SENDER_RECEIVER:
+            items = [self._make_data_element_item(de) for de in iface.data_elements]
+        else:
+            items = [self._make_operation_item(op) for op in iface.operations]
+        iface_item.addChildren(items)
+
+    def _build_swc_children(self, swc_item: QTreeWidgetItem, swc: SoftwareComponent):
+        """Add port and runnable items under an SWC item."""
+        items = [self._make_port_item(port) for port in swc.ports]
+        items += [self._make_runnable_item(run) for run in swc.runnables]
+        swc_item.addChildren(items)
+
+    def _register_item(self, item: QTreeWidgetItem, obj, item_type: str) -> QTreeWidgetItem:
+        """Attach obj to item and index both by obj's uid."""
+        item.setData(0, Qt.ItemDataRole.UserRole, obj.uid)
+        item.setData(0, Qt.ItemDataRole.UserRole + 1, item_type)
+        self._item_by_uid[obj.uid] = item
+        self._obj_by_uid[obj.uid] = obj
+        return item
+
+    def _make_leaf_item(self, icon: str, item_type: str, obj) -> QTreeWidgetItem:
+        return self._register_item(_tree_item(icon, obj.name), obj, item_type)
+
+    def _make_interface_item(self, iface: Interface) -> QTreeWidgetItem:
+        icon = ICON_SR_INTERFACE if iface.interface_type == InterfaceType.SENDER_RECEIVER else ICON_CS_INTERFACE
+        item = self._register_item(_tree_item(icon, iface.name), iface, "interface")
+        if iface.interface_type == InterfaceType.SENDER_RECEIVER:
+            has_children = bool(iface.data_elements)
+        else:
+            has_children = bool(iface.operations)
+        if has_children:
+            self._defer_children(item, self._build_interface_children, iface)
+        return item
+
+    def _make_swc_item(self, swc: SoftwareComponent) -> QTreeWidgetItem:
+        item = self._register_item(_tree_item(ICON_SWC, swc.name), swc, "swc")
+        if swc.ports or swc.runnables:
+            self._defer_children(item, self._build_swc_children, swc)
+        return item
+
+    def _make_connection_item(self, conn: PortConnection) -> QTreeWidgetItem:
+        return self._register_item(_tree_item(ICON_CONNECTION, conn.name), conn, "connection")
+
+    def _make_data_element_item(self, de: DataElement) -> QTreeWidgetItem:
+        return self._register_item(_tree_item(ICON_DATA_ELEMENT, de.name), de, "data_element")
+
+    def _make_operation_item(self, op: Operation) -> QTreeWidgetItem:
+        return self._register_item(_tree_item(ICON_OPERATION, op.name), op, "operation")
+
+    def _make_port_item(self, port: Port) -> QTreeWidgetItem:
+        # Ports - using AUTOSAR-style icons
+        icon = ICON_PROVIDED_PORT if port.direction == PortDirection.PROVIDED else ICON_REQUIRED_PORT
+        # Show connection status
+        conn_indicator = CONN_INDICATOR if self.project.is_port_connected(port.uid) else ""
+        item = _tree_item(icon, f"{port.name}{conn_indicator}")
+        return self._register_item(item, port, "port")
+
+    def _make_runnable_item(self, run: Runnable) -> QTreeWidgetItem:
+        # Show trigger type icon
+        trigger_icon = TRIGGER_ICONS.get(run.trigger, ICON_RUNNABLE)
+        return self._register_item(_tree_item(trigger_icon, run.name), run, "runnable")
+
+    def _insert_child_row(self, parent_item: QTreeWidgetItem, index: int, item_factory, obj):
+        """Show obj, just added to parent_item's object, without rebuilding the tree."""
+        if self._has_pending_children(parent_item):
+            # The deferred build picks obj up with its siblings
+            self._fetch_children(parent_item)
+        else:
+            parent_item.insertChild(index, item_factory(obj))
+        self._modified = True
+        self.project.touch()
+        self._editors_stale = True
+        self._select_and_edit_item(obj.uid)
+        self._update_title()
+
+    def _remove_rows(self, uids):
+        """Drop the tree rows (if built) and index entries of the given uids."""
+        with QSignalBlocker(self.tree):
+            for uid in uids:
+                self._obj_by_uid.pop(uid, None)
+                item = self._item_by_uid.pop(uid, None)
+                if item is None:
+                    continue
+                self._pending_children.pop(uid, None)
+                parent = item.parent()
+                if parent is not None:
+                    parent.removeChild(item)
+
+    def _refresh_conn_indicators(self, port_uids):
+        """Update the 🔗 marker after connections to these ports changed."""
+        for uid in port_uids:
+            item = self._item_by_uid.get(uid)
+            if item is not None:
+                self._update_item_text(item)
+
     def _select_item_by_uid(self, uid: str, item_type: str = None):
         """Find and select a tree item by its object's UID."""
-        def find_item(parent_item):
-            for i in range(parent_item.childCount()):
-                child = parent_item.child(i)
-                obj = child.data(0, Qt.ItemDataRole.UserRole)
-                if obj and hasattr(obj, 'uid') and obj.uid == uid:
-                    return child
-                # Recurse into children
-                found = find_item(child)
-                if found:
-                    return found
-            return None
-        
-        # Search from root
-        for i in range(self.tree.topLevelItemCount()):
-            root = self.tree.topLevelItem(i)
-            obj = root.data(0, Qt.ItemDataRole.UserRole)
-            if obj and hasattr(obj, 'uid') and obj.uid == uid:
-                self.tree.setCurrentItem(root)
-                return
-            found = find_item(root)
-            if found:
-                # Block signals to prevent triggering selection change handler
-                self.tree.blockSignals(True)
-                self.tree.setCurrentItem(found)
-                self.tree.blockSignals(False)
-                return
+        item = self._find_item(uid)
+        if item is not None:
+            # Block signals to prevent triggering selection change handler
+            self.tree.blockSignals(True)
+            self.tree.setCurrentItem(item)
+            self.tree.blockSignals(False)
 
     def _select_and_edit_item(self, uid: str):
         """Find, select, and show editor for a tree item by its UID."""
-        def find_item(parent_item):
-            for i in range(parent_item.childCount()):
-                child = parent_item.child(i)
-                obj = child.data(0, Qt.ItemDataRole.UserRole)
-                if obj and hasattr(obj, 'uid') and obj.uid == uid:
-                    return child
-                found = find_item(child)
-                if found:
-                    return found
-            return None
+        item = self._find_item(uid)
+        if item is None:
+            return
+        # First expand all parents to make sure item is visible
+        parent = item.parent()
+        while parent:
+            parent.setExpanded(True)
+            parent = parent.parent()
         
-        # Search from root
-        for i in range(self.tree.topLevelItemCount()):
-            root = self.tree.topLevelItem(i)
-            obj = root.data(0, Qt.ItemDataRole.UserRole)
-            if obj and hasattr(obj, 'uid') and obj.uid == uid:
-                self.tree.setCurrentItem(root)
-                self.tree.scrollToItem(root)
-                return
-            found = find_item(root)
-            if found:
-                # First expand all parents to make sure item is visible
-                parent = found.parent()
-                while parent:
-                    parent.setExpanded(True)
-                    parent = parent.parent()
-                
-                # Now select the item (this will trigger _on_selection_changed)
-                self.tree.setCurrentItem(found)
-                self.tree.scrollToItem(found)
-                return
+        # Now select the item (this will trigger _on_selection_changed)
+        self.tree.setCurrentItem(item)
+        self.tree.scrollToItem(item)
 
     def _on_selection_changed(self):
         """Handle tree selection change."""
+        # Deliver any pending (debounced) edit while it still targets the old item
+        self._flush_editor_changes()
+
         items = self.tree.selectedItems()
         if not items:
-            self.editor_stack.setCurrentIndex(0)
+            self._current_obj = None
+            self.editor_stack.setCurrentWidget(self.welcome_panel)
             return
 
+        # Re-selecting the same object is a no-op for the editor unless the
+        # project changed since the editor was last populated
+        force = self._editors_stale
+        self._editors_stale = False
+
         item = items[0]
         item_type = item.data(0, Qt.ItemDataRole.UserRole + 1)
-        obj = item.data(0, Qt.ItemDataRole.UserRole)
+        obj = self._item_obj(item)
+        self._current_obj = obj
 
-        if item_type == "swc":
-            self.swc_editor.set_swc(obj)
-            self.editor_stack.setCurrentIndex(1)
-        elif item_type == "interface":
-            self.interface_editor.set_interface(obj)
-            self.editor_stack.setCurrentIndex(2)
-        elif item_type == "port":
-            swc = item.data(0, Qt.ItemDataRole.UserRole + 2)
-            self.port_editor.set_port(obj, self.project.interfaces, self.project)
-            self.editor_stack.setCurrentIndex(3)
-        elif item_type == "runnable":
-            swc = item.data(0, Qt.ItemDataRole.UserRole + 2)
-            self.runnable_editor.set_runnable(obj, swc, self.project)
-            self.editor_stack.setCurrentIndex(4)
-        elif item_type == "data_element":
-            self.data_element_editor.set_data_element(obj, self.project.application_data_types)
-            self.editor_stack.setCurrentIndex(5)
-        elif item_type == "operation":
-            self.operation_editor.set_operation(obj, self.project.application_data_types)
-            self.editor_stack.setCurrentIndex(6)
-        elif item_type == "app_data_type":
-            self.app_type_editor.set_app_type(obj, self.project.compu_methods)
-            self.editor_stack.setCurrentIndex(7)
-        elif item_type == "impl_data_type":
-            self.impl_type_editor.set_impl_type(obj)
-            self.editor_stack.setCurrentIndex(8)
-        elif item_type == "compu_method":
-            self.compu_method_editor.set_compu_method(obj)
-            self.editor_stack.setCurrentIndex(9)
-        elif item_type == "connection":
-            self.connection_editor.set_connection(obj, self.project)
-            self.editor_stack.setCurrentIndex(10)
+        set_editor = self._editor_dispatch.get(item_type)
+        if set_editor is None:
+            editor = self.welcome_panel
         else:
-            self.editor_stack.setCurrentIndex(0)
+            editor = self._get_editor(item_type)
+            set_editor(editor, obj, item, force)
+
+        self.editor_stack.setCurrentWidget(editor)
+
+    def _get_editor(self, kind: str) -> QWidget:
+        """Editor for items of the given kind, created on first use."""
+        editor = self._editors.get(kind)
+        if editor is None:
+            editor = self._editor_factories[kind]()
+            editor.changed.connect(self._on_editor_changed)
+            if kind == "operation":
+                editor.modified_no_tree.connect(self._on_op_lightweight_modified)
+            elif kind == "connection":
+                editor.modified.connect(self._on_connection_modified)
+            self.editor_stack.addWidget(editor)
+            self._editors[kind] = editor
+        return editor
 
     def _on_editor_changed(self):
         """Handle editor value changes."""
         self._modified = True
+        self.project.touch()
+        self._editors_stale = True
         self._update_title()
         
-        # Check if we should skip tree refresh (e.g., for operation argument changes)
-        sender = self.sender()
-        skip_tree = getattr(sender, '_skip_tree_refresh', False) if sender else False
-        
-        if not skip_tree:
-            # Instead of full refresh, just update the selected item's text
-            self._update_selected_item_text()
-            self._refresh_composition_view()
+        # Instead of full refresh, just update the edited object's row; the
+        # row is cheap, the diagram is redrawn once the edits settle
+        self._refresh_item(self._current_obj)
+        self._queue_composition_update(self._current_obj)
+
+    def _queue_composition_update(self, obj):
+        """Update obj's diagram items once the edits settle."""
+        if obj is not None and not any(o is obj for o in self._composition_pending):
+            self._composition_pending.append(obj)
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Redraw the views that follow edits, after the debounce interval."""
+        pending, self._composition_pending = self._composition_pending, []
+        self._refresh_composition_view(pending)
+
+    def _on_op_lightweight_modified(self):
+        """Handle operation argument edits, which don't show in the tree."""
+        self._modified = True
+        self.project.touch()
+        self._editors_stale = True
+        self._update_title()
 
-    def _update_selected_item_text(self):
-        """Update just the selected tree item's display text without full refresh."""
-        items = self.tree.selectedItems()
-        if not items:
+    def _on_connection_modified(self, conn_uid: str):
+        """Handle a connection rename/description edit: update only its row."""
+        self._modified = True
+        self.project.touch()
+        self._editors_stale = True
+        self._update_title()
+
+        item = self._item_by_uid.get(conn_uid)
+        if item is not None:
+            self._update_item_text(item)
+            # Connection tooltips in the composition view show the name
+            self._queue_composition_update(self._obj_by_uid.get(conn_uid))
+
+    def _flush_editor_changes(self):
+        """Emit the visible editor's debounced change signal, if one is pending."""
+        editor = self.editor_stack.currentWidget()
+        flush = getattr(editor, "flush_pending_change", None)
+        if flush is not None:
+            flush()
+
+    def _refresh_item(self, obj):
+        """Update the tree row showing obj without rebuilding the tree."""
+        # obj is the edited object, which is not always the selected one: a
+        # debounced change is flushed during a selection change
+        item = self._item_by_uid.get(getattr(obj, "uid", None))
+        if item is None:
             return
-        
-        item = items[0]
+        self._update_item_text(item)
+
+    def _update_item_text(self, item: QTreeWidgetItem):
+        """Update just one tree item's display text without full refresh."""
         item_type = item.data(0, Qt.ItemDataRole.UserRole + 1)
-        obj = item.data(0, Qt.ItemDataRole.UserRole)
+        obj = self._item_obj(item)
         
         if not obj:
             return
         
-        # Update the item text based on type
-        if item_type == "swc":
-            item.setText(0, f"📦 {obj.name}")
-        elif item_type == "interface":
-            icon = "🔗" if obj.interface_type == InterfaceType.SENDER_RECEIVER else "⚡"
-            item.setText(0, f"{icon} {obj.name}")
+        # Only these kinds have an icon that depends on the object's state
+        if item_type == "interface":
+            icon = ICON_SR_INTERFACE if obj.interface_type == InterfaceType.SENDER_RECEIVER else ICON_CS_INTERFACE
+            item.setIcon(0, _tree_icon(icon))
         elif item_type == "port":
-            # AUTOSAR-style port icons
-            if obj.direction == PortDirection.PROVIDED:
-                icon = "▶■"  # Provided
-            else:
-                icon = "□◀"  # Required
-            connections = self.project.get_connections_for_port(obj.uid)
-            conn_indicator = " 🔗" if connections else ""
-            item.setText(0, f"  {icon} {obj.name}{conn_indicator}")
+            icon = ICON_PROVIDED_PORT if obj.direction == PortDirection.PROVIDED else ICON_REQUIRED_PORT
+            item.setIcon(0, _tree_icon(icon))
+            conn_indicator = CONN_INDICATOR if self.project.is_port_connected(obj.uid) else ""
+            item.setText(0, f"{obj.name}{conn_indicator}")
+            return
         elif item_type == "runnable":
-            trigger_icons = {
-                RunnableTrigger.TIMING: "⏱️",
-                RunnableTrigger.OPERATION_INVOKED: "⚡",
-                RunnableTrigger.DATA_RECEIVED: "📨",
-            }
-            trigger_icon = trigger_icons.get(obj.trigger, "▷")
-            item.setText(0, f"  {trigger_icon} {obj.name}")
-        elif item_type == "data_element":
-            item.setText(0, f"  📊 {obj.name}")
-        elif item_type == "operation":
-            item.setText(0, f"  ⚙️ {obj.name}")
-        elif item_type == "app_data_type":
-            item.setText(0, f"🔷 {obj.name}")
-        elif item_type == "impl_data_type":
-            item.setText(0, f"🔶 {obj.name}")
-        elif item_type == "compu_method":
-            item.setText(0, f"📐 {obj.name}")
-        elif item_type == "connection":
-            item.setText(0, f"🔌 {obj.name}")
-        elif item_type == "project":
-            item.setText(0, f"📁 {obj.name}")
-
-    def _refresh_composition_view(self):
-        """Refresh the graphical composition view."""
-        self.composition_view.load_project(self.project)
+            item.setIcon(0, _tree_icon(TRIGGER_ICONS.get(obj.trigger, ICON_RUNNABLE)))
+        item.setText(0, obj.name)
+
+    def _refresh_composition_view(self, changed_objs: list = None):
+        """Refresh the graphical composition view.
+
+        With changed_objs, only the diagram items showing those objects are
+        updated; the whole project is reloaded if the view can't do that.
+        """
+        # Covers any debounced refresh still pending
+        self._refresh_timer.stop()
+        view = self.composition_view
+        if self.right_tabs.currentWidget() is not view:
+            # Nothing to see; redraw everything once the tab is shown
+            self._composition_pending.clear()
+            self._composition_dirty = True
+            return
+        self._composition_dirty = False
+        view.setUpdatesEnabled(False)
+        try:
+            if changed_objs is None or not all(view.update_item(obj) for obj in changed_objs):
+                self._composition_pending.clear()
+                view.load_project(self.project)
+        finally:
+            view.setUpdatesEnabled(True)
+
+    def _on_right_tab_changed(self, index: int):
+        if self._composition_dirty and self.right_tabs.widget(index) is self.composition_view:
+            self._refresh_composition_view()
 
     def _update_title(self):
         """Update window title."""
+        state = (self.project.name, self._modified)
+        if state == self._title_state:
+            return
+        self._title_state = state
         title = f"AUTOSAR Designer - {self.project.name}"
         if self._modified:
             title += " *"
         self.setWindowTitle(title)
 
+    def _show_status(self, message: str):
+        """Show a status bar message unless it is already displayed."""
+        status_bar = self.statusBar()
+        if status_bar.currentMessage() != message:
+            status_bar.showMessage(message)
+
     # --- Project operations ---
 
     def _new_project(self):
         """Create a new project."""
+        self._flush_editor_changes()
         if self._modified:
             reply = QMessageBox.question(
                 self, "Unsaved Changes",
@@ -769,42 +1073,71 @@ class MainWindow(QMainWindow):
         self._modified = False
         self._refresh_tree()
         self._update_title()
-        self.statusBar().showMessage("New project created")
+        self._show_status("New project created")
 
     def _open_project(self):
-        """Open a project from YAML file."""
+        """Open a project from a JSON or YAML file."""
+        self._flush_editor_changes()
         filepath, _ = QFileDialog.getOpenFileName(
-            self, "Open Project", "", "YAML Files (*.yaml *.yml);;All Files (*)"
+            self, "Open Project", "",
+            "Project Files (*.json *.yaml *.yml);;All Files (*)"
         )
         if filepath:
-            try:
-                self.project = load_project(Path(filepath))
-                self.project_path = Path(filepath)
-                self._modified = False
-                self._refresh_tree()
-                self._update_title()
-                self.statusBar().showMessage(f"Opened: {filepath}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to open project:\n{e}")
+            self._set_io_busy(True, f"Loading {filepath}…")
+            self._load_requested.emit(filepath)
+
+    def _on_project_loaded(self, project: Project, filepath: str, error: str):
+        """Show a project read by the I/O worker."""
+        self._set_io_busy(False)
+        if project is None:
+            self._show_status("Ready")
+            QMessageBox.critical(self, "Error", f"Failed to open project:\n{error}")
+            return
+        self.project = project
+        self.project_path = Path(filepath)
+        self._modified = False
+        self._refresh_tree()
+        self._update_title()
+        self._show_status(f"Opened: {filepath}")
 
     def _save_project(self):
         """Save the current project."""
+        if self._saving is not None:
+            # The previous save has not finished; its completion pairs with _saving
+            self._show_status("A save is already in progress")
+            return
+        self._flush_editor_changes()
         if self.project_path is None:
             self._save_project_as()
         else:
-            try:
-                save_project(self.project, self.project_path)
-                self._modified = False
-                self._update_title()
-                self.statusBar().showMessage(f"Saved: {self.project_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save project:\n{e}")
+            # Snapshot now; the worker only writes the file, so editing can go on
+            self._saving = (self.project, self.project.version_counter)
+            self._set_io_busy(True, f"Saving {self.project_path}…")
+            self._save_requested.emit(self.project.to_dict(), str(self.project_path))
+
+    def _on_project_saved(self, filepath: str, error: str):
+        """Finish a save written by the I/O worker."""
+        self._set_io_busy(False)
+        project, version = self._saving
+        self._saving = None
+        if error:
+            self._show_status("Ready")
+            QMessageBox.critical(self, "Error", f"Failed to save project:\n{error}")
+            return
+        # Edits made while the file was being written are still unsaved
+        if project is self.project and project.version_counter == version:
+            self._modified = False
+            self._update_title()
+        self._show_status(f"Saved: {filepath}")
 
     def _save_project_as(self):
         """Save project to a new file."""
+        if self._saving is not None:
+            self._show_status("A save is already in progress")
+            return
         filepath, _ = QFileDialog.getSaveFileName(
-            self, "Save Project", f"{self.project.name}.yaml",
-            "YAML Files (*.yaml);;All Files (*)"
+            self, "Save Project", f"{self.project.name}.json",
+            "JSON Files (*.json);;YAML Files (*.yaml *.yml);;All Files (*)"
         )
         if filepath:
             self.project_path = Path(filepath)
@@ -812,6 +1145,7 @@ class MainWindow(QMainWindow):
 
     def _load_example(self):
         """Load the example project."""
+        self._flush_editor_changes()
         if self._modified:
             reply = QMessageBox.question(
                 self, "Unsaved Changes",
@@ -826,7 +1160,7 @@ class MainWindow(QMainWindow):
         self._modified = False
         self._refresh_tree()
         self._update_title()
-        self.statusBar().showMessage("Example project loaded")
+        self._show_status("Example project loaded")
 
     # --- Add operations ---
 
@@ -834,132 +1168,116 @@ class MainWindow(QMainWindow):
         """Add a new software component."""
         name = f"Swc_New{len(self.project.components) + 1}"
         swc = SoftwareComponent(name=name)
-        self.project.components.append(swc)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(swc.uid)
-        self._update_title()
-        self.statusBar().showMessage(f"Added component: {name}")
+        self.project.add_component(swc)
+        nodes = self._node_components
+        self._insert_child_row(nodes, nodes.childCount(), self._make_swc_item, swc)
+        self._refresh_composition_view()
+        self._show_status(f"Added component: {name}")
 
     def _add_interface(self):
         """Add a new interface."""
         name = f"If_New{len(self.project.interfaces) + 1}"
         iface = Interface(name=name)
-        self.project.interfaces.append(iface)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(iface.uid)
-        self._update_title()
-        self.statusBar().showMessage(f"Added interface: {name}")
+        self.project.add_interface(iface)
+        nodes = self._node_interfaces
+        self._insert_child_row(nodes, nodes.childCount(), self._make_interface_item, iface)
+        self._show_status(f"Added interface: {name}")
 
     def _add_port(self, swc_item: QTreeWidgetItem):
         """Add a port to an SWC."""
-        swc = swc_item.data(0, Qt.ItemDataRole.UserRole)
+        swc = self._item_obj(swc_item)
         name = f"Port_{len(swc.ports) + 1}"
         port = Port(name=name)
-        swc.ports.append(port)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(port.uid)
-        self._update_title()
+        swc.add_port(port)
+        # Ports are listed before the runnables
+        self._insert_child_row(swc_item, len(swc.ports) - 1, self._make_port_item, port)
+        self._queue_composition_update(swc)
 
     def _add_runnable(self, swc_item: QTreeWidgetItem):
         """Add a runnable to an SWC."""
-        swc = swc_item.data(0, Qt.ItemDataRole.UserRole)
+        swc = self._item_obj(swc_item)
         name = f"Run_{len(swc.runnables) + 1}"
         runnable = Runnable(name=name)
         swc.runnables.append(runnable)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(runnable.uid)
-        self._update_title()
+        self._insert_child_row(swc_item, swc_item.childCount(), self._make_runnable_item, runnable)
+        # The SWC block shows the runnable count
+        self._queue_composition_update(swc)
 
     def _add_data_element(self, iface_item: QTreeWidgetItem):
         """Add a data element to an interface."""
-        iface = iface_item.data(0, Qt.ItemDataRole.UserRole)
+        iface = self._item_obj(iface_item)
         name = f"DataElement_{len(iface.data_elements) + 1}"
         de = DataElement(name=name)
         iface.data_elements.append(de)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(de.uid)
-        self._update_title()
+        self._insert_child_row(iface_item, iface_item.childCount(), self._make_data_element_item, de)
 
     def _add_operation(self, iface_item: QTreeWidgetItem):
         """Add an operation to an interface."""
-        iface = iface_item.data(0, Qt.ItemDataRole.UserRole)
+        iface = self._item_obj(iface_item)
         name = f"Operation_{len(iface.operations) + 1}"
         op = Operation(name=name)
         iface.operations.append(op)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(op.uid)
-        self._update_title()
+        self._insert_child_row(iface_item, iface_item.childCount(), self._make_operation_item, op)
 
     def _add_app_data_type(self):
         """Add a new application data type."""
         name = f"AppType_{len(self.project.application_data_types) + 1}"
         adt = ApplicationDataType(name=name)
-        self.project.application_data_types.append(adt)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(adt.uid)
-        self._update_title()
-        self.statusBar().showMessage(f"Added application type: {name}")
+        self.project.add_app_type(adt)
+        nodes = self._node_app_types
+        self._insert_child_row(
+            nodes, nodes.childCount(), partial(self._make_leaf_item, ICON_APP_TYPE, "app_data_type"), adt)
+        self._show_status(f"Added application type: {name}")
 
     def _add_impl_data_type(self):
         """Add a new implementation data type."""
         name = f"ImplType_{len(self.project.implementation_data_types) + 1}"
         idt = ImplementationDataType(name=name)
-        self.project.implementation_data_types.append(idt)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(idt.uid)
-        self._update_title()
-        self.statusBar().showMessage(f"Added implementation type: {name}")
+        self.project.add_impl_type(idt)
+        nodes = self._node_impl_types
+        self._insert_child_row(
+            nodes, nodes.childCount(), partial(self._make_leaf_item, ICON_IMPL_TYPE, "impl_data_type"), idt)
+        self._show_status(f"Added implementation type: {name}")
 
     def _add_compu_method(self):
         """Add a new compu method."""
         name = f"CM_{len(self.project.compu_methods) + 1}"
         cm = CompuMethod(name=name)
-        self.project.compu_methods.append(cm)
-        self._modified = True
-        self._refresh_tree(preserve_selection=False)
-        self._select_and_edit_item(cm.uid)
-        self._update_title()
-        self.statusBar().showMessage(f"Added CompuMethod: {name}")
+        self.project.add_compu_method(cm)
+        nodes = self._node_compu
+        self._insert_child_row(
+            nodes, nodes.childCount(), partial(self._make_leaf_item, ICON_COMPU_METHOD, "compu_method"), cm)
+        self._show_status(f"Added CompuMethod: {name}")
 
     def _add_connection(self):
         """Add a new port connection via dialog."""
-        from gui.dialogs import ConnectionDialog
         dialog = ConnectionDialog(self.project, self)
         if dialog.exec():
             conn = dialog.get_connection()
             if conn:
-                self.project.connections.append(conn)
-                self._modified = True
-                self._refresh_tree(preserve_selection=False)
-                self._select_and_edit_item(conn.uid)
-                self._update_title()
-                self.statusBar().showMessage(f"Added connection: {conn.name}")
+                self._insert_connection(conn)
 
     def _create_connection_from_port(self, provider_swc: SoftwareComponent, provider_port: Port):
         """Create a connection starting from a provided port."""
-        from gui.dialogs import ConnectionDialog
         dialog = ConnectionDialog(self.project, self, provider_swc, provider_port)
         if dialog.exec():
             conn = dialog.get_connection()
             if conn:
-                self.project.connections.append(conn)
-                self._modified = True
-                self._refresh_tree()
-                self._update_title()
-                self.statusBar().showMessage(f"Added connection: {conn.name}")
+                self._insert_connection(conn)
+
+    def _insert_connection(self, conn: PortConnection):
+        """Add a connection created by ConnectionDialog to the project and views."""
+        self.project.add_connection(conn)
+        nodes = self._node_connections
+        self._insert_child_row(nodes, nodes.childCount(), self._make_connection_item, conn)
+        self._refresh_conn_indicators((conn.provider_port_uid, conn.requester_port_uid))
+        self._refresh_composition_view()
+        self._show_status(f"Added connection: {conn.name}")
 
     def _delete_item(self, item: QTreeWidgetItem):
         """Delete a tree item."""
         item_type = item.data(0, Qt.ItemDataRole.UserRole + 1)
-        obj = item.data(0, Qt.ItemDataRole.UserRole)
+        obj = self._item_obj(item)
 
         reply = QMessageBox.question(
             self, "Confirm Delete",
@@ -969,45 +1287,65 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
+        removed_uids = [obj.uid]
+        removed_conns = []
+        # Cleared for elements the diagram doesn't draw (or redraws in place)
+        reload_diagram = True
         if item_type == "swc":
             # Also remove any connections involving this SWC's ports
             ports_to_remove = [p.uid for p in obj.ports]
-            self.project.connections = [
-                c for c in self.project.connections
-                if c.provider_port_uid not in ports_to_remove and c.requester_port_uid not in ports_to_remove
-            ]
-            self.project.components.remove(obj)
+            removed_conns = self.project.remove_port_connections(ports_to_remove)
+            self.project.remove_component(obj)
+            removed_uids += ports_to_remove + [r.uid for r in obj.runnables]
         elif item_type == "interface":
-            self.project.interfaces.remove(obj)
+            self.project.remove_interface(obj)
+            removed_uids += [c.uid for c in obj.data_elements + obj.operations]
         elif item_type == "port":
-            parent_swc = item.data(0, Qt.ItemDataRole.UserRole + 2)
+            parent_swc = self._item_obj(item.parent())
             # Remove any connections involving this port
-            self.project.connections = [
-                c for c in self.project.connections
-                if c.provider_port_uid != obj.uid and c.requester_port_uid != obj.uid
-            ]
-            parent_swc.ports.remove(obj)
+            removed_conns = self.project.remove_port_connections([obj.uid])
+            parent_swc.remove_port(obj)
         elif item_type == "runnable":
-            parent_swc = item.data(0, Qt.ItemDataRole.UserRole + 2)
-            parent_swc.runnables.remove(obj)
+            parent_swc = self._item_obj(item.parent())
+            parent_swc.remove_runnable(obj)
+            # The SWC block shows the runnable count
+            self._queue_composition_update(parent_swc)
+            reload_diagram = False
         elif item_type == "data_element":
-            parent_iface = item.data(0, Qt.ItemDataRole.UserRole + 2)
-            parent_iface.data_elements.remove(obj)
+            parent_iface = self._item_obj(item.parent())
+            parent_iface.remove_data_element(obj)
+            reload_diagram = False
         elif item_type == "operation":
-            parent_iface = item.data(0, Qt.ItemDataRole.UserRole + 2)
-            parent_iface.operations.remove(obj)
+            parent_iface = self._item_obj(item.parent())
+            parent_iface.remove_operation(obj)
+            reload_diagram = False
         elif item_type == "app_data_type":
-            self.project.application_data_types.remove(obj)
+            self.project.remove_app_type(obj)
+            reload_diagram = False
         elif item_type == "impl_data_type":
-            self.project.implementation_data_types.remove(obj)
+            self.project.remove_impl_type(obj)
+            reload_diagram = False
         elif item_type == "compu_method":
-            self.project.compu_methods.remove(obj)
+            self.project.remove_compu_method(obj)
+            reload_diagram = False
         elif item_type == "connection":
-            self.project.connections.remove(obj)
+            self.project.remove_connection(obj)
+            removed_uids = []
+            removed_conns = [obj]
 
+        # Only the affected rows change; the rest of the tree stays as it is
         self._modified = True
-        self._refresh_tree()
+        self.project.touch()
+        self._editors_stale = True
+        removed_uids += [c.uid for c in removed_conns]
+        self._remove_rows(removed_uids)
+        self._refresh_conn_indicators(
+            uid for c in removed_conns for uid in (c.provider_port_uid, c.requester_port_uid))
+        if getattr(self._current_obj, "uid", None) in removed_uids:
+            self._on_selection_changed()
         self._update_title()
+        if reload_diagram:
+            self._refresh_composition_view()
 
     # --- Code generation ---
 
@@ -1019,16 +1357,25 @@ class MainWindow(QMainWindow):
 
         output_dir = QFileDialog.getExistingDirectory(self, "Select Output Directory")
         if output_dir:
-            try:
-                generated = generate_project_code(self.project, Path(output_dir))
-                file_list = "\n".join([f.name for f in generated])
-                QMessageBox.information(
-                    self, "Code Generated",
-                    f"Generated {len(generated)} files:\n\n{file_list}"
-                )
-                self.statusBar().showMessage(f"Generated {len(generated)} files to {output_dir}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Code generation failed:\n{e}")
+            self._flush_editor_changes()
+            # The worker gets its own copy; edits made meanwhile don't race it
+            snapshot = Project.from_dict(self.project.to_dict())
+            self._set_io_busy(True, f"Generating code to {output_dir}…")
+            self._generate_requested.emit(snapshot, output_dir)
+
+    def _on_code_generated(self, generated: list, output_dir: str, error: str):
+        """Report files written by the code generation worker."""
+        self._set_io_busy(False)
+        if generated is None:
+            self._show_status("Ready")
+            QMessageBox.critical(self, "Error", f"Code generation failed:\n{error}")
+            return
+        file_list = "\n".join(f.name for f in generated)
+        QMessageBox.information(
+            self, "Code Generated",
+            f"Generated {len(generated)} files:\n\n{file_list}"
+        )
+        self._show_status(f"Generated {len(generated)} files to {output_dir}")
 
     def _show_about(self):
         """Show about dialog."""
@@ -0,0 +1,63 @@
+"""
+Background workers for AUTOSAR Designer.
+"""
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from codegen import generate_project_code
+from model import Project, load_project, save_project_dict
+
+
+class ProjectIOWorker(QObject):
+    """Reads and writes project files off the GUI thread.
+
+    Move the worker to a QThread and call its slots through queued
+    signals; each job reports back through loaded/saved.
+    """
+
+    # (project or None, path, error message or "")
+    loaded = pyqtSignal(object, str, str)
+    # (path, error message or "")
+    saved = pyqtSignal(str, str)
+
+    @pyqtSlot(str)
+    def load(self, path: str):
+        """Load the project at path."""
+        try:
+            project = load_project(Path(path))
+        except Exception as e:
+            self.loaded.emit(None, path, str(e))
+        else:
+            self.loaded.emit(project, path, "")
+
+    @pyqtSlot(object, str)
+    def save(self, data: dict, path: str):
+        """Write a project's to_dict() snapshot to path."""
+        try:
+            save_project_dict(data, Path(path))
+        except Exception as e:
+            self.saved.emit(path, str(e))
+        else:
+            self.saved.emit(path, "")
+
+
+class CodeGenWorker(QObject):
+    """Runs code generation off the GUI thread.
+
+    Lives on the same QThread as ProjectIOWorker; pass it a snapshot of
+    the project so editing can go on while files are written.
+    """
+
+    # (generated paths or None, output dir, error message or "")
+    generated = pyqtSignal(object, str, str)
+
+    @pyqtSlot(object, str)
+    def generate(self, project: Project, output_dir: str):
+        """Generate code for project into output_dir."""
+        try:
+            files = generate_project_code(project, Path(output_dir))
+        except Exception as e:
+            self.generated.emit(None, output_dir, str(e))
+        else:
+            self.generated.emit(files, output_dir, "")
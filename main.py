@@ -7,23 +7,47 @@ with YAML-based configuration and Jinja2 code generation.
 """
 import sys
 import subprocess
+from importlib import metadata
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 
+REQUIRED_PACKAGES = {
+    'PyQt6': 'PyQt6>=6.4.0',
+    'yaml': 'PyYAML>=6.0',
+    'jinja2': 'Jinja2>=3.0'
+}
+
+# Written once the dependency check passes; lets later launches skip it
+DEPS_MARKER = Path(__file__).parent / ".deps_ok"
+
+
+def _deps_fingerprint():
+    """Interpreter and installed package versions, or None if any is missing."""
+    try:
+        versions = [
+            f"{spec.split('>=')[0]}=={metadata.version(spec.split('>=')[0])}"
+            for spec in REQUIRED_PACKAGES.values()
+        ]
+    except metadata.PackageNotFoundError:
+        return None
+    return "\n".join([sys.executable, sys.version, *versions])
+
+
 def install_requirements():
     """Automatically install required packages if not available."""
-    required_packages = {
-        'PyQt6': 'PyQt6>=6.4.0',
-        'yaml': 'PyYAML>=6.0',
-        'jinja2': 'Jinja2>=3.0'
-    }
-    
+    fingerprint = _deps_fingerprint()
+    try:
+        if fingerprint is not None and DEPS_MARKER.read_text() == fingerprint:
+            return True
+    except OSError:
+        pass
+
     missing_packages = []
     
-    for module_name, package_spec in required_packages.items():
+    for module_name, package_spec in REQUIRED_PACKAGES.items():
         try:
             __import__(module_name)
         except ImportError:
@@ -46,7 +70,12 @@ def install_requirements():
             print(f"✗ Error installing dependencies: {e}")
             print("Please install manually using: pip install -r requirements.txt")
             return False
-    
+
+    if fingerprint is not None:
+        try:
+            DEPS_MARKER.write_text(fingerprint)
+        except OSError:
+            pass
     return True
 
 
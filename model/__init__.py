@@ -26,7 +26,10 @@ from .elements import (
     # Project
     Project,
 )
-from .project_io import save_project, load_project, create_example_project
+from .project_io import (
+    save_project, save_project_dict, load_project, create_example_project,
+    project_to_json_bytes, project_from_json_bytes,
+)
 from .multifile import (
     ModuleReference,
     MasterProject,
@@ -65,6 +68,9 @@ __all__ = [
     "Project",
     # IO
     "save_project",
+    "save_project_dict",
+    "project_to_json_bytes",
+    "project_from_json_bytes",
     "load_project",
     "create_example_project",
     # Multi-file
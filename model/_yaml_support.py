@@ -0,0 +1,58 @@
+"""
+PyYAML setup shared by project and module file I/O.
+
+Kept out of project_io so that importing the model does not import
+PyYAML; callers import this module inside the functions that read or
+write YAML.
+"""
+import sys
+import yaml
+from .elements import _SchemaMixin
+
+# libyaml-backed C loader/dumper when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_DUMP_OPTIONS = dict(
+    default_flow_style=False,
+    sort_keys=False,
+    allow_unicode=True,
+    indent=2,
+)
+
+
+class _ProjectDumper(_Dumper):
+    """Dumper that emits model elements straight from their attributes."""
+
+    def ignore_aliases(self, data) -> bool:
+        # to_dict() output never shared nodes; keep files free of &anchors
+        return True
+
+
+class _ProjectLoader(_Loader):
+    """Loader that interns mapping keys.
+
+    A project repeats "name", "uid", ... thousands of times; interned,
+    each key is one shared string, including in cached parses.
+    """
+
+    def construct_mapping(self, node, deep=False):
+        mapping = super().construct_mapping(node, deep=deep)
+        return {sys.intern(k) if k.__class__ is str else k: v for k, v in mapping.items()}
+
+
+def _represent_element(dumper, element: _SchemaMixin):
+    return dumper.represent_mapping("tag:yaml.org,2002:map", element.shallow_items())
+
+
+_ProjectDumper.add_multi_representer(_SchemaMixin, _represent_element)
+
+
+def load_yaml(stream):
+    """Parse YAML from bytes, str or an open file."""
+    return yaml.load(stream, Loader=_ProjectLoader)
+
+
+def dump_yaml(data, stream=None, encoding=None):
+    """Emit data (plain values or model elements) as project-style YAML."""
+    return yaml.dump(data, stream, Dumper=_ProjectDumper, encoding=encoding, **_DUMP_OPTIONS)
@@ -11,8 +11,171 @@ Enhanced with:
 """
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
-import uuid
+from typing import Callable, Iterator, NamedTuple, Optional
+import os
+
+
+def _lookup_by_uid(index: dict, items: list, uid: str):
+    """The element of items with this uid, via index (uid -> position in items).
+
+    A hit is checked against items, so a list changed directly never
+    yields a removed element; anything else rebuilds the index. Uids
+    found missing are remembered under index[None] while items' (id, len)
+    stays the same, so dangling references looked up on every redraw
+    do not rebuild it each time.
+    """
+    if uid is None:
+        return None
+    pos = index.get(uid)
+    if pos is not None:
+        if pos < len(items) and items[pos].uid == uid:
+            return items[pos]
+    else:
+        misses = index.get(None)
+        if misses is not None and misses[0] == (id(items), len(items)) and uid in misses[1]:
+            return None
+
+    # items list was changed directly - resync the index
+    stamp = (id(items), len(items))
+    misses = index.get(None)
+    known_missing = misses[1] if misses is not None and misses[0] == stamp else ()
+    index.clear()
+    index.update((item.uid, i) for i, item in enumerate(items))
+    pos = index.get(uid)
+    if pos is not None:
+        return items[pos]
+    index[None] = (stamp, {m for m in known_missing if m not in index} | {uid})
+    return None
+
+
+def _remove_identical(items: list, obj) -> None:
+    """Delete obj from items by identity; list.remove would deep-compare dataclasses."""
+    for i, item in enumerate(items):
+        if item is obj:
+            del items[i]
+            return
+
+
+_UID_BATCH = 1024
+_uid_pool: list[str] = []
+
+
+def _new_uid() -> str:
+    """Random 8-hex-digit uid, cut from one os.urandom() read per batch."""
+    try:
+        return _uid_pool.pop()
+    except IndexError:
+        hexed = os.urandom(4 * _UID_BATCH).hex()
+        _uid_pool.extend(hexed[i:i + 8] for i in range(8, len(hexed), 8))
+        return hexed[:8]
+
+
+# =============================================================================
+# SERIALIZATION SCHEMA
+# =============================================================================
+
+_REQUIRED = object()  # schema default for keys from_dict must find in the data
+
+
+class _Codec(NamedTuple):
+    """Custom (encode, decode) pair for one schema field."""
+    encode: Callable
+    decode: Callable
+
+
+def _enum_value(member: Enum):
+    return member.value
+
+
+def _enum_decoder(enum_cls: type[Enum]) -> Callable:
+    """enum_cls(value) through its value map, skipping Enum.__call__ for known values."""
+    members = enum_cls._value2member_map_
+
+    def decode(value):
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            # Unknown/unhashable value: let the enum raise its usual ValueError
+            return enum_cls(value)
+    return decode
+
+
+def _pairs(first: str, second: str) -> _Codec:
+    """Codec for a tuple of 2-tuples stored as a list of two-key dicts."""
+    return _Codec(
+        lambda items: [{first: a, second: b} for a, b in items],
+        lambda items: tuple((d[first], d[second]) for d in items),
+    )
+
+
+class _SchemaMixin:
+    """
+    Derives to_dict/from_dict from the class' _SCHEMA table.
+
+    Each _SCHEMA entry is (key, kind, default): kind is None for plain
+    values, an Enum class, a _SchemaMixin element class (list of children)
+    or a _Codec; default is the decoded value used when the key is missing,
+    a zero-argument factory, or _REQUIRED.
+    """
+    __slots__ = ()
+    _SCHEMA: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super(_SchemaMixin, cls).__init_subclass__(**kwargs)
+        encoders = []
+        shallow = []
+        decoders = []
+        for key, kind, default in cls._SCHEMA:
+            if kind is None:
+                encode = decode = None
+            elif isinstance(kind, _Codec):
+                encode, decode = kind
+            elif issubclass(kind, Enum):
+                encode, decode = _enum_value, _enum_decoder(kind)
+            else:
+                encode = _encode_list
+                decode = kind._decode_list
+            encoders.append((key, encode))
+            shallow.append((key, None if encode is _encode_list else encode))
+            decoders.append((key, decode, default, callable(default) and default is not _REQUIRED))
+        cls._encoders = tuple(encoders)
+        cls._shallow_encoders = tuple(shallow)
+        cls._decoders = tuple(decoders)
+
+    def to_dict(self) -> dict:
+        return {
+            key: getattr(self, key) if encode is None else encode(getattr(self, key))
+            for key, encode in self._encoders
+        }
+
+    def shallow_items(self) -> list[tuple[str, object]]:
+        """to_dict() as (key, value) pairs, leaving child element lists as objects."""
+        return [
+            (key, getattr(self, key) if encode is None else encode(getattr(self, key)))
+            for key, encode in self._shallow_encoders
+        ]
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        kwargs = {}
+        for key, decode, default, is_factory in cls._decoders:
+            if key in data:
+                value = data[key]
+                kwargs[key] = value if decode is None else decode(value)
+            elif default is _REQUIRED:
+                raise KeyError(key)
+            else:
+                kwargs[key] = default() if is_factory else default
+        return cls(**kwargs)
+
+    @classmethod
+    def _decode_list(cls, items: list) -> list:
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
+
+def _encode_list(items: list) -> list:
+    return [item.to_dict() for item in items]
 
 
 # =============================================================================
@@ -62,8 +225,8 @@ class ArgumentDirection(Enum):
 # COMPU METHODS (Scaling/Conversion)
 # =============================================================================
 
-@dataclass
-class CompuMethod:
+@dataclass(slots=True)
+class CompuMethod(_SchemaMixin):
     """
     Computation method for scaling between physical and internal values.
     physical = (internal * factor) + offset
@@ -73,36 +236,24 @@ class CompuMethod:
     offset: float = 0.0
     unit: str = ""
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "factor": self.factor,
-            "offset": self.offset,
-            "unit": self.unit,
-            "description": self.description,
-            "uid": self.uid,
-        }
+    uid: str = field(default_factory=_new_uid)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "CompuMethod":
-        return cls(
-            name=data["name"],
-            factor=data.get("factor", 1.0),
-            offset=data.get("offset", 0.0),
-            unit=data.get("unit", ""),
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("factor", None, 1.0),
+        ("offset", None, 0.0),
+        ("unit", None, ""),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
 
 
 # =============================================================================
 # DATA TYPES
 # =============================================================================
 
-@dataclass
-class ApplicationDataType:
+@dataclass(slots=True)
+class ApplicationDataType(_SchemaMixin):
     """
     Abstract application-level data type.
     Represents the logical/physical meaning without platform details.
@@ -118,49 +269,29 @@ class ApplicationDataType:
     array_size: int = 1
     element_type_uid: Optional[str] = None  # Reference to another AppDataType
     # For STRUCTURE category
-    struct_members: list[tuple[str, str]] = field(default_factory=list)  # (name, type_uid)
+    struct_members: tuple[tuple[str, str], ...] = ()  # (name, type_uid)
     # For ENUM category
-    enum_literals: list[tuple[str, int]] = field(default_factory=list)  # (name, value)
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "category": self.category.value,
-            "compu_method_uid": self.compu_method_uid,
-            "min_value": self.min_value,
-            "max_value": self.max_value,
-            "init_value": self.init_value,
-            "description": self.description,
-            "array_size": self.array_size,
-            "element_type_uid": self.element_type_uid,
-            "struct_members": [{"name": m[0], "type_uid": m[1]} for m in self.struct_members],
-            "enum_literals": [{"name": e[0], "value": e[1]} for e in self.enum_literals],
-            "uid": self.uid,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "ApplicationDataType":
-        struct_members = [(m["name"], m["type_uid"]) for m in data.get("struct_members", [])]
-        enum_literals = [(e["name"], e["value"]) for e in data.get("enum_literals", [])]
-        return cls(
-            name=data["name"],
-            category=AppDataCategory(data.get("category", "value")),
-            compu_method_uid=data.get("compu_method_uid"),
-            min_value=data.get("min_value"),
-            max_value=data.get("max_value"),
-            init_value=data.get("init_value", "0"),
-            description=data.get("description", ""),
-            array_size=data.get("array_size", 1),
-            element_type_uid=data.get("element_type_uid"),
-            struct_members=struct_members,
-            enum_literals=enum_literals,
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
-
-
-@dataclass
-class ImplementationDataType:
+    enum_literals: tuple[tuple[str, int], ...] = ()  # (name, value)
+    uid: str = field(default_factory=_new_uid)
+
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("category", AppDataCategory, AppDataCategory.VALUE),
+        ("compu_method_uid", None, None),
+        ("min_value", None, None),
+        ("max_value", None, None),
+        ("init_value", None, "0"),
+        ("description", None, ""),
+        ("array_size", None, 1),
+        ("element_type_uid", None, None),
+        ("struct_members", _pairs("name", "type_uid"), ()),
+        ("enum_literals", _pairs("name", "value"), ()),
+        ("uid", None, _new_uid),
+    )
+
+
+@dataclass(slots=True)
+class ImplementationDataType(_SchemaMixin):
     """
     Platform-specific implementation data type.
     Maps to actual C types.
@@ -172,66 +303,42 @@ class ImplementationDataType:
     array_size: int = 1
     # For structures
     is_struct: bool = False
-    struct_members: list[tuple[str, str]] = field(default_factory=list)  # (name, impl_type_uid or base_type)
+    struct_members: tuple[tuple[str, str], ...] = ()  # (name, impl_type_uid or base_type)
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "base_type": self.base_type.value,
-            "is_array": self.is_array,
-            "array_size": self.array_size,
-            "is_struct": self.is_struct,
-            "struct_members": [{"name": m[0], "type": m[1]} for m in self.struct_members],
-            "description": self.description,
-            "uid": self.uid,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "ImplementationDataType":
-        struct_members = [(m["name"], m["type"]) for m in data.get("struct_members", [])]
-        return cls(
-            name=data["name"],
-            base_type=BaseDataType(data.get("base_type", "uint8")),
-            is_array=data.get("is_array", False),
-            array_size=data.get("array_size", 1),
-            is_struct=data.get("is_struct", False),
-            struct_members=struct_members,
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
-
-
-@dataclass
-class DataTypeMapping:
+    uid: str = field(default_factory=_new_uid)
+
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("base_type", BaseDataType, BaseDataType.UINT8),
+        ("is_array", None, False),
+        ("array_size", None, 1),
+        ("is_struct", None, False),
+        ("struct_members", _pairs("name", "type"), ()),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
+
+
+@dataclass(slots=True)
+class DataTypeMapping(_SchemaMixin):
     """Maps an Application Data Type to an Implementation Data Type."""
     app_type_uid: str
     impl_type_uid: str
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    uid: str = field(default_factory=_new_uid)
 
-    def to_dict(self) -> dict:
-        return {
-            "app_type_uid": self.app_type_uid,
-            "impl_type_uid": self.impl_type_uid,
-            "uid": self.uid,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "DataTypeMapping":
-        return cls(
-            app_type_uid=data["app_type_uid"],
-            impl_type_uid=data["impl_type_uid"],
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    _SCHEMA = (
+        ("app_type_uid", None, _REQUIRED),
+        ("impl_type_uid", None, _REQUIRED),
+        ("uid", None, _new_uid),
+    )
 
 
 # =============================================================================
 # INTERFACE ELEMENTS
 # =============================================================================
 
-@dataclass
-class DataElement:
+@dataclass(slots=True)
+class DataElement(_SchemaMixin):
     """Data element within a Sender/Receiver interface."""
     name: str
     app_type_uid: Optional[str] = None  # Reference to ApplicationDataType
@@ -239,162 +346,108 @@ class DataElement:
     base_type: BaseDataType = BaseDataType.UINT8
     init_value: str = "0"
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "app_type_uid": self.app_type_uid,
-            "base_type": self.base_type.value,
-            "init_value": self.init_value,
-            "description": self.description,
-            "uid": self.uid,
-        }
+    uid: str = field(default_factory=_new_uid)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "DataElement":
-        return cls(
-            name=data["name"],
-            app_type_uid=data.get("app_type_uid"),
-            base_type=BaseDataType(data.get("base_type", "uint8")),
-            init_value=data.get("init_value", "0"),
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("app_type_uid", None, None),
+        ("base_type", BaseDataType, BaseDataType.UINT8),
+        ("init_value", None, "0"),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
 
 
-@dataclass
-class OperationArgument:
+@dataclass(slots=True)
+class OperationArgument(_SchemaMixin):
     """Argument for a Client/Server operation."""
     name: str
     direction: ArgumentDirection = ArgumentDirection.IN
     app_type_uid: Optional[str] = None
     base_type: BaseDataType = BaseDataType.UINT8
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "direction": self.direction.value,
-            "app_type_uid": self.app_type_uid,
-            "base_type": self.base_type.value,
-            "description": self.description,
-            "uid": self.uid,
-        }
+    uid: str = field(default_factory=_new_uid)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "OperationArgument":
-        return cls(
-            name=data["name"],
-            direction=ArgumentDirection(data.get("direction", "in")),
-            app_type_uid=data.get("app_type_uid"),
-            base_type=BaseDataType(data.get("base_type", "uint8")),
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("direction", ArgumentDirection, ArgumentDirection.IN),
+        ("app_type_uid", None, None),
+        ("base_type", BaseDataType, BaseDataType.UINT8),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
 
 
-@dataclass
-class Operation:
+@dataclass(slots=True)
+class Operation(_SchemaMixin):
     """Operation within a Client/Server interface."""
     name: str
     return_type_uid: Optional[str] = None  # Reference to ApplicationDataType
     return_base_type: BaseDataType = BaseDataType.UINT8
     arguments: list[OperationArgument] = field(default_factory=list)
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "return_type_uid": self.return_type_uid,
-            "return_base_type": self.return_base_type.value,
-            "arguments": [arg.to_dict() for arg in self.arguments],
-            "description": self.description,
-            "uid": self.uid,
-        }
+    uid: str = field(default_factory=_new_uid)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "Operation":
-        args = [OperationArgument.from_dict(a) for a in data.get("arguments", [])]
-        return cls(
-            name=data["name"],
-            return_type_uid=data.get("return_type_uid"),
-            return_base_type=BaseDataType(data.get("return_base_type", "uint8")),
-            arguments=args,
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("return_type_uid", None, None),
+        ("return_base_type", BaseDataType, BaseDataType.UINT8),
+        ("arguments", OperationArgument, list),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
 
 
 # =============================================================================
 # INTERFACES
 # =============================================================================
 
-@dataclass
-class Interface:
+@dataclass(slots=True)
+class Interface(_SchemaMixin):
     """AUTOSAR-like interface (Sender/Receiver or Client/Server)."""
     name: str
     interface_type: InterfaceType = InterfaceType.SENDER_RECEIVER
     data_elements: list[DataElement] = field(default_factory=list)
     operations: list[Operation] = field(default_factory=list)
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    uid: str = field(default_factory=_new_uid)
 
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "interface_type": self.interface_type.value,
-            "data_elements": [de.to_dict() for de in self.data_elements],
-            "operations": [op.to_dict() for op in self.operations],
-            "description": self.description,
-            "uid": self.uid,
-        }
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("interface_type", InterfaceType, InterfaceType.SENDER_RECEIVER),
+        ("data_elements", DataElement, list),
+        ("operations", Operation, list),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "Interface":
-        return cls(
-            name=data["name"],
-            interface_type=InterfaceType(data.get("interface_type", "sender_receiver")),
-            data_elements=[DataElement.from_dict(de) for de in data.get("data_elements", [])],
-            operations=[Operation.from_dict(op) for op in data.get("operations", [])],
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    def remove_data_element(self, data_element: DataElement) -> None:
+        _remove_identical(self.data_elements, data_element)
+
+    def remove_operation(self, operation: Operation) -> None:
+        _remove_identical(self.operations, operation)
 
 
 # =============================================================================
 # SOFTWARE COMPONENT ELEMENTS
 # =============================================================================
 
-@dataclass
-class Port:
+@dataclass(slots=True)
+class Port(_SchemaMixin):
     """Port on a Software Component."""
     name: str
     direction: PortDirection = PortDirection.REQUIRED
     interface_uid: Optional[str] = None  # Reference to Interface by UID
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    uid: str = field(default_factory=_new_uid)
 
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "direction": self.direction.value,
-            "interface_uid": self.interface_uid,
-            "description": self.description,
-            "uid": self.uid,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Port":
-        return cls(
-            name=data["name"],
-            direction=PortDirection(data.get("direction", "required")),
-            interface_uid=data.get("interface_uid"),
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("direction", PortDirection, PortDirection.REQUIRED),
+        ("interface_uid", None, None),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
 
 
 class RunnableTrigger(Enum):
@@ -404,8 +457,16 @@ class RunnableTrigger(Enum):
     DATA_RECEIVED = "data_received"  # S/R data reception
 
 
-@dataclass
-class Runnable:
+def _runnable_trigger(value: str) -> RunnableTrigger:
+    # Handle old format (unknown or missing trigger means periodic)
+    try:
+        return RunnableTrigger._value2member_map_.get(value, RunnableTrigger.TIMING)
+    except TypeError:
+        return RunnableTrigger.TIMING
+
+
+@dataclass(slots=True)
+class Runnable(_SchemaMixin):
     """Runnable entity within an SWC."""
     name: str
     trigger: RunnableTrigger = RunnableTrigger.TIMING
@@ -416,82 +477,66 @@ class Runnable:
     # For DATA_RECEIVED trigger - references port and data element
     trigger_data_element_uid: Optional[str] = None
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "trigger": self.trigger.value,
-            "period_ms": self.period_ms,
-            "trigger_port_uid": self.trigger_port_uid,
-            "trigger_operation_uid": self.trigger_operation_uid,
-            "trigger_data_element_uid": self.trigger_data_element_uid,
-            "description": self.description,
-            "uid": self.uid,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Runnable":
-        # Handle old format (just period_ms)
-        trigger_str = data.get("trigger", "timing")
-        try:
-            trigger = RunnableTrigger(trigger_str)
-        except ValueError:
-            trigger = RunnableTrigger.TIMING
-            
-        return cls(
-            name=data["name"],
-            trigger=trigger,
-            period_ms=data.get("period_ms", 10),
-            trigger_port_uid=data.get("trigger_port_uid"),
-            trigger_operation_uid=data.get("trigger_operation_uid"),
-            trigger_data_element_uid=data.get("trigger_data_element_uid"),
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
-
-
-@dataclass
-class SoftwareComponent:
+    uid: str = field(default_factory=_new_uid)
+
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("trigger", _Codec(_enum_value, _runnable_trigger), RunnableTrigger.TIMING),
+        ("period_ms", None, 10),
+        ("trigger_port_uid", None, None),
+        ("trigger_operation_uid", None, None),
+        ("trigger_data_element_uid", None, None),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
+
+
+@dataclass(slots=True)
+class SoftwareComponent(_SchemaMixin):
     """AUTOSAR-like Software Component."""
     name: str
     ports: list[Port] = field(default_factory=list)
     runnables: list[Runnable] = field(default_factory=list)
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    uid: str = field(default_factory=_new_uid)
+    # uid -> position in self.ports, rebuilt whenever it no longer matches
+    _ports_by_uid: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
 
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "ports": [p.to_dict() for p in self.ports],
-            "runnables": [r.to_dict() for r in self.runnables],
-            "description": self.description,
-            "uid": self.uid,
-        }
+    def __post_init__(self):
+        self._rebuild_port_index()
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "SoftwareComponent":
-        return cls(
-            name=data["name"],
-            ports=[Port.from_dict(p) for p in data.get("ports", [])],
-            runnables=[Runnable.from_dict(r) for r in data.get("runnables", [])],
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("ports", Port, list),
+        ("runnables", Runnable, list),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
+
+    def _rebuild_port_index(self) -> None:
+        self._ports_by_uid = {p.uid: i for i, p in enumerate(self.ports)}
+
+    def add_port(self, port: Port) -> None:
+        self._ports_by_uid[port.uid] = len(self.ports)
+        self.ports.append(port)
+
+    def remove_port(self, port: Port) -> None:
+        _remove_identical(self.ports, port)
+        self._ports_by_uid.pop(port.uid, None)
+
+    def remove_runnable(self, runnable: Runnable) -> None:
+        _remove_identical(self.runnables, runnable)
 
     def get_port_by_uid(self, uid: str) -> Optional[Port]:
-        for port in self.ports:
-            if port.uid == uid:
-                return port
-        return None
+        return _lookup_by_uid(self._ports_by_uid, self.ports, uid)
 
 
 # =============================================================================
 # PORT CONNECTIONS (Assembly Connectors)
 # =============================================================================
 
-@dataclass
-class PortConnection:
+@dataclass(slots=True)
+class PortConnection(_SchemaMixin):
     """
     Assembly connector between two ports.
     Connects a REQUIRED port to a PROVIDED port with matching interface.
@@ -504,38 +549,36 @@ class PortConnection:
     requester_swc_uid: str
     requester_port_uid: str
     description: str = ""
-    uid: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "provider_swc_uid": self.provider_swc_uid,
-            "provider_port_uid": self.provider_port_uid,
-            "requester_swc_uid": self.requester_swc_uid,
-            "requester_port_uid": self.requester_port_uid,
-            "description": self.description,
-            "uid": self.uid,
-        }
+    uid: str = field(default_factory=_new_uid)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "PortConnection":
-        return cls(
-            name=data["name"],
-            provider_swc_uid=data["provider_swc_uid"],
-            provider_port_uid=data["provider_port_uid"],
-            requester_swc_uid=data["requester_swc_uid"],
-            requester_port_uid=data["requester_port_uid"],
-            description=data.get("description", ""),
-            uid=data.get("uid", str(uuid.uuid4())[:8]),
-        )
+    _SCHEMA = (
+        ("name", None, _REQUIRED),
+        ("provider_swc_uid", None, _REQUIRED),
+        ("provider_port_uid", None, _REQUIRED),
+        ("requester_swc_uid", None, _REQUIRED),
+        ("requester_port_uid", None, _REQUIRED),
+        ("description", None, ""),
+        ("uid", None, _new_uid),
+    )
 
 
 # =============================================================================
 # PROJECT
 # =============================================================================
 
-@dataclass
-class Project:
+# Project element list -> its uid lookup attribute
+_UID_INDEX_FOR_LIST = {
+    "components": "_components_by_uid",
+    "interfaces": "_interfaces_by_uid",
+    "application_data_types": "_app_types_by_uid",
+    "implementation_data_types": "_impl_types_by_uid",
+    "compu_methods": "_compu_methods_by_uid",
+    "connections": "_connections_by_uid",
+}
+
+
+@dataclass(slots=True)
+class Project(_SchemaMixin):
     """Container for all project elements."""
     name: str = "Untitled Project"
     description: str = ""
@@ -549,131 +592,305 @@ class Project:
     components: list[SoftwareComponent] = field(default_factory=list)
     # Connections
     connections: list[PortConnection] = field(default_factory=list)
-
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "compu_methods": [cm.to_dict() for cm in self.compu_methods],
-            "application_data_types": [adt.to_dict() for adt in self.application_data_types],
-            "implementation_data_types": [idt.to_dict() for idt in self.implementation_data_types],
-            "data_type_mappings": [dtm.to_dict() for dtm in self.data_type_mappings],
-            "interfaces": [i.to_dict() for i in self.interfaces],
-            "components": [c.to_dict() for c in self.components],
-            "connections": [conn.to_dict() for conn in self.connections],
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Project":
-        return cls(
-            name=data.get("name", "Untitled Project"),
-            description=data.get("description", ""),
-            compu_methods=[CompuMethod.from_dict(cm) for cm in data.get("compu_methods", [])],
-            application_data_types=[ApplicationDataType.from_dict(adt) for adt in data.get("application_data_types", [])],
-            implementation_data_types=[ImplementationDataType.from_dict(idt) for idt in data.get("implementation_data_types", [])],
-            data_type_mappings=[DataTypeMapping.from_dict(dtm) for dtm in data.get("data_type_mappings", [])],
-            interfaces=[Interface.from_dict(i) for i in data.get("interfaces", [])],
-            components=[SoftwareComponent.from_dict(c) for c in data.get("components", [])],
-            connections=[PortConnection.from_dict(conn) for conn in data.get("connections", [])],
-        )
+    # uid -> position in self.components, rebuilt whenever it no longer matches
+    _components_by_uid: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # uid lookups for the other element lists, filled on first use and
+    # resynced by _lookup_by_uid like the component index
+    _interfaces_by_uid: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _app_types_by_uid: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _impl_types_by_uid: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _compu_methods_by_uid: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _connections_by_uid: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # app type uid -> mapped impl type uid (first mapping wins, as in a list scan)
+    _impl_uid_by_app_uid: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (id, len) of the data_type_mappings list _impl_uid_by_app_uid was built from
+    _mappings_indexed: tuple = field(default=(None, -1), init=False, repr=False, compare=False)
+    # port uid -> {connection uid: connection} for both ends of every connection
+    _conns_by_port: dict[str, dict[str, PortConnection]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (id, len) of the connections list _conns_by_port was last built from
+    _conns_indexed: tuple = field(default=(None, -1), init=False, repr=False, compare=False)
+    # Bumped on every edit so views can key caches on (uid, version_counter)
+    version_counter: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.rebuild_indexes()
+
+    _SCHEMA = (
+        ("name", None, "Untitled Project"),
+        ("description", None, ""),
+        ("compu_methods", CompuMethod, list),
+        ("application_data_types", ApplicationDataType, list),
+        ("implementation_data_types", ImplementationDataType, list),
+        ("data_type_mappings", DataTypeMapping, list),
+        ("interfaces", Interface, list),
+        ("components", SoftwareComponent, list),
+        ("connections", PortConnection, list),
+    )
+
+    def touch(self) -> None:
+        """Record that the project was edited, invalidating version-keyed caches."""
+        self.version_counter += 1
+
+    def rebuild_indexes(self) -> None:
+        """Rebuild every uid and port lookup from the element lists."""
+        self._components_by_uid = {c.uid: i for i, c in enumerate(self.components)}
+        self._interfaces_by_uid = {iface.uid: i for i, iface in enumerate(self.interfaces)}
+        self._app_types_by_uid = {t.uid: i for i, t in enumerate(self.application_data_types)}
+        self._impl_types_by_uid = {t.uid: i for i, t in enumerate(self.implementation_data_types)}
+        self._compu_methods_by_uid = {cm.uid: i for i, cm in enumerate(self.compu_methods)}
+        self._connections_by_uid = {c.uid: i for i, c in enumerate(self.connections)}
+        self._rebuild_mapping_index()
+        self._rebuild_port_connections()
+
+    # --- Component helpers ---
+
+    def add_component(self, swc: SoftwareComponent) -> None:
+        self._components_by_uid[swc.uid] = len(self.components)
+        self.components.append(swc)
+        self.touch()
+
+    def remove_component(self, swc: SoftwareComponent) -> None:
+        _remove_identical(self.components, swc)
+        self._components_by_uid.pop(swc.uid, None)
+        self.touch()
+
+    # --- Other top-level elements ---
+
+    def add_interface(self, iface: Interface) -> None:
+        self._interfaces_by_uid[iface.uid] = len(self.interfaces)
+        self.interfaces.append(iface)
+        self.touch()
+
+    def add_app_type(self, adt: ApplicationDataType) -> None:
+        self._app_types_by_uid[adt.uid] = len(self.application_data_types)
+        self.application_data_types.append(adt)
+        self.touch()
+
+    def add_impl_type(self, idt: ImplementationDataType) -> None:
+        self._impl_types_by_uid[idt.uid] = len(self.implementation_data_types)
+        self.implementation_data_types.append(idt)
+        self.touch()
+
+    def add_compu_method(self, cm: CompuMethod) -> None:
+        self._compu_methods_by_uid[cm.uid] = len(self.compu_methods)
+        self.compu_methods.append(cm)
+        self.touch()
+
+    def remove_interface(self, iface: Interface) -> None:
+        _remove_identical(self.interfaces, iface)
+        self._interfaces_by_uid.pop(iface.uid, None)
+        self.touch()
+
+    def remove_app_type(self, adt: ApplicationDataType) -> None:
+        _remove_identical(self.application_data_types, adt)
+        self._app_types_by_uid.pop(adt.uid, None)
+        self.touch()
+
+    def remove_impl_type(self, idt: ImplementationDataType) -> None:
+        _remove_identical(self.implementation_data_types, idt)
+        self._impl_types_by_uid.pop(idt.uid, None)
+        self.touch()
+
+    def remove_compu_method(self, cm: CompuMethod) -> None:
+        _remove_identical(self.compu_methods, cm)
+        self._compu_methods_by_uid.pop(cm.uid, None)
+        self.touch()
+
+    def splice_elements(self, list_name: str, start: int, stop: int, items) -> None:
+        """Replace self.<list_name>[start:stop] with items, keeping the lookups in step."""
+        elements = getattr(self, list_name)
+        old = elements[start:stop]
+        if list_name == "connections":
+            self._port_connections()
+            for conn in old:
+                self._unindex_connection(conn)
+        index = getattr(self, _UID_INDEX_FOR_LIST.get(list_name, ""), None)
+        if index is not None:
+            for obj in old:
+                index.pop(obj.uid, None)
+        elements[start:stop] = items
+        if index is not None:
+            index.update((obj.uid, i) for i, obj in enumerate(items, start))
+        if list_name == "connections":
+            for conn in items:
+                self._index_connection(conn)
+            self._conns_indexed = (id(self.connections), len(self.connections))
+        elif list_name == "data_type_mappings":
+            # first mapping wins, so a splice can change earlier answers
+            self._mappings_indexed = (None, -1)
+        self.touch()
 
     # --- Lookup helpers ---
 
     def get_interface_by_uid(self, uid: str) -> Optional[Interface]:
-        for iface in self.interfaces:
-            if iface.uid == uid:
-                return iface
-        return None
+        return _lookup_by_uid(self._interfaces_by_uid, self.interfaces, uid)
 
     def get_component_by_uid(self, uid: str) -> Optional[SoftwareComponent]:
-        for comp in self.components:
-            if comp.uid == uid:
-                return comp
-        return None
+        return _lookup_by_uid(self._components_by_uid, self.components, uid)
 
     def get_app_type_by_uid(self, uid: str) -> Optional[ApplicationDataType]:
-        for adt in self.application_data_types:
-            if adt.uid == uid:
-                return adt
-        return None
+        return _lookup_by_uid(self._app_types_by_uid, self.application_data_types, uid)
 
     def get_impl_type_by_uid(self, uid: str) -> Optional[ImplementationDataType]:
-        for idt in self.implementation_data_types:
-            if idt.uid == uid:
-                return idt
-        return None
+        return _lookup_by_uid(self._impl_types_by_uid, self.implementation_data_types, uid)
 
     def get_compu_method_by_uid(self, uid: str) -> Optional[CompuMethod]:
-        for cm in self.compu_methods:
-            if cm.uid == uid:
-                return cm
-        return None
+        return _lookup_by_uid(self._compu_methods_by_uid, self.compu_methods, uid)
 
     def get_impl_type_for_app_type(self, app_type_uid: str) -> Optional[ImplementationDataType]:
         """Get the implementation type mapped to an application type."""
+        if self._mappings_indexed != (id(self.data_type_mappings), len(self.data_type_mappings)):
+            self._rebuild_mapping_index()
+        impl_uid = self._impl_uid_by_app_uid.get(app_type_uid)
+        if impl_uid is None:
+            return None
+        return self.get_impl_type_by_uid(impl_uid)
+
+    def _rebuild_mapping_index(self) -> None:
+        index = {}
         for mapping in self.data_type_mappings:
-            if mapping.app_type_uid == app_type_uid:
-                return self.get_impl_type_by_uid(mapping.impl_type_uid)
-        return None
+            index.setdefault(mapping.app_type_uid, mapping.impl_type_uid)
+        self._impl_uid_by_app_uid = index
+        self._mappings_indexed = (id(self.data_type_mappings), len(self.data_type_mappings))
 
     def get_connection_by_uid(self, uid: str) -> Optional[PortConnection]:
-        for conn in self.connections:
-            if conn.uid == uid:
-                return conn
-        return None
+        return _lookup_by_uid(self._connections_by_uid, self.connections, uid)
 
     # --- Connection helpers ---
 
     def get_compatible_ports_for_connection(self, provider_port: Port) -> list[tuple["SoftwareComponent", Port]]:
         """Find all required ports that can connect to a provided port."""
-        if provider_port.direction != PortDirection.PROVIDED:
-            return []
-        
-        compatible = []
-        for swc in self.components:
-            for port in swc.ports:
-                if (port.direction == PortDirection.REQUIRED and 
-                    port.interface_uid == provider_port.interface_uid and
-                    port.uid != provider_port.uid):
-                    compatible.append((swc, port))
-        return compatible
+        return list(self.iter_compatible_ports(provider_port))
+
+    def iter_compatible_ports(self, provider_port: Port) -> Iterator[tuple["SoftwareComponent", Port]]:
+        """Lazy get_compatible_ports_for_connection, for callers that stop early.
+
+        Scans the ports on every call: ports are edited in place by the
+        editors, so a cached index could not tell when it went stale.
+        """
+        if provider_port.direction is not PortDirection.PROVIDED:
+            return iter(())
+        interface_uid = provider_port.interface_uid
+        provider_uid = provider_port.uid
+        return (
+            (swc, port)
+            for swc in self.components
+            for port in swc.ports
+            if port.direction is PortDirection.REQUIRED
+            and port.interface_uid == interface_uid
+            and port.uid != provider_uid
+        )
+
+    def _rebuild_port_connections(self) -> None:
+        self._conns_by_port = {}
+        for conn in self.connections:
+            self._index_connection(conn)
+        self._conns_indexed = (id(self.connections), len(self.connections))
+
+    def _port_connections(self) -> dict[str, dict[str, PortConnection]]:
+        """_conns_by_port, rebuilt first if self.connections was changed directly."""
+        if self._conns_indexed != (id(self.connections), len(self.connections)):
+            self._rebuild_port_connections()
+        return self._conns_by_port
+
+    def _index_connection(self, conn: PortConnection) -> None:
+        for uid in (conn.provider_port_uid, conn.requester_port_uid):
+            self._conns_by_port.setdefault(uid, {})[conn.uid] = conn
+
+    def _unindex_connection(self, conn: PortConnection) -> None:
+        for uid in (conn.provider_port_uid, conn.requester_port_uid):
+            conns = self._conns_by_port.get(uid)
+            if conns is not None:
+                conns.pop(conn.uid, None)
+                if not conns:
+                    del self._conns_by_port[uid]
+
+    def add_connection(self, conn: PortConnection) -> None:
+        self._port_connections()
+        self._connections_by_uid[conn.uid] = len(self.connections)
+        self.connections.append(conn)
+        self._index_connection(conn)
+        self._conns_indexed = (id(self.connections), len(self.connections))
+        self.touch()
+
+    def remove_connection(self, conn: PortConnection) -> None:
+        self._port_connections()
+        _remove_identical(self.connections, conn)
+        self._unindex_connection(conn)
+        self._conns_indexed = (id(self.connections), len(self.connections))
+        self._connections_by_uid.pop(conn.uid, None)
+        self.touch()
+
+    def remove_port_connections(self, port_uids) -> list[PortConnection]:
+        """Remove every connection to the given ports and return the removed ones."""
+        by_port = self._port_connections()
+        removed = {}
+        for uid in port_uids:
+            removed.update(by_port.get(uid, {}))
+        if removed:
+            self.connections[:] = [c for c in self.connections if c.uid not in removed]
+            for conn in removed.values():
+                self._unindex_connection(conn)
+                self._connections_by_uid.pop(conn.uid, None)
+            self._conns_indexed = (id(self.connections), len(self.connections))
+            self.touch()
+        return list(removed.values())
+
+    def is_port_connected(self, port_uid: str) -> bool:
+        return port_uid in self._port_connections()
 
     def get_connections_for_port(self, port_uid: str) -> list[PortConnection]:
         """Get all connections involving a specific port."""
-        return [
-            conn for conn in self.connections
-            if conn.provider_port_uid == port_uid or conn.requester_port_uid == port_uid
-        ]
+        return list(self.iter_connections_for_port(port_uid))
+
+    def iter_connections_for_port(self, port_uid: str) -> Iterator[PortConnection]:
+        """Lazy get_connections_for_port; don't add or remove connections while iterating."""
+        return iter(self._port_connections().get(port_uid, {}).values())
 
     def validate_connection(self, provider_swc_uid: str, provider_port_uid: str,
                            requester_swc_uid: str, requester_port_uid: str) -> tuple[bool, str]:
         """Validate that a connection is valid."""
+        # Each side is resolved and checked before the other is looked up,
+        # so a bad provider is rejected without touching the requester
         provider_swc = self.get_component_by_uid(provider_swc_uid)
-        requester_swc = self.get_component_by_uid(requester_swc_uid)
-        
-        if not provider_swc:
+        if provider_swc is None:
             return False, "Provider SWC not found"
-        if not requester_swc:
-            return False, "Requester SWC not found"
-        
         provider_port = provider_swc.get_port_by_uid(provider_port_uid)
-        requester_port = requester_swc.get_port_by_uid(requester_port_uid)
-        
-        if not provider_port:
+        if provider_port is None:
             return False, "Provider port not found"
-        if not requester_port:
-            return False, "Requester port not found"
-        
-        if provider_port.direction != PortDirection.PROVIDED:
+        if provider_port.direction is not PortDirection.PROVIDED:
             return False, "Provider port must have 'provided' direction"
-        if requester_port.direction != PortDirection.REQUIRED:
+
+        requester_swc = self.get_component_by_uid(requester_swc_uid)
+        if requester_swc is None:
+            return False, "Requester SWC not found"
+        requester_port = requester_swc.get_port_by_uid(requester_port_uid)
+        if requester_port is None:
+            return False, "Requester port not found"
+        if requester_port.direction is not PortDirection.REQUIRED:
             return False, "Requester port must have 'required' direction"
         
         if provider_port.interface_uid != requester_port.interface_uid:
             return False, "Ports must share the same interface"
         
         # Check for duplicate connection
-        for conn in self.connections:
+        for conn in self._port_connections().get(provider_port_uid, {}).values():
             if (conn.provider_port_uid == provider_port_uid and 
                 conn.requester_port_uid == requester_port_uid):
                 return False, "Connection already exists"
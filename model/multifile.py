@@ -7,45 +7,52 @@ Supports:
 - Cross-module references (interfaces, types, connections)
 - Merged view for editing
 """
-import yaml
+import hashlib
+import os
+from itertools import chain
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 from .elements import (
     Project, Interface, SoftwareComponent, PortConnection,
     CompuMethod, ApplicationDataType, ImplementationDataType,
-    DataTypeMapping
+    DataTypeMapping, _REQUIRED, _SchemaMixin
+)
+
+# Element lists a module contributes to the merged project, in merge order
+_MERGED_LISTS = (
+    "compu_methods",
+    "application_data_types",
+    "implementation_data_types",
+    "data_type_mappings",
+    "interfaces",
+    "components",
+    "connections",
 )
 
 
-@dataclass
-class ModuleReference:
+@dataclass(slots=True)
+class ModuleReference(_SchemaMixin):
     """Reference to a YAML module file."""
     path: str  # Relative path from master project file
-    name: str  # Display name
+    name: str  # Display name; None means the file's stem
     description: str = ""
     enabled: bool = True
 
-    def to_dict(self) -> dict:
-        return {
-            "path": self.path,
-            "name": self.name,
-            "description": self.description,
-            "enabled": self.enabled,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "ModuleReference":
-        return cls(
-            path=data["path"],
-            name=data.get("name", Path(data["path"]).stem),
-            description=data.get("description", ""),
-            enabled=data.get("enabled", True),
-        )
+    def __post_init__(self):
+        if self.name is None:
+            self.name = Path(self.path).stem
+
+    _SCHEMA = (
+        ("path", None, _REQUIRED),
+        ("name", None, None),
+        ("description", None, ""),
+        ("enabled", None, True),
+    )
 
 
-@dataclass
-class MasterProject:
+@dataclass(slots=True)
+class MasterProject(_SchemaMixin):
     """
     Master project that references multiple module files.
     
@@ -66,26 +73,16 @@ class MasterProject:
     # OR in a dedicated connections module
     global_connections: list[PortConnection] = field(default_factory=list)
 
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "modules": [m.to_dict() for m in self.modules],
-            "global_connections": [c.to_dict() for c in self.global_connections],
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "MasterProject":
-        return cls(
-            name=data.get("name", "Multi-Module Project"),
-            description=data.get("description", ""),
-            modules=[ModuleReference.from_dict(m) for m in data.get("modules", [])],
-            global_connections=[PortConnection.from_dict(c) for c in data.get("global_connections", [])],
-        )
+    _SCHEMA = (
+        ("name", None, "Multi-Module Project"),
+        ("description", None, ""),
+        ("modules", ModuleReference, list),
+        ("global_connections", PortConnection, list),
+    )
 
 
-@dataclass 
-class Module:
+@dataclass(slots=True)
+class Module(_SchemaMixin):
     """
     A single YAML module containing a subset of project elements.
     
@@ -106,32 +103,58 @@ class Module:
     components: list[SoftwareComponent] = field(default_factory=list)
     connections: list[PortConnection] = field(default_factory=list)
 
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "compu_methods": [cm.to_dict() for cm in self.compu_methods],
-            "application_data_types": [adt.to_dict() for adt in self.application_data_types],
-            "implementation_data_types": [idt.to_dict() for idt in self.implementation_data_types],
-            "data_type_mappings": [dtm.to_dict() for dtm in self.data_type_mappings],
-            "interfaces": [i.to_dict() for i in self.interfaces],
-            "components": [c.to_dict() for c in self.components],
-            "connections": [conn.to_dict() for conn in self.connections],
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Module":
-        return cls(
-            name=data.get("name", "Untitled Module"),
-            description=data.get("description", ""),
-            compu_methods=[CompuMethod.from_dict(cm) for cm in data.get("compu_methods", [])],
-            application_data_types=[ApplicationDataType.from_dict(adt) for adt in data.get("application_data_types", [])],
-            implementation_data_types=[ImplementationDataType.from_dict(idt) for idt in data.get("implementation_data_types", [])],
-            data_type_mappings=[DataTypeMapping.from_dict(dtm) for dtm in data.get("data_type_mappings", [])],
-            interfaces=[Interface.from_dict(i) for i in data.get("interfaces", [])],
-            components=[SoftwareComponent.from_dict(c) for c in data.get("components", [])],
-            connections=[PortConnection.from_dict(conn) for conn in data.get("connections", [])],
-        )
+    _SCHEMA = (
+        ("name", None, "Untitled Module"),
+        ("description", None, ""),
+        ("compu_methods", CompuMethod, list),
+        ("application_data_types", ApplicationDataType, list),
+        ("implementation_data_types", ImplementationDataType, list),
+        ("data_type_mappings", DataTypeMapping, list),
+        ("interfaces", Interface, list),
+        ("components", SoftwareComponent, list),
+        ("connections", PortConnection, list),
+    )
+
+
+def _encode(data) -> bytes:
+    from ._yaml_support import dump_yaml
+    return dump_yaml(data, encoding='utf-8')
+
+
+def _digest(content: bytes) -> bytes:
+    """Fingerprint of a file's bytes, to tell whether a save would change it."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _write_temp(content: bytes, path: Path) -> Path:
+    """Write content next to path as <name>.tmp, flushed to disk; returns the temp path."""
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return tmp
+
+
+def _dump(data, path: Path) -> bytes:
+    """Replace path with data, so a failed write never leaves a half-written file.
+
+    Returns the digest of what was written.
+    """
+    content = _encode(data)
+    os.replace(_write_temp(content, path), path)
+    return _digest(content)
+
+
+def _read_module(module_path: Path) -> tuple[Module, bytes]:
+    """The module in a file, plus the digest of the file's bytes."""
+    from ._yaml_support import load_yaml
+    content = module_path.read_bytes()
+    return Module.from_dict(load_yaml(content)), _digest(content)
 
 
 class MultiFileProject:
@@ -144,9 +167,21 @@ class MultiFileProject:
     def __init__(self):
         self.master: MasterProject = MasterProject()
         self.master_path: Optional[Path] = None
-        self.modules: dict[str, Module] = {}  # path -> Module
+        # path -> Module, or None until a module listed by load_master is first needed
+        self.modules: dict[Path, Optional[Module]] = {}
         self.module_paths: dict[str, Path] = {}  # module name -> absolute path
+        self._unloaded: dict[Path, str] = {}  # path -> name of modules not parsed yet
+        self._modules_by_name: dict[str, Module] = {}  # parsed modules only
         self._merged: Optional[Project] = None
+        self._uid_index: Optional[dict[str, str]] = None  # element uid -> module name
+        # module path -> list name -> (start, stop) of its elements in _merged
+        self._module_slices: dict[Path, dict[str, tuple[int, int]]] = {}
+        # Digest of each module file (and the master) as last read or written;
+        # save_all rewrites only files whose content would change
+        self._file_digests: dict[Path, bytes] = {}
+        self._master_digest: Optional[bytes] = None
+        # Problems found by the last load_master, for the caller to report
+        self.load_warnings: list[str] = []
 
     def new_project(self, name: str = "New Project"):
         """Create a new empty multi-file project."""
@@ -154,43 +189,84 @@ class MultiFileProject:
         self.master_path = None
         self.modules = {}
         self.module_paths = {}
+        self._unloaded = {}
+        self._modules_by_name = {}
         self._merged = None
+        self._uid_index = None
+        self._module_slices = {}
+        self._file_digests = {}
+        self._master_digest = None
+        self.load_warnings = []
 
     def load_master(self, master_path: Path) -> None:
-        """Load a master project file and all its modules."""
-        with open(master_path, 'r') as f:
-            data = yaml.safe_load(f)
+        """Load a master project file and register its modules.
+
+        Module files are only parsed once something needs their content
+        (get_module_by_name, get_merged_project, find_element_module).
+        Enabled modules whose files are missing are skipped and listed
+        in load_warnings.
+        """
+        from ._yaml_support import load_yaml
+        self.load_warnings = []
+        content = master_path.read_bytes()
         
-        self.master = MasterProject.from_dict(data)
+        self.master = MasterProject.from_dict(load_yaml(content))
         self.master_path = master_path.resolve()
         self.modules = {}
         self.module_paths = {}
+        self._unloaded = {}
+        self._modules_by_name = {}
+        self._merged = None
+        self._module_slices = {}
+        self._file_digests = {}
+        self._master_digest = _digest(content)
 
-        # Load each referenced module
+        # Register each referenced module; parsing waits for _ensure_loaded
         base_dir = master_path.parent
         for mod_ref in self.master.modules:
             if mod_ref.enabled:
                 mod_path = (base_dir / mod_ref.path).resolve()
                 if mod_path.exists():
-                    self.load_module(mod_path, mod_ref.name)
+                    name = mod_ref.name or mod_path.stem
+                    self.modules[mod_path] = None
+                    self.module_paths[name] = mod_path
+                    self._unloaded[mod_path] = name
                 else:
-                    print(f"Warning: Module not found: {mod_path}")
+                    self.load_warnings.append(f"Module not found: {mod_path}")
+
+        self._uid_index = None
+
+    def _ensure_loaded(self, path: Path) -> Module:
+        """The module stored under path, parsing its file first if needed."""
+        module = self.modules[path]
+        if module is None:
+            module, self._file_digests[path] = _read_module(path)
+            module.name = self._unloaded.pop(path)
+            self.modules[path] = module
+            self._modules_by_name[module.name] = module
+        return module
 
-        self._merged = None
+    def _ensure_all_loaded(self) -> None:
+        # Sequential on purpose: parsing holds the GIL, so worker threads
+        # gave no speedup over this loop
+        for path in list(self._unloaded):
+            self._ensure_loaded(path)
 
     def load_module(self, module_path: Path, name: str = None) -> Module:
         """Load a single module file."""
-        with open(module_path, 'r') as f:
-            data = yaml.safe_load(f)
-        
-        module = Module.from_dict(data)
+        module, self._file_digests[module_path] = _read_module(module_path)
         if name:
             module.name = name
         
-        key = str(module_path)
-        self.modules[key] = module
+        replaced = self.modules.get(module_path)
+        if replaced is not None:
+            self._modules_by_name.pop(replaced.name, None)
+        self.modules[module_path] = module
         self.module_paths[module.name] = module_path
-        self._merged = None
+        self._modules_by_name[module.name] = module
+        self._unloaded.pop(module_path, None)
+        self._merge_module(module_path, module)
+        self._uid_index = None
         
         return module
 
@@ -202,15 +278,7 @@ class MultiFileProject:
         if not self.master_path:
             raise ValueError("No master path specified")
         
-        with open(self.master_path, 'w') as f:
-            yaml.dump(
-                self.master.to_dict(),
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-                indent=2,
-            )
+        self._master_digest = _dump(self.master, self.master_path)
 
     def save_module(self, module_name: str) -> None:
         """Save a specific module file."""
@@ -218,23 +286,47 @@ class MultiFileProject:
             raise ValueError(f"Unknown module: {module_name}")
         
         module_path = self.module_paths[module_name]
-        module = self.modules[str(module_path)]
+        module = self.modules[module_path]
+        if module is None:
+            # never parsed, so the file is already up to date
+            return
         
-        with open(module_path, 'w') as f:
-            yaml.dump(
-                module.to_dict(),
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-                indent=2,
-            )
+        self._file_digests[module_path] = _dump(module, module_path)
 
     def save_all(self) -> None:
-        """Save master and all modules."""
-        self.save_master()
-        for module_name in self.module_paths:
-            self.save_module(module_name)
+        """Save the master and all modules.
+
+        Files whose content would not change (same bytes as last read or
+        written) are skipped, and modules never parsed are left alone.
+        Every file is written to a temp file first and only then moved
+        into place, so an error part-way leaves all files as they were.
+        """
+        if not self.master_path:
+            raise ValueError("No master path specified")
+        pending = [(self.master, self.master_path)]
+        for module_path in self.module_paths.values():
+            module = self.modules[module_path]
+            if module is not None:
+                pending.append((module, module_path))
+
+        staged = []
+        try:
+            for data, path in pending:
+                content = _encode(data)
+                digest = _digest(content)
+                known = self._master_digest if data is self.master else self._file_digests.get(path)
+                if digest != known:
+                    staged.append((_write_temp(content, path), path, digest))
+        except BaseException:
+            for tmp, _, _ in staged:
+                tmp.unlink(missing_ok=True)
+            raise
+        for tmp, path, digest in staged:
+            os.replace(tmp, path)
+            if path == self.master_path:
+                self._master_digest = digest
+            else:
+                self._file_digests[path] = digest
 
     def add_module(self, module: Module, relative_path: str) -> None:
         """Add a new module to the project."""
@@ -251,38 +343,40 @@ class MultiFileProject:
         
         # Calculate absolute path and store
         abs_path = (self.master_path.parent / relative_path).resolve()
-        self.modules[str(abs_path)] = module
+        self.modules[abs_path] = module
         self.module_paths[module.name] = abs_path
+        self._modules_by_name[module.name] = module
+        self._merge_module(abs_path, module)
         
         # Save the module file
         abs_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(abs_path, 'w') as f:
-            yaml.dump(
-                module.to_dict(),
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-                indent=2,
-            )
+        self._file_digests[abs_path] = _dump(module, abs_path)
         
-        self._merged = None
+        self._uid_index = None
 
     def remove_module(self, module_name: str, delete_file: bool = False) -> None:
         """Remove a module from the project."""
         # Remove from master references
-        self.master.modules = [m for m in self.master.modules if m.name != module_name]
+        # in place, so holders of the list see the removal
+        refs = self.master.modules
+        for i in reversed(range(len(refs))):
+            if refs[i].name == module_name:
+                del refs[i]
         
         # Remove from loaded modules
         if module_name in self.module_paths:
             path = self.module_paths[module_name]
-            del self.modules[str(path)]
+            self._unmerge_module(path)
+            self._file_digests.pop(path, None)
+            del self.modules[path]
+            self._unloaded.pop(path, None)
             del self.module_paths[module_name]
+            self._modules_by_name.pop(module_name, None)
             
             if delete_file and path.exists():
                 path.unlink()
         
-        self._merged = None
+        self._uid_index = None
 
     def get_merged_project(self) -> Project:
         """
@@ -290,64 +384,136 @@ class MultiFileProject:
         
         This creates a unified view where all elements from all modules
         are combined. UIDs remain unique across modules.
+
+        The result is kept and patched in place as modules are added,
+        reloaded or removed; only load_master and invalidate_cache force
+        a full rebuild.
         """
         if self._merged is not None:
             return self._merged
         
+        self._ensure_all_loaded()
         merged = Project(
             name=self.master.name,
             description=self.master.description,
         )
         
-        # Merge all modules
-        for module in self.modules.values():
-            merged.compu_methods.extend(module.compu_methods)
-            merged.application_data_types.extend(module.application_data_types)
-            merged.implementation_data_types.extend(module.implementation_data_types)
-            merged.data_type_mappings.extend(module.data_type_mappings)
-            merged.interfaces.extend(module.interfaces)
-            merged.components.extend(module.components)
-            merged.connections.extend(module.connections)
-        
-        # Add global connections from master
-        merged.connections.extend(self.master.global_connections)
+        # Merge all modules, one list at a time, remembering where each
+        # module's elements landed
+        slices = {path: {} for path in self.modules}
+        for list_name in _MERGED_LISTS:
+            parts = [getattr(module, list_name) for module in self.modules.values()]
+            start = 0
+            for path, part in zip(slices, parts):
+                slices[path][list_name] = (start, start + len(part))
+                start += len(part)
+            if list_name == "connections":
+                # Add global connections from master
+                parts.append(self.master.global_connections)
+            setattr(merged, list_name, list(chain.from_iterable(parts)))
+        merged.rebuild_indexes()
         
         self._merged = merged
+        self._module_slices = slices
         return merged
 
+    def _modules_end(self, list_name: str) -> int:
+        """Index in the merged list just past the last module's elements."""
+        last = next(reversed(self._module_slices.values()), None)
+        return last[list_name][1] if last else 0
+
+    def _merged_in_sync(self) -> bool:
+        """False if the merged lists were edited behind the slice bookkeeping."""
+        merged = self._merged
+        for list_name in _MERGED_LISTS:
+            expected = self._modules_end(list_name)
+            if list_name == "connections":
+                expected += len(self.master.global_connections)
+            if len(getattr(merged, list_name)) != expected:
+                return False
+        return True
+
+    def _shift_slices_after(self, path: Path, deltas: dict[str, int]) -> None:
+        after = False
+        for other_path, module_slices in self._module_slices.items():
+            if after:
+                for list_name, delta in deltas.items():
+                    start, stop = module_slices[list_name]
+                    module_slices[list_name] = (start + delta, stop + delta)
+            elif other_path == path:
+                after = True
+
+    def _merge_module(self, path: Path, module: Module) -> None:
+        """Add module to the merged project, replacing its old elements if any."""
+        if self._merged is None:
+            return
+        if not self._merged_in_sync():
+            self._merged = None
+            return
+        old = self._module_slices.get(path)
+        new_slices = {}
+        deltas = {}
+        for list_name in _MERGED_LISTS:
+            if old is not None:
+                start, stop = old[list_name]
+            else:
+                start = stop = self._modules_end(list_name)
+            items = getattr(module, list_name)
+            self._merged.splice_elements(list_name, start, stop, items)
+            new_slices[list_name] = (start, start + len(items))
+            deltas[list_name] = len(items) - (stop - start)
+        if old is not None:
+            self._shift_slices_after(path, deltas)
+        self._module_slices[path] = new_slices
+
+    def _unmerge_module(self, path: Path) -> None:
+        """Drop a module's elements from the merged project."""
+        if self._merged is None or path not in self._module_slices:
+            return
+        if not self._merged_in_sync():
+            self._merged = None
+            return
+        old = self._module_slices[path]
+        for list_name in _MERGED_LISTS:
+            start, stop = old[list_name]
+            self._merged.splice_elements(list_name, start, stop, ())
+        self._shift_slices_after(path, {n: start - stop for n, (start, stop) in old.items()})
+        del self._module_slices[path]
+
     def find_element_module(self, uid: str) -> Optional[str]:
         """Find which module contains an element by UID."""
-        for module_path, module in self.modules.items():
-            # Check all element lists
-            for cm in module.compu_methods:
-                if cm.uid == uid:
-                    return module.name
-            for adt in module.application_data_types:
-                if adt.uid == uid:
-                    return module.name
-            for idt in module.implementation_data_types:
-                if idt.uid == uid:
-                    return module.name
-            for iface in module.interfaces:
-                if iface.uid == uid:
-                    return module.name
+        if self._uid_index is None:
+            self._uid_index = self._build_uid_index()
+        return self._uid_index.get(uid)
+
+    def _build_uid_index(self) -> dict[str, str]:
+        self._ensure_all_loaded()
+        index: dict[str, str] = {}
+        for module in self.modules.values():
+            name = module.name
+            for elements in (module.compu_methods, module.application_data_types,
+                             module.implementation_data_types, module.interfaces,
+                             module.components):
+                for elem in elements:
+                    # Earlier modules win, as with the old first-match scan
+                    index.setdefault(elem.uid, name)
             for swc in module.components:
-                if swc.uid == uid:
-                    return module.name
                 for port in swc.ports:
-                    if port.uid == uid:
-                        return module.name
-        return None
+                    index.setdefault(port.uid, name)
+        return index
 
     def get_module_by_name(self, name: str) -> Optional[Module]:
         """Get a module by its name."""
-        if name in self.module_paths:
-            return self.modules[str(self.module_paths[name])]
-        return None
+        module = self._modules_by_name.get(name)
+        if module is None and name in self.module_paths:
+            # not parsed yet (or renamed by a reload)
+            module = self._ensure_loaded(self.module_paths[name])
+        return module
 
     def invalidate_cache(self):
         """Invalidate the merged project cache after changes."""
         self._merged = None
+        self._uid_index = None
 
 
 def create_example_multifile_project(base_dir: Path) -> MultiFileProject:
@@ -511,7 +677,7 @@ def create_example_multifile_project(base_dir: Path) -> MultiFileProject:
     
     for module, rel_path in modules:
         abs_path = (base_dir / rel_path).resolve()
-        project.modules[str(abs_path)] = module
+        project.modules[abs_path] = module
         project.module_paths[module.name] = abs_path
         project.master.modules.append(
             ModuleReference(path=rel_path, name=module.name, description=module.description)
@@ -531,24 +697,7 @@ def save_multifile_project(project: MultiFileProject) -> None:
     # Save all modules
     for module_name, module_path in project.module_paths.items():
         module_path.parent.mkdir(parents=True, exist_ok=True)
-        module = project.modules[str(module_path)]
-        with open(module_path, 'w') as f:
-            yaml.dump(
-                module.to_dict(),
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-                indent=2,
-            )
+        project.save_module(module_name)
     
     # Save master
-    with open(project.master_path, 'w') as f:
-        yaml.dump(
-            project.master.to_dict(),
-            f,
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-            indent=2,
-        )
+    project.save_master()
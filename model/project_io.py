@@ -1,33 +1,217 @@
 """
 YAML-based project persistence.
+
+Files with a .json suffix are stored as JSON instead. They are read
+through orjson when it is installed, but always written with the json
+module: orjson writes infinite and NaN floats (e.g. an unbounded
+max_value) as null, which would lose them.
 """
-import yaml
+import functools
+import hashlib
+import json
+import os
+import time
 from pathlib import Path
 from .elements import Project
 
+try:
+    import orjson
+except ImportError:  # optional speedup for reading .json projects
+    orjson = None
+
+def _is_json(filepath) -> bool:
+    return Path(filepath).suffix.lower() == ".json"
+
+
+def _json_bytes(data: dict, indent: bool) -> bytes:
+    # Not orjson: see the module docstring
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Infinity/NaN, which orjson rejects; json reads them
+    return json.loads(data)
+
+
+def _write_atomic(filepath: Path, data: bytes) -> None:
+    """Write data to filepath in one write to a temp file and a rename."""
+    filepath = Path(filepath)
+    tmp = filepath.with_name(filepath.name + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filepath)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _save_json(data: dict, filepath: Path) -> None:
+    _write_atomic(filepath, _json_bytes(data, indent=True))
+
+
+def project_to_json_bytes(project: Project) -> bytes:
+    """Compact JSON encoding of a project, e.g. for in-memory snapshots."""
+    return _json_bytes(project.to_dict(), indent=False)
+
+
+def project_from_json_bytes(data: bytes) -> Project:
+    """Inverse of project_to_json_bytes()."""
+    return Project.from_dict(_json_loads(data))
+
+
+# Bounds on the parsed-project cache, so entries for projects that were
+# moved or deleted do not pile up: entries unused for _CACHE_MAX_AGE seconds
+# are dropped, and only the _CACHE_MAX_ENTRIES most recently used are kept
+_CACHE_MAX_ENTRIES = 64
+_CACHE_MAX_AGE = 30 * 24 * 3600
+
+
+def _cache_dir() -> Path:
+    """Per-user directory for parsed-project caches."""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'autosar-designer' / 'parsed'
+
+
+def _cache_path(filepath: Path) -> Path:
+    """JSON cache of a YAML project's parsed data, named after its resolved path."""
+    key = hashlib.blake2b(str(filepath).encode('utf-8'), digest_size=16).hexdigest()
+    return _cache_dir() / (key + '.json')
+
+
+def _load_yaml_data(filepath: Path, stamp: list) -> dict:
+    """Parsed YAML project data, from the user cache while it is current."""
+    cache = _cache_path(filepath)
+    try:
+        cached = _json_loads(cache.read_bytes())
+        if cached["source"] == stamp:
+            os.utime(cache)  # mtime records last use, for _prune_cache
+            return cached["project"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass  # missing, unreadable or stale: parse the YAML
+
+    # One buffer straight to libyaml, which detects and decodes UTF-8/16
+    # itself and parses it without calling back into Python for input
+    from ._yaml_support import load_yaml
+    data = load_yaml(filepath.read_bytes())
+
+    # The cache is only an optimization; never fail a load over it
+    tmp = cache.with_name(cache.name + '.tmp')
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(_json_bytes({"source": stamp, "project": data}, indent=False))
+        os.replace(tmp, cache)
+        _prune_cache(cache.parent)
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return data
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Delete cache entries beyond the age and count bounds, least recently used first."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        try:
+            entries.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            pass  # removed meanwhile, e.g. by another instance
+    entries.sort(reverse=True)
+    cutoff = time.time() - _CACHE_MAX_AGE
+    for i, (mtime, path) in enumerate(entries):
+        if i >= _CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_project_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parsed project data; the stat fields in the key retire entries for edited files.
+
+    Callers must not mutate the result: from_dict() builds fresh objects
+    from it, so it can be shared.
+    """
+    filepath = Path(path)
+    if _is_json(filepath):
+        return _json_loads(filepath.read_bytes())
+    return _load_yaml_data(filepath, [path, mtime_ns, size])
+
+
+def _forget_file(filepath: Path) -> None:
+    """Drop cached parses of a project file that is being rewritten."""
+    _parse_project_file.cache_clear()
+    try:
+        _cache_path(Path(filepath).resolve()).unlink(missing_ok=True)
+    except OSError:
+        pass
+
 
 def save_project(project: Project, filepath: Path) -> None:
-    """Save project to YAML file."""
-    with open(filepath, 'w') as f:
-        yaml.dump(
-            project.to_dict(),
-            f,
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-            indent=2,
-        )
+    """Save project to YAML file (or JSON for a .json path)."""
+    _forget_file(filepath)
+    if _is_json(filepath):
+        _save_json(project.to_dict(), filepath)
+        return
+    from ._yaml_support import dump_yaml
+    _write_atomic(filepath, dump_yaml(project, encoding='utf-8'))
+
+
+def save_project_dict(data: dict, filepath: Path) -> None:
+    """Save a project's to_dict() snapshot to YAML file (or JSON for a .json path)."""
+    _forget_file(filepath)
+    if _is_json(filepath):
+        _save_json(data, filepath)
+        return
+    from ._yaml_support import dump_yaml
+    _write_atomic(filepath, dump_yaml(data, encoding='utf-8'))
 
 
 def load_project(filepath: Path) -> Project:
-    """Load project from YAML file."""
-    with open(filepath, 'r') as f:
-        data = yaml.safe_load(f)
-    return Project.from_dict(data)
+    """Load project from YAML file (or JSON for a .json path).
+
+    Parsed YAML is cached as JSON in the per-user cache directory and
+    reused until the YAML file's mtime or size changes; recent parses are
+    also kept in memory (load_project.cache_clear() empties that cache).
+    """
+    filepath = Path(filepath).resolve()
+    st = filepath.stat()
+    return Project.from_dict(_parse_project_file(str(filepath), st.st_mtime_ns, st.st_size))
+
+
+load_project.cache_clear = _parse_project_file.cache_clear
 
 
 def create_example_project() -> Project:
-    """Create an example project for testing with full AUTOSAR-style data types."""
+    """Create an example project for testing with full AUTOSAR-style data types.
+
+    The example is built once per process and decoded from a JSON
+    snapshot on each call, so every call still gets fresh objects (the
+    uids are the same from call to call).
+    """
+    return project_from_json_bytes(_example_project_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def _example_project_bytes() -> bytes:
+    return project_to_json_bytes(_build_example_project())
+
+
+def _build_example_project() -> Project:
     from .elements import (
         Interface, InterfaceType, DataElement, BaseDataType,
         Operation, OperationArgument, ArgumentDirection,
@@ -89,12 +273,12 @@ def create_example_project() -> Project:
     adt_diag_status = ApplicationDataType(
         name="DiagStatus_T",
         category=AppDataCategory.ENUM,
-        enum_literals=[
+        enum_literals=(
             ("DIAG_OK", 0),
             ("DIAG_PENDING", 1),
             ("DIAG_NOT_SUPPORTED", 2),
             ("DIAG_ERROR", 3),
-        ],
+        ),
         init_value="0",
         description="Diagnostic operation status",
     )
@@ -0,0 +1,73 @@
+"""Tests for project lookups that must follow in-place edits."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.elements import Port, PortDirection, Project, SoftwareComponent
+
+
+class CompatiblePortsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.project = Project(name="Ports")
+        self.provider = Port(name="Out", direction=PortDirection.PROVIDED, interface_uid="if_a")
+        self.project.components.append(SoftwareComponent(name="Sender", ports=[self.provider]))
+        self.receiver = SoftwareComponent(name="Receiver")
+        self.project.components.append(self.receiver)
+
+    def _compatible(self):
+        return [port.name for _swc, port in self.project.iter_compatible_ports(self.provider)]
+
+    def test_added_port_is_found(self):
+        self.assertEqual(self._compatible(), [])
+        self.receiver.add_port(Port(name="In", interface_uid="if_a"))
+        self.assertEqual(self._compatible(), ["In"])
+
+    def test_port_edited_in_place(self):
+        port = Port(name="In", interface_uid="if_b")
+        self.receiver.ports.append(port)
+        self.assertEqual(self._compatible(), [])
+
+        port.interface_uid = "if_a"
+        self.assertEqual(self._compatible(), ["In"])
+
+        port.direction = PortDirection.PROVIDED
+        self.assertEqual(self._compatible(), [])
+
+
+class UidLookupTest(unittest.TestCase):
+
+    def test_list_item_replaced_directly(self):
+        project = Project(name="Lookup")
+        a, b = SoftwareComponent(name="A"), SoftwareComponent(name="B")
+        project.add_component(a)
+        project.components[0] = b
+
+        self.assertIs(project.get_component_by_uid(b.uid), b)
+        self.assertIsNone(project.get_component_by_uid(a.uid))
+
+    def test_missing_uid_then_added(self):
+        project = Project(name="Lookup")
+        swc = SoftwareComponent(name="A")
+        self.assertIsNone(project.get_component_by_uid(swc.uid))
+        self.assertIsNone(project.get_component_by_uid(None))
+
+        project.components.append(swc)
+        self.assertIs(project.get_component_by_uid(swc.uid), swc)
+
+    def test_lookups_after_removal(self):
+        project = Project(name="Lookup")
+        comps = [SoftwareComponent(name=name) for name in "ABC"]
+        for swc in comps:
+            project.add_component(swc)
+        project.remove_component(comps[0])
+
+        self.assertIsNone(project.get_component_by_uid(comps[0].uid))
+        self.assertIs(project.get_component_by_uid(comps[2].uid), comps[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for saving multi-file projects."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.multifile import (
+    MultiFileProject,
+    create_example_multifile_project,
+    save_multifile_project,
+)
+
+
+class SaveAllTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _load(self, master_path: Path) -> MultiFileProject:
+        project = MultiFileProject()
+        project.load_master(master_path)
+        return project
+
+    def test_save_all_writes_new_project(self):
+        project = create_example_multifile_project(self.base_dir)
+        project.save_all()
+
+        self.assertTrue(project.master_path.exists())
+        for path in project.module_paths.values():
+            self.assertTrue(path.exists(), path)
+
+    def test_edit_via_merged_project_is_saved(self):
+        project = create_example_multifile_project(self.base_dir)
+        save_multifile_project(project)
+
+        project = self._load(project.master_path)
+        merged = project.get_merged_project()
+        swc = merged.components[0]
+        swc.description = "edited through the merged project"
+        module_name = project.find_element_module(swc.uid)
+        project.save_all()
+
+        reloaded = self._load(project.master_path)
+        self.assertEqual(
+            reloaded.get_merged_project().get_component_by_uid(swc.uid).description,
+            "edited through the merged project",
+        )
+        self.assertIn(module_name, reloaded.module_paths)
+
+    def test_unchanged_files_are_not_rewritten(self):
+        project = create_example_multifile_project(self.base_dir)
+        save_multifile_project(project)
+
+        project = self._load(project.master_path)
+        merged = project.get_merged_project()
+        swc = merged.components[0]
+        paths = [project.master_path, *project.module_paths.values()]
+        for path in paths:
+            # back-date so a rewrite shows even with coarse mtimes
+            os.utime(path, ns=(0, 0))
+        before = {path: os.stat(path).st_mtime_ns for path in paths}
+        edited = project.module_paths[project.find_element_module(swc.uid)]
+
+        project.save_all()
+        self.assertEqual(before, {path: os.stat(path).st_mtime_ns for path in paths})
+
+        swc.description = "changed"
+        project.save_all()
+        changed = [path for path in paths if os.stat(path).st_mtime_ns != before[path]]
+        self.assertEqual(changed, [edited])
+
+
+if __name__ == "__main__":
+    unittest.main()
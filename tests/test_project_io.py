@@ -0,0 +1,91 @@
+"""Tests for single-file project persistence."""
+
+import math
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model import project_io
+from model.project_io import (
+    create_example_project,
+    load_project,
+    project_from_json_bytes,
+    project_to_json_bytes,
+    save_project,
+)
+
+
+def _unbounded_project():
+    project = create_example_project()
+    app_type = project.application_data_types[0]
+    app_type.min_value = -math.inf
+    app_type.max_value = math.inf
+    return project
+
+
+class NonFiniteFloatTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def assertUnbounded(self, project):
+        app_type = project.application_data_types[0]
+        self.assertEqual((app_type.min_value, app_type.max_value), (-math.inf, math.inf))
+
+    def test_json_file_keeps_infinite_limits(self):
+        path = self.base_dir / "unbounded.json"
+        save_project(_unbounded_project(), path)
+        self.assertUnbounded(load_project(path))
+
+    def test_json_bytes_keep_infinite_limits(self):
+        self.assertUnbounded(project_from_json_bytes(project_to_json_bytes(_unbounded_project())))
+
+
+class ParsedYamlCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+        cache_home = str(self.base_dir / "cache")
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home, "LOCALAPPDATA": cache_home})
+        env.start()
+        self.addCleanup(env.stop)
+        load_project.cache_clear()
+
+    def tearDown(self):
+        load_project.cache_clear()
+        self._tmp.cleanup()
+
+    def test_warm_cache_loads_same_data(self):
+        path = self.base_dir / "unbounded.yaml"
+        save_project(_unbounded_project(), path)
+        cold = load_project(path)
+        load_project.cache_clear()
+        warm = load_project(path)
+
+        self.assertTrue(project_io._cache_path(path.resolve()).exists())
+        self.assertEqual(list(self.base_dir.glob("*.json")), [])
+        for project in (cold, warm):
+            app_type = project.application_data_types[0]
+            self.assertEqual((app_type.min_value, app_type.max_value), (-math.inf, math.inf))
+
+    def test_cache_is_bounded(self):
+        project = create_example_project()
+        with mock.patch.object(project_io, "_CACHE_MAX_ENTRIES", 2):
+            for i in range(4):
+                save_project(project, self.base_dir / f"p{i}.yaml")
+                load_project(self.base_dir / f"p{i}.yaml")
+        self.assertEqual(len(list(project_io._cache_dir().iterdir())), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()